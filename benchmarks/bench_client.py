@@ -0,0 +1,248 @@
+# ======================================================================================
+# Script:  bench_client.py
+# Purpose: benchmark reproducible de PDEXClient contra el servidor stub local (sin
+#          credenciales ni red): throughput, p50/p99, pico de memoria y tiempo de DataFrame
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""
+Uso
+---
+    python benchmarks/bench_client.py                       # configuración por defecto
+    python benchmarks/bench_client.py --latency 0.02 --jitter 0.01 --error-rate 0.02
+    python benchmarks/bench_client.py --quick --no-record   # humo (segundos)
+
+Escenarios (cada uno en un proceso nuevo, para que `ru_maxrss` sea solo del cliente;
+el stub corre en el proceso padre):
+
+• serial      : `--calls` consultas `fc_clima_diario` una tras otra (`--rows` filas c/u).
+• concurrent  : las mismas consultas en `--workers` hilos sobre un solo cliente.
+• bulk        : una consulta grande `clima_historico_nacional` (`--big-rows` filas) como
+                DataFrame.
+• streaming   : la misma consulta con `stream=True` en lotes de `--chunk-rows`.
+
+Cada corrida se anexa a `benchmarks/results/bench_client.jsonl` (commit, versiones,
+configuración y resultados) y se compara contra la última corrida con la misma
+configuración.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, "benchmarks", "results", "bench_client.jsonl")
+SCENARIOS = ("serial", "concurrent", "bulk", "streaming")
+
+# Métricas comparadas entre corridas y si "más alto es mejor"
+TRACKED = {"req_s": True, "rows_s": True, "p50_ms": False, "p99_ms": False,
+           "peak_rss_mb": False, "frame_s": False, "wire_mb": False}
+
+
+# --------------------------------------------------------------------------------------
+# Escenarios (proceso hijo)
+# --------------------------------------------------------------------------------------
+def _window(days: int) -> dict:
+    fin = date(2024, 12, 31)
+    return {"fecha_inicio": (fin - timedelta(days=days - 1)).isoformat(), "fecha_fin": fin.isoformat()}
+
+
+def _pct(values: list, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))]
+
+
+def run_scenario(name: str, base_url: str, cfg: dict) -> dict:
+    sys.path.insert(0, ROOT)
+    from pdexapi import PDEXClient, RetryPolicy
+
+    cli = PDEXClient(
+        base_url, "demo", "demo",
+        columnar=cfg["columnar"],
+        compression=cfg.get("compression", True),
+        wire_format=cfg.get("wire_format", "json"),
+        retry=RetryPolicy(retries=5, backoff=0.01, max_backoff=0.2),
+        pool_maxsize=max(cfg["workers"], 10),
+    )
+    latencies: list = []
+    rows = 0
+    errors = 0
+
+    def one(i: int) -> int:
+        t0 = time.perf_counter()
+        df = cli.fc_clima_diario(
+            estado="Jalisco", ciudad=f"Ciudad {i}", variable="maxtemp_c",
+            **_window(cfg["rows"]), as_frame=True,
+        )
+        latencies.append(time.perf_counter() - t0)
+        return len(df)
+
+    start = time.perf_counter()
+    if name in ("serial", "concurrent"):
+        workers = 1 if name == "serial" else cfg["workers"]
+        with ThreadPoolExecutor(workers) as pool:
+            futures = [pool.submit(one, i) for i in range(cfg["calls"])]
+            for f in futures:
+                try:
+                    rows += f.result()
+                except Exception:
+                    errors += 1
+    else:
+        t0 = time.perf_counter()
+        kwargs = dict(variable="maxtemp_c", as_frame=True, **_window(cfg["big_days"]))
+        if name == "streaming":
+            chunks = cli.clima_historico_nacional(
+                **kwargs, stream=True, chunk_rows=cfg["chunk_rows"]
+            )
+            for chunk in chunks:
+                rows += len(chunk)
+        else:
+            rows = len(cli.clima_historico_nacional(**kwargs))
+        latencies.append(time.perf_counter() - t0)
+    wall = time.perf_counter() - start
+
+    ep = cli.stats()["endpoints"]
+    frame_s = sum(e.get("frame", {}).get("total", 0.0) for e in ep.values())
+    cli.close()
+    calls = len(latencies) + errors
+    return {
+        "calls": calls,
+        "errors": errors,
+        "rows": rows,
+        "wall_s": round(wall, 4),
+        "req_s": round(calls / wall, 2),
+        "rows_s": round(rows / wall, 1),
+        "p50_ms": round(_pct(latencies, 0.50) * 1e3, 2) if latencies else None,
+        "p99_ms": round(_pct(latencies, 0.99) * 1e3, 2) if latencies else None,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "frame_s": round(frame_s, 4),
+        "wire_mb": round(sum(e["wire_bytes"] for e in ep.values()) / 1024**2, 2),
+    }
+
+
+# --------------------------------------------------------------------------------------
+# Registro y comparación
+# --------------------------------------------------------------------------------------
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _previous(config: dict) -> dict | None:
+    if not os.path.exists(RESULTS):
+        return None
+    last = None
+    with open(RESULTS) as fh:
+        for line in fh:
+            rec = json.loads(line)
+            if rec.get("config") == config:
+                last = rec
+    return last
+
+
+def _delta(now: float | None, before: float | None, higher_is_better: bool) -> str:
+    if now is None or not before:
+        return ""
+    change = (now - before) / before * 100
+    worse = change < 0 if higher_is_better else change > 0
+    return f" ({change:+.0f}%{' ⚠' if worse and abs(change) > 10 else ''})"
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--calls", type=int, default=200)
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--rows", type=int, default=365, help="filas por consulta (serial/concurrent)")
+    ap.add_argument("--big-rows", type=int, default=500_000, help="filas de la consulta grande")
+    ap.add_argument("--chunk-rows", type=int, default=50_000)
+    ap.add_argument("--latency", type=float, default=0.0, help="latencia inyectada por GET (s)")
+    ap.add_argument("--jitter", type=float, default=0.0, help="jitter uniforme adicional (s)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="fracción de GETs con 503")
+    ap.add_argument("--columnar", action="store_true")
+    ap.add_argument("--wire-format", choices=("json", "auto", "arrow", "msgpack"), default="json")
+    ap.add_argument("--no-compression", action="store_true", help="pedir respuestas sin comprimir")
+    ap.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    ap.add_argument("--quick", action="store_true", help="tamaños mínimos (prueba de humo)")
+    ap.add_argument("--no-record", action="store_true", help="no anexar a results/")
+    ap.add_argument("--run", nargs=3, metavar=("ESCENARIO", "URL", "CFG"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.run:
+        name, url, cfg = args.run
+        print(json.dumps(run_scenario(name, url, json.loads(cfg))))
+        return
+
+    if args.quick:
+        args.calls, args.rows, args.big_rows, args.chunk_rows = 20, 30, 5_000, 1_000
+    big_days = 365
+    config = {
+        "calls": args.calls, "workers": args.workers, "rows": args.rows,
+        "big_days": big_days, "fanout": math.ceil(args.big_rows / big_days),
+        "chunk_rows": args.chunk_rows, "latency": args.latency, "jitter": args.jitter,
+        "error_rate": args.error_rate, "columnar": args.columnar,
+    }
+    # solo si difieren del valor por defecto, para comparar con corridas anteriores
+    if args.wire_format != "json":
+        config["wire_format"] = args.wire_format
+    if args.no_compression:
+        config["compression"] = False
+
+    sys.path.insert(0, os.path.join(ROOT, "tests"))
+    from stub_server import StubPDEXAPI
+
+    results = {}
+    with StubPDEXAPI() as stub:
+        stub.inject(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+        for name in args.scenarios:
+            # solo la consulta grande usa ciudades sintéticas (fan-out)
+            stub.fanout = config["fanout"] if name in ("bulk", "streaming") else 1
+            out = subprocess.run(
+                [sys.executable, __file__, "--run", name, stub.base_url, json.dumps(config)],
+                check=True, capture_output=True, text=True,
+            )
+            results[name] = json.loads(out.stdout.strip().splitlines()[-1])
+
+    import pandas as pd
+
+    record = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": f"{platform.system()}-{platform.machine()}",
+        "config": config,
+        "results": results,
+    }
+    previous = _previous(config)
+
+    print(f"commit {record['commit']} | python {record['python']} | pandas {record['pandas']}")
+    for name, r in results.items():
+        before = (previous or {}).get("results", {}).get(name, {})
+        cells = [
+            f"{k} {r[k]}{_delta(r[k], before.get(k), up)}" for k, up in TRACKED.items() if k in r
+        ]
+        print(f"{name:>11}: {r['calls']} llamadas, {r['rows']:,} filas, {r['errors']} errores | "
+              + " | ".join(cells))
+    if previous:
+        print(f"(comparado con {previous['ts']}, commit {previous['commit']})")
+
+    if not args.no_record:
+        os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+        with open(RESULTS, "a") as fh:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# ======================================================================================
+# Script:  bench_decode.py
+# Purpose: compara el camino actual (lista de dicts → DataFrame) contra la decodificación
+#          columnar de PDExAPI_Frames en tiempo y pico de memoria (RSS)
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""
+Uso
+---
+    python benchmarks/bench_decode.py --rows 1000000
+
+Cada variante corre en un proceso nuevo para que `ru_maxrss` refleje solo su pico
+(incluye intérprete, pandas y el cuerpo crudo, comunes a todas las variantes).
+El payload imita `copernicus_historical(nivel='ciudad', estado=None, freq='D')`.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_body(n_rows: int) -> bytes:
+    parts = []
+    for i in range(n_rows):
+        parts.append(
+            '{"fecha":"2025-%02d-%02d","estado":"Estado %d","ciudad":"Ciudad %d",'
+            '"variable":"maxtemp_c","valor":%.3f}'
+            % (i % 12 + 1, i % 28 + 1, i % 32, i % 300, 20.0 + (i % 97) / 7)
+        )
+    return ("[" + ",".join(parts) + "]").encode()
+
+
+def run_variant(mode: str, path: str) -> None:
+    sys.path.insert(0, ROOT)
+    import pandas as pd
+    from pdexapi.PDExAPI_Frames import frame_from_json, frame_from_records
+
+    with open(path, "rb") as fh:
+        body = fh.read()
+    t0 = time.perf_counter()
+    if mode == "actual":
+        df = pd.DataFrame(json.loads(body))
+    elif mode == "actual+tipos":
+        df = frame_from_records(json.loads(body))
+    else:
+        df = frame_from_json(body)
+    dt = time.perf_counter() - t0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KB → MB (Linux)
+    mem = df.memory_usage(deep=True).sum() / 1024**2
+    print(json.dumps({"modo": mode, "seg": round(dt, 3), "pico_rss_mb": round(rss, 1), "frame_mb": round(mem, 1)}))
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=1_000_000)
+    ap.add_argument("--run", nargs=2, metavar=("MODO", "ARCHIVO"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.run:
+        run_variant(*args.run)
+        return
+
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as fh:
+        fh.write(make_body(args.rows))
+        path = fh.name
+    try:
+        print(f"payload: {args.rows:,} filas, {os.path.getsize(path) / 1024**2:.1f} MB")
+        for mode in ("actual", "actual+tipos", "columnar"):
+            out = subprocess.run(
+                [sys.executable, __file__, "--run", mode, path],
+                check=True, capture_output=True, text=True,
+            )
+            r = json.loads(out.stdout)
+            print(f"{r['modo']:>13}: {r['seg']:7.3f} s | pico RSS {r['pico_rss_mb']:8.1f} MB | frame {r['frame_mb']:7.1f} MB")
+    finally:
+        os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# ======================================================================================
+# Script:  bench_startup.py
+# Purpose: benchmark de arranque en frío de pdexapi: tiempo de importación, creación del
+#          cliente y primera respuesta en un intérprete nuevo (CLI / serverless)
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""
+Uso
+---
+    python benchmarks/bench_startup.py                      # 15 repeticiones
+    python benchmarks/bench_startup.py --latency 0.05       # simula un RTT de 50 ms
+    python benchmarks/bench_startup.py --quick --no-record  # humo
+
+Escenarios (cada repetición en un intérprete nuevo; el stub corre en el proceso padre):
+
+• import       : `import pdexapi`.
+• client       : importar y crear `PDEXClient` (sin red: login diferido).
+• eager        : crear `PDEXClient(eager_auth=True)` (login en el constructor).
+• first_call   : crear el cliente y obtener `list_tables()` (login + GET, sin pandas).
+• first_frame  : crear el cliente y obtener `dias_festivos(as_frame=True)`.
+
+Por escenario se reporta la mediana de `wall_ms` (proceso completo, incluye el arranque
+del intérprete), `import_ms` (`from pdexapi import PDEXClient`), `ready_ms` (hasta tener
+el cliente) y `total_ms` (hasta el resultado), y qué dependencias pesadas quedaron
+cargadas. Cada corrida se anexa a `benchmarks/results/bench_startup.jsonl` y se compara
+contra la última con la misma configuración.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS = os.path.join(ROOT, "benchmarks", "results", "bench_startup.jsonl")
+SCENARIOS = ("import", "client", "eager", "first_call", "first_frame")
+HEAVY = ("numpy", "pandas", "requests", "urllib3", "pyarrow")
+
+# Métricas comparadas entre corridas (todas: más bajo es mejor)
+TRACKED = ("wall_ms", "import_ms", "ready_ms", "total_ms")
+
+
+# --------------------------------------------------------------------------------------
+# Escenario (proceso hijo)
+# --------------------------------------------------------------------------------------
+def run_scenario(name: str, base_url: str) -> dict:
+    start = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    from pdexapi import PDEXClient
+
+    imported = time.perf_counter()
+    if name != "import":
+        cli = PDEXClient(base_url, "demo", "demo", eager_auth=name == "eager")
+    ready = time.perf_counter()
+    if name == "first_call":
+        cli.list_tables()
+    elif name == "first_frame":
+        cli.dias_festivos(as_frame=True)
+    done = time.perf_counter()
+    return {
+        "import_ms": (imported - start) * 1e3,
+        "ready_ms": (ready - start) * 1e3,
+        "total_ms": (done - start) * 1e3,
+        "loaded": [m for m in HEAVY if m in sys.modules],
+    }
+
+
+# --------------------------------------------------------------------------------------
+# Orquestación (proceso padre)
+# --------------------------------------------------------------------------------------
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(["git", "-C", ROOT, "rev-parse", "--short", "HEAD"],
+                             capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _previous(config: dict) -> dict | None:
+    if not os.path.exists(RESULTS):
+        return None
+    last = None
+    with open(RESULTS) as fh:
+        for line in fh:
+            rec = json.loads(line)
+            if rec.get("config") == config:
+                last = rec
+    return last
+
+
+def _delta(now: float, before: float | None) -> str:
+    if not before:
+        return ""
+    return f" ({(now - before) / before:+.0%})"
+
+
+def measure(name: str, base_url: str, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = subprocess.run(
+            [sys.executable, __file__, "--run", name, base_url],
+            check=True, capture_output=True, text=True,
+        )
+        wall = (time.perf_counter() - t0) * 1e3
+        runs.append({**json.loads(out.stdout.strip().splitlines()[-1]), "wall_ms": wall})
+    result = {k: round(statistics.median(r[k] for r in runs), 1) for k in TRACKED}
+    result["loaded"] = runs[-1]["loaded"]
+    return result
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--repeat", type=int, default=15, help="intérpretes nuevos por escenario")
+    ap.add_argument("--latency", type=float, default=0.0, help="latencia inyectada por petición (s)")
+    ap.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    ap.add_argument("--quick", action="store_true", help="3 repeticiones (prueba de humo)")
+    ap.add_argument("--no-record", action="store_true", help="no anexar a results/")
+    ap.add_argument("--run", nargs=2, metavar=("ESCENARIO", "URL"), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.run:
+        print(json.dumps(run_scenario(*args.run)))
+        return
+
+    if args.quick:
+        args.repeat = 3
+    config = {"repeat": args.repeat, "latency": args.latency}
+
+    sys.path.insert(0, os.path.join(ROOT, "tests"))
+    from stub_server import StubPDEXAPI
+
+    results = {}
+    with StubPDEXAPI() as stub:
+        stub.inject(latency=args.latency)
+        for name in args.scenarios:
+            results[name] = measure(name, stub.base_url, args.repeat)
+
+    record = {
+        "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()}-{platform.machine()}",
+        "config": config,
+        "results": results,
+    }
+    previous = _previous(config)
+
+    print(f"commit {record['commit']} | python {record['python']} | mediana de {args.repeat}")
+    for name, r in results.items():
+        before = (previous or {}).get("results", {}).get(name, {})
+        cells = [f"{k} {r[k]}{_delta(r[k], before.get(k))}" for k in TRACKED]
+        print(f"{name:>11}: " + " | ".join(cells) + f" | cargados: {', '.join(r['loaded']) or '-'}")
+    if previous:
+        print(f"(comparado con {previous['ts']}, commit {previous['commit']})")
+
+    if not args.no_record:
+        os.makedirs(os.path.dirname(RESULTS), exist_ok=True)
+        with open(RESULTS, "a") as fh:
+            fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+# ======================================================================================
+# Script:  PDExAPI_Aggregate.py
+# Purpose: agregación local de series climáticas diarias por ciudad a mensual y a nivel
+#          estado/nacional, con las mismas definiciones que los endpoints agregados
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `aggregate(df, freq="M", nivel="estado", weights=pob)` reproduce en el cliente los
+  agregados del servidor (`clima_historico(mes=True)`, `clima_historico_estado_mes`,
+  `clima_historico_nacional`, `copernicus_historical(freq="M", nivel="estado")`) a partir
+  de datos diarios por ciudad ya descargados: una sola descarga sirve para todas las
+  granularidades.
+• Tiempo (diario → mensual): por ciudad y mes, según la regla de cada variable
+  (`RULES`): suma para precipitación, máximo/mínimo para las temperaturas extremas y
+  promedio para el resto. La fecha del mes es su primer día.
+• Espacio (ciudad → estado → nacional): promedio ponderado por población de los valores
+  ya agregados en el tiempo, para todas las variables (la precipitación estatal es la
+  lámina promedio, no la suma de las ciudades). Sin pesos, promedio simple. Los valores
+  faltantes no cuentan en el denominador.
+• Acepta el formato largo (`variable`/`valor`, Copernicus) y el ancho (una columna por
+  variable, `clima_historico`), con geografía `estado`/`ciudad` o
+  `departamento`/`municipio`. Todo es vectorizado (`groupby` + NumPy), sin recorrer
+  filas en Python.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+from typing import Dict, List, Literal, Tuple
+
+from .PDExAPI_Frames import EXACT_COLUMNS
+from .PDExAPI_Lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+# Regla temporal por variable (diario → mensual); las no listadas usan "mean"
+RULES: Dict[str, str] = {
+    "totalprecip_mm": "sum",
+    "totalsnow_cm": "sum",
+    "maxtemp_c": "max",
+    "mintemp_c": "min",
+    "maxwind_kph": "max",
+    "avgtemp_c": "mean",
+}
+
+# Columnas de geografía (nivel superior, nivel inferior) de México y LATAM
+GEO_COLUMNS: Tuple[Tuple[str, str], ...] = (("estado", "ciudad"), ("departamento", "municipio"))
+
+# Alias de `nivel` → posición en la jerarquía (0 = nacional)
+LEVELS: Dict[str, int] = {
+    "nacional": 0, "pais": 0,
+    "estado": 1, "departamento": 1,
+    "ciudad": 2, "municipio": 2,
+}
+
+Freq = Literal["D", "M"]
+
+
+# --------------------------------------------------------------------------------------
+# Utilidades
+# --------------------------------------------------------------------------------------
+def _geo_columns(df: pd.DataFrame) -> List[str]:
+    """Columnas de geografía presentes en `df`, de mayor a menor nivel."""
+    for upper, lower in GEO_COLUMNS:
+        if upper in df.columns:
+            return [c for c in (upper, lower) if c in df.columns]
+    return []
+
+
+def _value_columns(df: pd.DataFrame, keys: List[str]) -> List[str]:
+    """Variables numéricas de un DataFrame en formato ancho."""
+    return [
+        c for c in df.columns
+        if c not in keys and c not in EXACT_COLUMNS and pd.api.types.is_numeric_dtype(df[c])
+    ]
+
+
+def _month_start(fecha: pd.Series) -> pd.Series:
+    """Primer día del mes de cada fecha, conservando el tipo (datetime o texto ISO)."""
+    if pd.api.types.is_datetime64_any_dtype(fecha):
+        return fecha.dt.to_period("M").dt.to_timestamp()
+    return fecha.astype(str).str[:7] + "-01"
+
+
+def _reduce(grouped, rule: str):
+    if rule == "sum":
+        return grouped.sum(min_count=1)  # un mes sin datos queda NaN, no 0
+    if rule not in ("mean", "max", "min"):
+        raise ValueError(f"Regla de agregación desconocida: {rule!r}")
+    return getattr(grouped, rule)()
+
+
+# --------------------------------------------------------------------------------------
+# Tiempo
+# --------------------------------------------------------------------------------------
+def to_monthly(df: pd.DataFrame, rules: Dict[str, str] | None = None) -> pd.DataFrame:
+    """Agrega un DataFrame diario a mensual por geografía según la regla de cada variable."""
+    rules = {**RULES, **(rules or {})}
+    keys = ["fecha", *_geo_columns(df)]
+    df = df.assign(fecha=_month_start(df["fecha"]))
+
+    if "variable" in df.columns and "valor" in df.columns:
+        grouped = df.groupby([*keys, "variable"], observed=True, sort=True)["valor"]
+        used = sorted({rules.get(v, "mean") for v in df["variable"].astype(str).unique()})
+        table = pd.concat({r: _reduce(grouped, r) for r in used}, axis=1)
+        variables = table.index.get_level_values("variable").astype(str)
+        pick = variables.map({v: used.index(rules.get(v, "mean")) for v in variables.unique()})
+        values = table.to_numpy(dtype=float)
+        out = table.index.to_frame(index=False)
+        out["valor"] = values[np.arange(len(values)), np.asarray(pick, dtype=np.intp)]
+        return out
+
+    values = _value_columns(df, keys)
+    grouped = df.groupby(keys, observed=True, sort=True)
+    parts = [_reduce(grouped[v], rules.get(v, "mean")) for v in values]
+    return pd.concat(parts, axis=1).reset_index() if parts else grouped.size().reset_index()[keys]
+
+
+# --------------------------------------------------------------------------------------
+# Espacio
+# --------------------------------------------------------------------------------------
+def _weights_for(df: pd.DataFrame, geo: List[str], weights: pd.DataFrame | None) -> np.ndarray:
+    """Peso (población) de cada fila de `df`; 1.0 para todas si no hay pesos."""
+    if weights is None:
+        return np.ones(len(df))
+    missing = [c for c in (*geo, "poblacion") if c not in weights.columns]
+    if missing:
+        raise ValueError(f"Los pesos deben traer las columnas {geo + ['poblacion']}; faltan {missing}")
+    table = weights.groupby(geo, observed=True)["poblacion"].sum()
+    if len(geo) == 1:
+        rows = pd.Index(df[geo[0]].astype(str))
+        table.index = table.index.astype(str)
+    else:
+        rows = pd.MultiIndex.from_frame(df[geo].astype(str))
+        table.index = pd.MultiIndex.from_frame(table.index.to_frame().astype(str))
+    w = table.reindex(rows).to_numpy(dtype=float)
+    if np.isnan(w).any():
+        sin_peso = sorted(set(rows[np.isnan(w)]))[:5]
+        raise ValueError(f"Sin población para {sin_peso}")
+    return w
+
+
+def to_level(
+    df: pd.DataFrame,
+    nivel: str,
+    weights: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """
+    Promedio (ponderado por `weights`) de las geografías de `df` al nivel `nivel`.
+
+    `weights` es un DataFrame con las columnas de geografía de `df` y `poblacion`
+    (p.ej. la respuesta de `poblacion()` por ciudad); las poblaciones de ciudades se
+    suman si `df` ya está a nivel estado.
+    """
+    if nivel not in LEVELS:
+        raise ValueError(f"nivel debe ser uno de {sorted(LEVELS)}")
+    geo = _geo_columns(df)
+    depth = LEVELS[nivel]
+    if depth >= len(geo):
+        return df
+    keep = ["fecha", *geo[:depth]]
+    long = "variable" in df.columns and "valor" in df.columns
+    if long:
+        keep.append("variable")
+        values = ["valor"]
+    else:
+        values = _value_columns(df, ["fecha", *geo])
+
+    w = _weights_for(df, geo, weights)
+    x = df[values].to_numpy(dtype=float)
+    present = ~np.isnan(x)
+    num = np.where(present, x * w[:, None], 0.0)
+    den = np.where(present, w[:, None], 0.0)
+
+    parts = pd.DataFrame(np.hstack([num, den]), columns=[*values, *(f"_w_{v}" for v in values)])
+    sums = parts.groupby([df[k].to_numpy() for k in keep], sort=True).sum()
+    sums.index.names = keep
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out = sums[values].to_numpy() / sums[[f"_w_{v}" for v in values]].to_numpy()
+    out[sums[[f"_w_{v}" for v in values]].to_numpy() == 0] = np.nan
+    return pd.DataFrame(out, columns=values, index=sums.index).reset_index()
+
+
+# --------------------------------------------------------------------------------------
+# API
+# --------------------------------------------------------------------------------------
+def aggregate(
+    df: pd.DataFrame,
+    *,
+    freq: Freq = "D",
+    nivel: str = "ciudad",
+    weights: pd.DataFrame | None = None,
+    rules: Dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """
+    Agrega datos diarios por ciudad a `freq` ("D" o "M") y a `nivel` ("ciudad",
+    "estado" o "nacional"; o "municipio", "departamento", "pais").
+
+    Primero se agrega en el tiempo por ciudad (`rules` sobreescribe `RULES`) y después
+    en el espacio con promedio ponderado por `weights` (DataFrame con geografía y
+    `poblacion`; None = promedio simple).
+    """
+    if freq not in ("D", "M"):
+        raise ValueError("freq debe ser 'D' o 'M'")
+    if "fecha" not in df.columns:
+        raise ValueError("El DataFrame debe traer la columna 'fecha'")
+    if freq == "M":
+        df = to_monthly(df, rules)
+    return to_level(df, nivel, weights)
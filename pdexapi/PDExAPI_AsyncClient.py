@@ -0,0 +1,555 @@
+# ======================================================================================
+# Script:  PDExAPI_AsyncClient.py
+# Purpose: cliente asyncio nativo para la API de Polydata Exógenos (PDExAPI)
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `AsyncPDEXClient`: misma superficie de endpoints que `PDEXClient` sin bloquear el
+  event loop (requiere `httpx`, instalar con `pip install pdexapi[async]`).
+• Pool de conexiones compartido, renovación de token única aunque muchas corrutinas
+  lo vean expirado, y límite de concurrencia con semáforo.
+• Mismo manejo del token que `PDEXClient`: login en la primera petición (salvo
+  `eager_auth=True`), vida tomada de `expires_in` o de `token_ttl`, renovación con el
+  margen acotado de `refresh_lead` (PDExAPI_Auth) y un solo relogin + repetición tras
+  un 401.
+• `limiter`: un `RateController` (ver PDExAPI_Limits) compartible con `PDEXClient` para
+  que ambos clientes respeten la misma tasa y el mismo límite adaptativo.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import asyncio
+import time
+
+from typing import Any, Dict, List, Optional
+
+from .PDExAPI_Auth import refresh_lead
+from .PDExAPI_Lazy import lazy_import
+from .PDExAPI_Limits import RateController, is_congestion
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+try:
+    import httpx
+except ImportError:  # dependencia opcional
+    httpx = None
+
+
+class AsyncPDEXClient:
+    """
+    Cliente asíncrono para la API de Polydata Exógenos.
+
+    Ejemplo rápido
+    --------------
+    >>> async with AsyncPDEXClient("http://localhost:8000", "demo", "tu_password") as cli:
+    ...     dfs = await asyncio.gather(*[
+    ...         cli.fc_clima_mes(estado="Jalisco", ciudad=c, variable="maxtemp_c",
+    ...                          fecha_inicio="2025-08-01", fecha_fin="2025-12-01",
+    ...                          as_frame=True)
+    ...         for c in ["Zapopan", "Guadalajara"]
+    ...     ])
+
+    Parámetros
+    ----------
+    max_concurrency : int
+        Peticiones simultáneas permitidas (semáforo compartido por todos los endpoints).
+    max_connections : int
+        Tamaño del pool de conexiones keep-alive.
+    limiter : RateController, opcional
+        Tasa máxima y concurrencia adaptativa (AIMD) aplicadas dentro del semáforo.
+    token_ttl : float
+        Vida supuesta del token (segundos) cuando `/token` no informa `expires_in`.
+    eager_auth : bool
+        Si True, autentica al entrar al contexto (falla pronto con credenciales inválidas).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        *,
+        timeout: int | float = 10,
+        max_concurrency: int = 16,
+        max_connections: int = 16,
+        limiter: RateController | None = None,
+        token_ttl: float = 60 * 60,
+        eager_auth: bool = False,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncPDEXClient requiere httpx: pip install 'pdexapi[async]'"
+            )
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+
+        self.token_ttl = token_ttl
+        self.refresh_margin = 5 * 60  # mismo margen que TokenManager, acotado a su vida
+        self.eager_auth = eager_auth
+        self._token: str | None = None
+        self._exp_ts: float | None = None  # timestamp UNIX (segundos)
+        self._issued_ts = 0.0
+
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._login_lock = asyncio.Lock()
+        self._limiter = limiter
+
+    # ------------------------------------------------------------------ #
+    # Ciclo de vida
+    # ------------------------------------------------------------------ #
+    async def aclose(self) -> None:
+        """Cierra las conexiones del pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncPDEXClient":
+        if self.eager_auth:
+            await self._ensure_token()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    # ------------------------------------------------------------------ #
+    # Helpers privados
+    # ------------------------------------------------------------------ #
+    def _expired(self) -> bool:
+        if self._token is None:
+            return True
+        if self._exp_ts is None:
+            return False
+        lead = refresh_lead(self.refresh_margin, self._exp_ts - self._issued_ts)
+        return time.time() > self._exp_ts - lead
+
+    async def _login(self) -> None:
+        """Obtiene y guarda el token de acceso."""
+        url = f"{self.base_url}/token"
+        data = {"username": self.username, "password": self.password}
+        r = await self._http.post(url, data=data)
+        r.raise_for_status()
+        payload = r.json()
+        self._token = payload["access_token"]
+        self._issued_ts = time.time()
+        self._exp_ts = self._issued_ts + (payload.get("expires_in") or self.token_ttl)
+
+    async def _ensure_token(self) -> None:
+        """Renueva el token una sola vez aunque varias corrutinas lo vean expirado."""
+        if not self._expired():
+            return
+        async with self._login_lock:
+            if self._expired():  # otra corrutina pudo renovarlo mientras esperábamos
+                await self._login()
+
+    async def _invalidate(self, stale: str | None) -> None:
+        """Relogin tras un 401; si otra corrutina ya renovó el token, no hace nada."""
+        async with self._login_lock:
+            if self._token == stale or self._token is None:
+                await self._login()
+
+    async def _send(self, url: str, params: Dict[str, Any] | None):
+        await self._ensure_token()
+        token = self._token
+        headers = {"Authorization": f"Bearer {token}"}
+        if self._limiter is None:
+            r = await self._http.get(url, params=params, headers=headers)
+        else:
+            async with self._limiter.aslot() as out:
+                r = await self._http.get(url, params=params, headers=headers)
+                out.ok = not is_congestion(r.status_code)
+        return r, token
+
+    async def _get(self, path: str, params: Dict[str, Any] | None = None):
+        """GET con token; un 401 provoca un relogin single-flight y una sola repetición."""
+        url = f"{self.base_url}{path}"
+        async with self._sem:
+            r, token = await self._send(url, params)
+            if r.status_code == 401:
+                await self._invalidate(token)
+                r, _ = await self._send(url, params)
+        r.raise_for_status()
+        return r.json()
+
+    # ------------------------------------------------------------------ #
+    # Endpoints públicos
+    # ------------------------------------------------------------------ #
+    async def list_tables(self) -> List[str]:
+        """Lista todas las tablas disponibles en la BD."""
+        return await self._get("/tables")
+
+    async def inflacion(
+        self,
+        fecha_inicio: str,
+        fecha_fin: str,
+        fecha_proceso: str | None = None,
+        *,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        if fecha_proceso:
+            params["fecha_proceso"] = fecha_proceso
+        data = await self._get("/inflacion", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def inflacion_prediccion(
+        self,
+        fecha_inicio: str,
+        fecha_fin: str,
+        fecha_proceso: str | None = None,
+        *,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        if fecha_proceso:
+            params["fecha_proceso"] = fecha_proceso
+        data = await self._get("/inflacion_prediccion", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def fc_clima_mes(
+        self,
+        *,
+        estado: str,
+        ciudad: str,
+        variable: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        as_frame: bool = False,
+    ):
+        params = {
+            "estado": estado,
+            "ciudad": ciudad,
+            "variable": variable,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        data = await self._get("/fc_clima_mes", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def fc_clima_diario(
+        self,
+        *,
+        estado: str,
+        ciudad: str,
+        variable: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        as_frame: bool = False,
+    ):
+        params = {
+            "estado": estado,
+            "ciudad": ciudad,
+            "variable": variable,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        data = await self._get("/fc_clima_diario", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def fc_clima_mes_estado(
+        self,
+        *,
+        estado: str,
+        variable: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        as_frame: bool = False,
+    ):
+        params = {
+            "estado": estado,
+            "variable": variable,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        data = await self._get("/fc_clima_mes_estado", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def clima_historico(
+        self,
+        *,
+        estado: str,
+        ciudad: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        variable: str | None = None,
+        mes: bool = False,
+        as_frame: bool = False,
+    ):
+        params = {
+            "estado": estado,
+            "ciudad": ciudad,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+            "mes": mes,
+        }
+        if variable:
+            params["variable"] = variable
+        data = await self._get("/clima_historico", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def clima_historico_nacional(
+        self,
+        *,
+        fecha_inicio: str,
+        fecha_fin: str,
+        variable: str | None = None,
+        mes: bool = False,
+        as_frame: bool = False,
+    ):
+        params = {
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+            "mes": mes,
+        }
+        if variable:
+            params["variable"] = variable
+        data = await self._get("/clima_historico_nacional", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def clima_historico_estado_mes(
+        self,
+        *,
+        estado: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        variable: str | None = None,
+        as_frame: bool = False,
+    ):
+        params = {
+            "estado": estado,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        if variable:
+            params["variable"] = variable
+        data = await self._get("/clima_historico_estado_mes", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def cov_matrix(
+        self,
+        *,
+        fecha_modelo: str,
+        forecast_horizon: int,
+        variable: str,
+        estado: Optional[str] = None,
+        as_array: bool = False,
+        as_frame: bool = False,
+    ):
+        """Matriz de covarianza de pronóstico SARIMA (h x h); ver `PDEXClient.cov_matrix`."""
+        params: Dict[str, Any] = {
+            "fecha_modelo": fecha_modelo,
+            "forecast_horizon": forecast_horizon,
+            "variable": variable,
+        }
+        if estado:
+            params["estado"] = estado
+
+        data: List[List[float]] = await self._get("/cov_matrix", params=params)
+
+        if as_array:
+            return np.asarray(data)
+
+        if as_frame:
+            h = len(data)
+            idx = range(1, h + 1)
+            return pd.DataFrame(data, index=idx, columns=idx)
+
+        return data
+
+    # ------------------------------------------------------------------ #
+    # Copernicus
+    # ------------------------------------------------------------------ #
+    async def copernicus_hourly_grib(
+        self,
+        *,
+        fecha_inicio: str,
+        fecha_fin: str,
+        variable,
+        estado: str | None = None,
+        ciudad: str | None = None,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+            "variable": variable,
+        }
+        if estado:
+            params["estado"] = estado
+        if ciudad:
+            params["ciudad"] = ciudad
+        data = await self._get("/copernicus_hourly_grib", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def copernicus_historical(
+        self,
+        *,
+        nivel: str,
+        freq: str,
+        variable,
+        fecha_inicio: str,
+        fecha_fin: str,
+        estado: str | None = None,
+        ciudad: str | None = None,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "nivel": nivel,
+            "freq": freq,
+            "variable": variable,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        if estado:
+            params["estado"] = estado
+        if ciudad:
+            params["ciudad"] = ciudad
+        data = await self._get("/copernicus_historical", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def copernicus_historical_latam(
+        self,
+        *,
+        nivel: str,
+        freq: str,
+        variable,
+        fecha_inicio: str,
+        fecha_fin: str,
+        pais: str,
+        departamento: str | None = None,
+        municipio: str | None = None,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "nivel": nivel,
+            "freq": freq,
+            "pais": pais,
+            "variable": variable,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        if departamento:
+            params["departamento"] = departamento
+        if municipio:
+            params["municipio"] = municipio
+        data = await self._get("/copernicus_historical_latam", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def copernicus_forecast(
+        self,
+        *,
+        nivel: str,
+        fecha_entrenamiento: str,
+        variable,
+        fh: int,
+        velocity: bool,
+        anomaly: bool,
+        estado: str | None = None,
+        ciudad: str | None = None,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "nivel": nivel,
+            "fecha_entrenamiento": fecha_entrenamiento,
+            "variable": variable,
+            "fh": fh,
+            "velocity": velocity,
+            "anomaly": anomaly,
+        }
+        if estado:
+            params["estado"] = estado
+        if ciudad:
+            params["ciudad"] = ciudad
+        data = await self._get("/copernicus_forecast", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def copernicus_forecast_latam(
+        self,
+        *,
+        nivel: str,
+        fecha_entrenamiento: str,
+        variable,
+        fh: int,
+        velocity: bool,
+        anomaly: bool,
+        pais: str,
+        departamento: str | None = None,
+        municipio: str | None = None,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {
+            "nivel": nivel,
+            "fecha_entrenamiento": fecha_entrenamiento,
+            "variable": variable,
+            "fh": fh,
+            "pais": pais,
+            "velocity": velocity,
+            "anomaly": anomaly,
+        }
+        if departamento:
+            params["departamento"] = departamento
+        if municipio:
+            params["municipio"] = municipio
+        data = await self._get("/copernicus_forecast_latam", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    # ------------------------------------------------------------------ #
+    # Referencia
+    # ------------------------------------------------------------------ #
+    async def poblacion(
+        self,
+        *,
+        estado: str,
+        ciudad: str | None = None,
+        fecha_proceso: str | None = None,
+        as_frame: bool = False,
+    ):
+        params: Dict[str, Any] = {"estado": estado}
+        if ciudad:
+            params["ciudad"] = ciudad
+        if fecha_proceso:
+            params["fecha_proceso"] = fecha_proceso
+        data = await self._get("/poblacion", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def turismo(
+        self,
+        *,
+        estado: str,
+        fecha_inicio: str,
+        fecha_fin: str,
+        as_frame: bool = False,
+    ):
+        params = {
+            "estado": estado,
+            "fecha_inicio": fecha_inicio,
+            "fecha_fin": fecha_fin,
+        }
+        data = await self._get("/turismo", params=params)
+        return pd.DataFrame(data) if as_frame else data
+
+    async def dias_festivos(
+        self,
+        *,
+        as_frame: bool = False,
+    ):
+        data = await self._get("/dias_festivos", params={})
+        return pd.DataFrame(data) if as_frame else data
@@ -0,0 +1,259 @@
+# ======================================================================================
+# Script:  PDExAPI_Auth.py
+# Purpose: manejo del token de acceso de PDExAPI seguro entre hilos y procesos
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `TokenManager`: entrega un token vigente a todos los hilos de un cliente. La renovación
+  es single-flight (un solo login aunque muchos hilos vean el token vencido), se hace
+  `refresh_margin` segundos antes del vencimiento (a lo más el 10 % de la vida del
+  token, ver `refresh_lead`) y puede correr en un hilo de fondo.
+  `invalidate` fuerza el relogin tras un 401 sin repetirlo por cada hilo que lo reciba.
+• `FileTokenStore`: archivo JSON (permisos 0600) con lock exclusivo para compartir el
+  token entre procesos; solo el primer proceso que lo encuentra vencido hace login.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+import json
+import os
+import threading
+import time
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+# Login: devuelve (token, segundos de vida o None si el servidor no los informa)
+LoginFn = Callable[[], Tuple[str, Optional[float]]]
+
+# Fracción máxima de la vida del token que puede usarse como margen de renovación
+LEAD_FRACTION = 0.1
+
+
+def refresh_lead(margin: float, lifetime: float) -> float:
+    """
+    Segundos antes del vencimiento en que se renueva un token de vida `lifetime`.
+
+    `margin` se acota a `LEAD_FRACTION` de la vida: con `expires_in` cortos (≤ margen)
+    el token no nace vencido ni provoca un login por petición.
+    """
+    return min(margin, LEAD_FRACTION * max(lifetime, 0.0))
+
+
+# --------------------------------------------------------------------------------------
+# Almacén en archivo
+# --------------------------------------------------------------------------------------
+class FileTokenStore:
+    """
+    Token compartido entre procesos en un archivo JSON.
+
+    Parámetros
+    ----------
+    path : str | Path
+        Archivo del token; junto a él se crea `<path>.lock`. Varias cuentas o APIs
+        pueden compartir el archivo (cada una bajo su propia llave).
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def __repr__(self) -> str:
+        return f"FileTokenStore({str(self.path)!r})"
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Lock exclusivo entre procesos mientras se lee/renueva el token."""
+        with open(self._lock_path, "a+b") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+                else:  # pragma: no cover - Windows
+                    fh.seek(0)
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _read_all(self) -> Dict[str, Any]:
+        try:
+            return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def load(self, key: str) -> Optional[Tuple[str, float, Optional[float]]]:
+        """(token, expiración UNIX, emisión UNIX o None) guardados para `key`, o None."""
+        entry = self._read_all().get(key)
+        if not entry:
+            return None
+        issued = entry.get("issued_ts")
+        return entry["token"], float(entry["exp_ts"]), None if issued is None else float(issued)
+
+    def save(self, key: str, token: str, exp_ts: float, issued_ts: float | None = None) -> None:
+        """Guarda el token de `key` con escritura atómica (llamar dentro de `locked`)."""
+        data = self._read_all()
+        data[key] = {"token": token, "exp_ts": exp_ts, "issued_ts": issued_ts}
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as fh:
+            json.dump(data, fh)
+        os.replace(tmp, self.path)
+
+
+# --------------------------------------------------------------------------------------
+# Token en memoria
+# --------------------------------------------------------------------------------------
+class TokenManager:
+    """
+    Token de acceso compartido por los hilos de un cliente.
+
+    Parámetros
+    ----------
+    login : callable
+        Hace el POST a `/token`; devuelve `(token, expires_in)`.
+    ttl : float
+        Vida supuesta del token cuando el servidor no informa `expires_in`.
+    refresh_margin : float
+        Segundos antes del vencimiento en que el token ya se considera vencido (acotado
+        por `refresh_lead` a una fracción de su vida).
+    store : FileTokenStore | None
+        Almacén compartido entre procesos.
+    store_key : str
+        Llave del token dentro del almacén (p.ej. "<base_url>|<usuario>").
+    background : bool
+        Si True, un hilo daemon renueva el token antes de que venza; empieza después del
+        primer login en primer plano (no hay red antes de la primera petición).
+    min_interval : float
+        Segundos mínimos entre dos renovaciones del hilo de fondo.
+    """
+
+    def __init__(
+        self,
+        login: LoginFn,
+        *,
+        ttl: float = 60 * 60,
+        refresh_margin: float = 5 * 60,
+        store: FileTokenStore | None = None,
+        store_key: str = "default",
+        background: bool = False,
+        min_interval: float = 1.0,
+    ):
+        self._login = login
+        self.ttl = ttl
+        self.refresh_margin = refresh_margin
+        self.store = store
+        self.store_key = store_key
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._token: str | None = None
+        self._exp_ts = 0.0  # timestamp UNIX (segundos)
+        self._issued_ts = 0.0
+        self.logins = 0
+        self._stop = threading.Event()
+        self._ready = threading.Event()  # hay token (o se cerró): arranca el hilo de fondo
+        self._thread: threading.Thread | None = None
+        if background:
+            self._thread = threading.Thread(
+                target=self._refresh_loop, name="pdexapi-token", daemon=True
+            )
+            self._thread.start()
+
+    # ------------------------------------------------------------------ #
+    def _lead(self, exp_ts: float, issued_ts: float) -> float:
+        return refresh_lead(self.refresh_margin, exp_ts - issued_ts)
+
+    def _fresh(self, exp_ts: float, issued_ts: float, scale: float = 1.0) -> bool:
+        return time.time() < exp_ts - scale * self._lead(exp_ts, issued_ts)
+
+    def token(self) -> str:
+        """Token vigente; renueva (una sola vez entre todos los hilos) si está por vencer."""
+        token, exp_ts, issued_ts = self._token, self._exp_ts, self._issued_ts
+        if token is not None and self._fresh(exp_ts, issued_ts):
+            return token
+        with self._lock:
+            if self._token is None or not self._fresh(self._exp_ts, self._issued_ts):
+                self._refresh_locked()
+            return self._token
+
+    def invalidate(self, stale: str | None) -> None:
+        """
+        Descarta `stale` (rechazado con 401) y obtiene otro token.
+
+        Si otro hilo ya lo reemplazó, no hace nada: así N respuestas 401 simultáneas
+        producen un solo login.
+        """
+        with self._lock:
+            if self._token == stale or self._token is None:
+                self._refresh_locked(force=True)
+
+    def _refresh_locked(self, force: bool = False, scale: float = 1.0) -> None:
+        if self.store is None:
+            self._do_login()
+            return
+        with self.store.locked():
+            saved = self.store.load(self.store_key)
+            if saved:
+                token, exp_ts, issued_ts = saved
+                if issued_ts is None:  # archivo previo sin emisión: se supone `ttl`
+                    issued_ts = exp_ts - self.ttl
+                if self._fresh(exp_ts, issued_ts, scale) and not (force and token == self._token):
+                    self._token, self._exp_ts, self._issued_ts = token, exp_ts, issued_ts
+                    self._ready.set()  # otro proceso ya lo renovó
+                    return
+            self._do_login()
+            self.store.save(self.store_key, self._token, self._exp_ts, self._issued_ts)
+
+    def _do_login(self) -> None:
+        token, expires_in = self._login()
+        now = time.time()
+        self._token = token
+        self._issued_ts = now
+        self._exp_ts = now + (expires_in if expires_in else self.ttl)
+        self.logins += 1
+        self._ready.set()
+
+    # ------------------------------------------------------------------ #
+    def _refresh_loop(self) -> None:
+        # Espera el primer login en primer plano; después renueva con el doble de margen
+        # para que los hilos de consulta nunca esperen, sin renovar más de una vez cada
+        # `min_interval` segundos
+        self._ready.wait()
+        while not self._stop.is_set():
+            exp_ts, issued_ts = self._exp_ts, self._issued_ts
+            wait = max(
+                exp_ts - 2 * self._lead(exp_ts, issued_ts) - time.time(),
+                issued_ts + self.min_interval - time.time(),
+            )
+            if self._stop.wait(max(wait, 0.0)):
+                return
+            try:
+                with self._lock:
+                    if not self._fresh(self._exp_ts, self._issued_ts, scale=2.0):
+                        self._refresh_locked(scale=2.0)
+            except Exception:  # la renovación en primer plano reintentará
+                if self._stop.wait(5.0):
+                    return
+
+    def close(self) -> None:
+        """Detiene el hilo de renovación en segundo plano."""
+        self._stop.set()
+        self._ready.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
@@ -0,0 +1,184 @@
+# ======================================================================================
+# Script:  PDExAPI_Batch.py
+# Purpose: ejecución concurrente de lotes de consultas a PDExAPI
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `run_batch`: ejecuta una función sobre una lista de parámetros en un pool de hilos
+  acotado, recolectando errores por elemento sin abortar el lote.
+• `BatchResult`: resultados indexados por petición + DataFrame concatenado con las
+  columnas llave agregadas.
+• `date_windows`: partición de un rango de fechas en ventanas de N días.
+• `SingleFlight`: une llamadas concurrentes idénticas en una sola ejecución.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import threading
+
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from .PDExAPI_Lazy import lazy_import
+
+pd = lazy_import("pandas")
+cf = lazy_import("concurrent.futures")  # ~10 ms (logging) en el arranque
+
+
+def date_windows(fecha_inicio: str, fecha_fin: str, days: int) -> List[Tuple[str, str]]:
+    """
+    Divide [fecha_inicio, fecha_fin] (inclusivo) en ventanas consecutivas de `days` días.
+
+    >>> date_windows("2023-01-01", "2023-01-05", 2)
+    [('2023-01-01', '2023-01-02'), ('2023-01-03', '2023-01-04'), ('2023-01-05', '2023-01-05')]
+    """
+    if days < 1:
+        raise ValueError("days debe ser >= 1")
+    ini = date.fromisoformat(fecha_inicio[:10])
+    fin = date.fromisoformat(fecha_fin[:10])
+    if fin < ini:
+        raise ValueError("fecha_fin es anterior a fecha_inicio")
+    out: List[Tuple[str, str]] = []
+    step = timedelta(days=days)
+    while ini <= fin:
+        end = min(ini + step - timedelta(days=1), fin)
+        out.append((ini.isoformat(), end.isoformat()))
+        ini = end + timedelta(days=1)
+    return out
+
+
+def request_key(params: Dict[str, Any]) -> Tuple[Tuple[str, Hashable], ...]:
+    """Llave hashable e independiente del orden para un dict de parámetros."""
+    return tuple(
+        sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in params.items())
+    )
+
+
+class BatchResult:
+    """
+    Resultado de un lote de consultas.
+
+    Atributos
+    ---------
+    params : dict
+        Parámetros originales por llave de petición.
+    results : dict
+        Respuesta (lista de dicts / JSON) por llave de petición exitosa.
+    errors : dict
+        Excepción por llave de petición fallida.
+    """
+
+    def __init__(self):
+        self.params: Dict[tuple, Dict[str, Any]] = {}
+        self.results: Dict[tuple, Any] = {}
+        self.errors: Dict[tuple, BaseException] = {}
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+    def __repr__(self) -> str:
+        return f"BatchResult(ok={len(self.results)}, errores={len(self.errors)})"
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def get(self, params: Dict[str, Any]) -> Any:
+        """Respuesta de la petición con esos parámetros (KeyError si falló)."""
+        return self.results[request_key(params)]
+
+    def frame(self) -> pd.DataFrame:
+        """
+        Concatena todas las respuestas exitosas en un solo DataFrame.
+
+        Los parámetros escalares de cada petición se agregan como columnas
+        llave cuando la respuesta no las trae ya.
+        """
+        frames = []
+        for key, data in self.results.items():
+            df = pd.DataFrame(data)
+            for col, val in self.params[key].items():
+                if col not in df.columns and not isinstance(val, (list, tuple)):
+                    df[col] = val
+            frames.append(df)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=True)
+
+
+def run_batch(
+    fn: Callable[..., Any],
+    params_list: List[Dict[str, Any]],
+    *,
+    max_in_flight: int = 8,
+) -> BatchResult:
+    """
+    Ejecuta `fn(**params)` para cada elemento con a lo más `max_in_flight` hilos.
+
+    Las llaves duplicadas se consultan una sola vez.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight debe ser >= 1")
+
+    out = BatchResult()
+    for params in params_list:
+        out.params.setdefault(request_key(params), dict(params))
+
+    with cf.ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        futures = {key: pool.submit(fn, **p) for key, p in out.params.items()}
+        for key, fut in futures.items():
+            try:
+                out.results[key] = fut.result()
+            except Exception as exc:  # se reporta por elemento
+                out.errors[key] = exc
+    return out
+
+
+class SingleFlight:
+    """
+    Coalescencia de llamadas idénticas en curso (single-flight).
+
+    Mientras una llamada con cierta llave está en vuelo, las demás con la misma
+    llave esperan su resultado (o su excepción) en lugar de repetirla. No guarda
+    nada al terminar: no es una caché.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, cf.Future] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """Ejecuta `fn()` o espera a la ejecución en curso con la misma llave."""
+        with self._lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = self._inflight[key] = cf.Future()
+                self.leaders += 1
+            else:
+                self.shared += 1
+        if not leader:
+            return fut.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Ejecuciones reales (`leaders`) y llamadas que reutilizaron una en curso (`shared`)."""
+        with self._lock:
+            return {"leaders": self.leaders, "shared": self.shared, "inflight": len(self._inflight)}
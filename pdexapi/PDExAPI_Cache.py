@@ -0,0 +1,699 @@
+# ======================================================================================
+# Script:  PDExAPI_Cache.py
+# Purpose: caché local persistente de respuestas de PDExAPI
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `ResponseCache`: caché en disco (SQLite) indexada por ruta + parámetros normalizados,
+  con TTL por endpoint, desalojo LRU bajo un presupuesto de bytes y acceso seguro
+  desde varios hilos y procesos.
+• Revalidación condicional: junto al cuerpo se guardan `ETag`/`Last-Modified`; una
+  entrada vencida con validadores se conserva (hasta `stale_keep`) y el cliente la
+  revalida con `If-None-Match`/`If-Modified-Since`: un 304 renueva su TTL y se sirve
+  la copia guardada sin volver a descargar el cuerpo.
+• `default_ttl`: política de TTL por endpoint (larga para ventanas históricas cerradas,
+  corta para pronósticos y días festivos).
+• `MemoCache`: memo en memoria (LRU acotado) para endpoints de referencia pequeños;
+  entrega copias para que el llamador no pueda corromper lo guardado.
+• `RangeCache`: caché incremental de series de tiempo; guarda qué intervalos de fechas
+  ya tiene por serie y solo pide al servidor los huecos.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from collections import OrderedDict
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .PDExAPI_Lazy import is_loaded, lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Endpoints cuya respuesta no cambia una vez que la ventana de fechas terminó
+HISTORICAL_PATHS = frozenset({
+    "/clima_historico",
+    "/clima_historico_nacional",
+    "/clima_historico_estado_mes",
+    "/copernicus_historical",
+    "/copernicus_historical_latam",
+    "/copernicus_hourly_grib",
+})
+
+FORECAST_PATHS = frozenset({
+    "/fc_clima_mes",
+    "/fc_clima_mes_estado",
+    "/fc_clima_diario",
+    "/copernicus_forecast",
+    "/copernicus_forecast_latam",
+    "/inflacion_prediccion",
+})
+
+
+def default_ttl(path: str, params: Dict[str, Any] | None) -> Optional[float]:
+    """
+    TTL en segundos para una consulta; `None` significa no guardar en caché.
+
+    • Histórico con `fecha_fin` anterior a hoy → 30 días (ventana cerrada).
+    • Histórico que incluye hoy → 1 hora.
+    • `inflacion` con `fecha_proceso` fija → 30 días; sin ella → 1 hora.
+    • Pronósticos → 1 hora; `dias_festivos` → 6 horas; referencia → 1 día.
+    """
+    params = params or {}
+    if path in HISTORICAL_PATHS:
+        fin = str(params.get("fecha_fin", ""))[:10]
+        closed = bool(fin) and fin < date.today().isoformat()
+        return 30 * DAY if closed else HOUR
+    if path == "/inflacion":
+        return 30 * DAY if params.get("fecha_proceso") else HOUR
+    if path in FORECAST_PATHS:
+        return HOUR
+    if path == "/dias_festivos":
+        return 6 * HOUR
+    if path in ("/tables", "/poblacion", "/turismo", "/cov_matrix"):
+        return DAY
+    return None
+
+
+def cache_key(path: str, params: Dict[str, Any] | None) -> str:
+    """Hash estable de la ruta y los parámetros (independiente del orden de las llaves)."""
+    norm = json.dumps(params or {}, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(f"{path}?{norm}".encode()).hexdigest()
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    """Conexión SQLite apta para varios hilos (con lock propio) y varios procesos."""
+    db = sqlite3.connect(
+        db_path,
+        timeout=30,
+        isolation_level=None,  # transacciones explícitas
+        check_same_thread=False,
+    )
+    db.execute("PRAGMA journal_mode=WAL")
+    return db
+
+
+class ResponseCache:
+    """
+    Caché persistente de cuerpos de respuesta.
+
+    Parámetros
+    ----------
+    directory : str | Path
+        Carpeta donde vive `responses.sqlite`; puede compartirse entre procesos.
+    max_bytes : int
+        Presupuesto de bytes; al excederse se desalojan las entradas usadas hace
+        más tiempo (LRU).
+    ttl : dict[str, float] | callable, opcional
+        Sobrescribe el TTL por ruta (ej. `{"/turismo": 3600}`) o reemplaza la
+        política completa con una función `(path, params) -> segundos | None`.
+    stale_keep : float
+        Segundos que se conserva una entrada vencida con validadores para
+        revalidarla; 0 desactiva la revalidación.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = 512 * 1024 * 1024,
+        ttl: Dict[str, float] | Callable[[str, Dict[str, Any] | None], Optional[float]] | None = None,
+        stale_keep: float = 7 * DAY,
+    ):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._ttl = ttl
+        self.stale_keep = stale_keep
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0  # GET condicionales por entradas vencidas
+        self.not_modified = 0  # de esas, respondidas con 304
+
+        self._db = _connect(self.directory / "responses.sqlite")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key      TEXT PRIMARY KEY,
+                path     TEXT NOT NULL,
+                body     BLOB NOT NULL,
+                size     INTEGER NOT NULL,
+                expires  REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_accessed ON entries(accessed)")
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(entries)")}
+        for name in ("etag", "last_modified"):  # cachés creadas antes de la revalidación
+            if name not in columns:
+                self._db.execute(f"ALTER TABLE entries ADD COLUMN {name} TEXT")
+
+    # ------------------------------------------------------------------ #
+    def ttl_for(self, path: str, params: Dict[str, Any] | None) -> Optional[float]:
+        if callable(self._ttl):
+            return self._ttl(path, params)
+        if self._ttl and path in self._ttl:
+            return self._ttl[path]
+        return default_ttl(path, params)
+
+    def _revalidable(
+        self, etag: str | None, last_modified: str | None, expires: float, now: float
+    ) -> bool:
+        return bool(etag or last_modified) and expires > now - self.stale_keep
+
+    def get(self, path: str, params: Dict[str, Any] | None) -> Optional[bytes]:
+        """
+        Cuerpo guardado y vigente, o `None`. Cuenta como miss si la ruta es cacheable y
+        no hay una entrada vencida revalidable (esa se cuenta en `conditional`).
+        """
+        if not self.ttl_for(path, params):
+            return None
+        key = cache_key(path, params)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, expires, etag, last_modified FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                if row is None or not self._revalidable(row[2], row[3], row[1], now):
+                    self.misses += 1
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def conditional(self, path: str, params: Dict[str, Any] | None) -> Dict[str, str]:
+        """
+        Cabeceras `If-None-Match`/`If-Modified-Since` para revalidar la entrada vencida
+        de la consulta (vacío si no hay una revalidable).
+        """
+        if not self.ttl_for(path, params):
+            return {}
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT expires, etag, last_modified FROM entries WHERE key = ?",
+                (cache_key(path, params),),
+            ).fetchone()
+            if row is None or row[0] > now or not self._revalidable(row[1], row[2], row[0], now):
+                return {}
+            self.revalidations += 1
+        headers = {}
+        if row[1]:
+            headers["If-None-Match"] = row[1]
+        if row[2]:
+            headers["If-Modified-Since"] = row[2]
+        return headers
+
+    def refresh(self, path: str, params: Dict[str, Any] | None) -> Optional[bytes]:
+        """Tras un 304: renueva el TTL de la entrada y devuelve su cuerpo (None si ya no está)."""
+        ttl = self.ttl_for(path, params)
+        key = cache_key(path, params)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT body FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or not ttl:
+                return None
+            self._db.execute(
+                "UPDATE entries SET expires = ?, accessed = ? WHERE key = ?", (now + ttl, now, key)
+            )
+            self.not_modified += 1
+            return row[0]
+
+    def put(
+        self,
+        path: str,
+        params: Dict[str, Any] | None,
+        body: bytes,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> bool:
+        """
+        Guarda el cuerpo (y sus validadores `ETag`/`Last-Modified`, si los hay) cuando la
+        política de TTL lo permite; devuelve si se guardó.
+        """
+        ttl = self.ttl_for(path, params)
+        if not ttl or len(body) > self.max_bytes:
+            return False
+        if not self.stale_keep:
+            etag = last_modified = None
+        now = time.time()
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, path, body, size, expires, accessed, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (cache_key(path, params), path, body, len(body), now + ttl, now,
+                     etag, last_modified),
+                )
+                self._evict(now)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return True
+
+    def _evict(self, now: float) -> None:
+        """
+        Elimina vencidos (los revalidables tras `stale_keep`) y, si se excede el
+        presupuesto, los menos usados.
+        """
+        self._db.execute(
+            "DELETE FROM entries WHERE expires <= ? AND "
+            "((etag IS NULL AND last_modified IS NULL) OR expires <= ?)",
+            (now, now - self.stale_keep),
+        )
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ).fetchall():
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    # ------------------------------------------------------------------ #
+    def invalidate(self, path: str) -> None:
+        """Elimina todas las entradas de `path`."""
+        with self._lock:
+            self._db.execute("DELETE FROM entries WHERE path = ?", (path,))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Hits, revalidaciones (GET condicionales; `not_modified` = respondidas con 304) y
+        misses de este proceso, y tamaño actual de la caché compartida.
+        """
+        with self._lock:
+            entries, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "not_modified": self.not_modified,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": size,
+                "max_bytes": self.max_bytes,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# --------------------------------------------------------------------------------------
+# Memo en memoria para endpoints de referencia
+# --------------------------------------------------------------------------------------
+# TTL en segundos por ruta; solo estas rutas se memorizan salvo que se indique otra cosa
+MEMO_TTL: Dict[str, float] = {
+    "/tables": DAY,
+    "/dias_festivos": 6 * HOUR,
+    "/poblacion": DAY,
+    "/cov_matrix": DAY,
+}
+
+_MISSING = object()
+
+
+def _copy(value: Any) -> Any:
+    """Copia independiente de una respuesta (rápida para las formas habituales)."""
+    # sin forzar la importación: si pandas/numpy no se han cargado no hay frames ni arrays
+    if (is_loaded(pd) and isinstance(value, pd.DataFrame)) or (
+        is_loaded(np) and isinstance(value, np.ndarray)
+    ):
+        return value.copy()
+    if isinstance(value, list):
+        if all(type(v) is dict for v in value):
+            return [dict(v) for v in value]  # registros planos
+        if all(type(v) is list for v in value):
+            return [list(v) for v in value]  # matrices
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    return copy.deepcopy(value)
+
+
+class MemoCache:
+    """
+    Memo LRU en memoria, seguro entre hilos; puede compartirse entre clientes.
+
+    Parámetros
+    ----------
+    max_entries : int
+        Número máximo de respuestas guardadas; se desaloja la menos usada.
+    ttl : dict[str, float | None], opcional
+        TTL por ruta que se combina con `MEMO_TTL` (ej. `{"/turismo": 3600}`);
+        `None` o 0 excluye la ruta.
+    """
+
+    def __init__(self, *, max_entries: int = 256, ttl: Dict[str, Optional[float]] | None = None):
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser >= 1")
+        self.max_entries = max_entries
+        self.ttl: Dict[str, float] = dict(MEMO_TTL)
+        for path, seconds in (ttl or {}).items():
+            if seconds:
+                self.ttl[path] = seconds
+            else:
+                self.ttl.pop(path, None)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # llave → (expira, valor)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def handles(self, path: str) -> bool:
+        return path in self.ttl
+
+    @staticmethod
+    def _key(path: str, params: Dict[str, Any] | None, variant: Any) -> tuple:
+        norm = json.dumps(params or {}, sort_keys=True, default=str, separators=(",", ":"))
+        return path, norm, variant
+
+    def get(self, path: str, params: Dict[str, Any] | None, variant: Any = None) -> Any:
+        """Copia del valor guardado, o `_MISSING`."""
+        key = self._key(path, params, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return _copy(value)
+
+    def put(self, path: str, params: Dict[str, Any] | None, value: Any, variant: Any = None) -> None:
+        """Guarda una copia de `value` (el llamador conserva la suya)."""
+        ttl = self.ttl.get(path)
+        if not ttl:
+            return
+        key = self._key(path, params, variant)
+        stored = _copy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path: str | None = None) -> int:
+        """Elimina las entradas de `path` (todas si es None); devuelve cuántas."""
+        with self._lock:
+            if path is None:
+                n = len(self._entries)
+                self._entries.clear()
+                return n
+            keys = [k for k in self._entries if k[0] == path]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+            }
+
+
+# --------------------------------------------------------------------------------------
+# Caché incremental por rangos de fechas
+# --------------------------------------------------------------------------------------
+Interval = Tuple[date, date]
+ONE_DAY = timedelta(days=1)
+
+
+def _month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def _month_end(d: date) -> date:
+    return (d.replace(day=1) + timedelta(days=32)).replace(day=1) - ONE_DAY
+
+
+def merge_intervals(intervals: List[Interval]) -> List[Interval]:
+    """Une intervalos inclusivos que se traslapan o son contiguos."""
+    out: List[Interval] = []
+    for a, b in sorted(intervals):
+        if out and a <= out[-1][1] + ONE_DAY:
+            out[-1] = (out[-1][0], max(out[-1][1], b))
+        else:
+            out.append((a, b))
+    return out
+
+
+def missing_intervals(ini: date, fin: date, held: List[Interval]) -> List[Interval]:
+    """Sub-rangos de [ini, fin] que no cubre ningún intervalo de `held`."""
+    gaps: List[Interval] = []
+    cur = ini
+    for a, b in merge_intervals(held):
+        if b < cur:
+            continue
+        if a > fin:
+            break
+        if a > cur:
+            gaps.append((cur, a - ONE_DAY))
+        cur = b + ONE_DAY
+        if cur > fin:
+            break
+    if cur <= fin:
+        gaps.append((cur, fin))
+    return gaps
+
+
+class RangeCache:
+    """
+    Caché incremental para endpoints con ventana `fecha_inicio`/`fecha_fin`.
+
+    Cada serie se identifica por (ruta, parámetros sin fechas), es decir endpoint,
+    geografía, variable y frecuencia. La caché recuerda qué intervalos de fechas
+    ya tiene guardados, pide al servidor solo los huecos y devuelve el corte
+    solicitado a partir de la serie almacenada.
+
+    Parámetros
+    ----------
+    directory : str | Path
+        Carpeta donde vive `ranges.sqlite`; puede compartirse entre procesos.
+    settle_days : int
+        Días recientes (contando hoy) que se consideran abiertos: se vuelven a
+        pedir en cada consulta porque el servidor aún puede actualizarlos.
+    paths : iterable[str], opcional
+        Rutas administradas; por defecto los históricos de clima y Copernicus.
+    date_key : str | dict[str, str]
+        Columna de fecha de las filas (o una por ruta, ej. `{"/turismo":
+        "fecha_periodo"}`; las rutas no listadas usan "fecha"). Si las filas de una
+        respuesta no la traen, la consulta se resuelve sin caché por rangos.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        settle_days: int = 2,
+        paths=HISTORICAL_PATHS,
+        date_key: str | Dict[str, str] = "fecha",
+    ):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.settle_days = settle_days
+        self.paths = frozenset(paths)
+        self.date_key = date_key
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.partial = 0
+        self.misses = 0
+        self.gap_requests = 0
+        self.bypassed = 0  # consultas cuyas filas no traen la columna de fecha
+
+        self._db = _connect(self.directory / "ranges.sqlite")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS held (series TEXT NOT NULL, ini TEXT NOT NULL, fin TEXT NOT NULL)"
+        )
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rows (
+                series  TEXT NOT NULL,
+                dia     TEXT NOT NULL,
+                payload TEXT NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_held ON held(series)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_rows ON rows(series, dia)")
+
+    # ------------------------------------------------------------------ #
+    def handles(self, path: str, params: Dict[str, Any] | None) -> bool:
+        return (
+            path in self.paths
+            and bool(params)
+            and "fecha_inicio" in params
+            and "fecha_fin" in params
+        )
+
+    @staticmethod
+    def _monthly(path: str, params: Dict[str, Any]) -> bool:
+        return (
+            params.get("freq") == "M"
+            or bool(params.get("mes"))
+            or path.endswith("_mes")
+        )
+
+    def _closed_until(self, monthly: bool) -> date:
+        """Último día considerado definitivo (no se vuelve a pedir)."""
+        closed = date.today() - timedelta(days=self.settle_days)
+        if monthly:
+            closed = _month_start(closed + ONE_DAY) - ONE_DAY
+        return closed
+
+    def date_key_for(self, path: str) -> str:
+        if isinstance(self.date_key, str):
+            return self.date_key
+        return self.date_key.get(path, "fecha")
+
+    def _held(self, series: str) -> List[Interval]:
+        rows = self._db.execute("SELECT ini, fin FROM held WHERE series = ?", (series,)).fetchall()
+        return [(date.fromisoformat(a), date.fromisoformat(b)) for a, b in rows]
+
+    # ------------------------------------------------------------------ #
+    def fetch(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        fetch_fn: Callable[[Dict[str, Any]], List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Devuelve las filas de [fecha_inicio, fecha_fin] pidiendo solo los huecos.
+
+        `fetch_fn(params)` realiza la consulta remota para un sub-rango. Si alguna fila
+        de un hueco no trae la columna de fecha (o la trae vacía/None), no se guarda
+        nada y se devuelve la consulta completa sin caché.
+        """
+        key = self.date_key_for(path)
+        series = cache_key(
+            path, {k: v for k, v in params.items() if k not in ("fecha_inicio", "fecha_fin")}
+        )
+        monthly = self._monthly(path, params)
+        ini = date.fromisoformat(str(params["fecha_inicio"])[:10])
+        fin = date.fromisoformat(str(params["fecha_fin"])[:10])
+        if monthly:
+            ini, fin = _month_start(ini), _month_end(fin)
+
+        with self._lock:
+            gaps = missing_intervals(ini, fin, self._held(series))
+        if monthly:
+            gaps = merge_intervals([(_month_start(a), _month_end(b)) for a, b in gaps])
+
+        for a, b in gaps:
+            rows = fetch_fn({**params, "fecha_inicio": a.isoformat(), "fecha_fin": b.isoformat()})
+            dated = isinstance(rows, list) and all(isinstance(r, dict) and r.get(key) for r in rows)
+            if not dated:
+                with self._lock:
+                    self.bypassed += 1
+                return rows if [(a, b)] == gaps and (a, b) == (ini, fin) else fetch_fn(params)
+            self._store(series, a, b, rows, key, self._closed_until(monthly))
+
+        with self._lock:
+            self.gap_requests += len(gaps)
+            if not gaps:
+                self.hits += 1
+            elif gaps == [(ini, fin)]:
+                self.misses += 1
+            else:
+                self.partial += 1
+            cur = self._db.execute(
+                "SELECT payload FROM rows WHERE series = ? AND dia BETWEEN ? AND ? ORDER BY dia, rowid",
+                (series, ini.isoformat(), fin.isoformat()),
+            )
+            return [json.loads(p) for (p,) in cur]
+
+    def _store(
+        self, series: str, a: date, b: date, rows: List[Dict[str, Any]], key: str, closed: date
+    ) -> None:
+        """Reemplaza las filas de [a, b] y marca como guardada la parte definitiva."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute(
+                    "DELETE FROM rows WHERE series = ? AND dia BETWEEN ? AND ?",
+                    (series, a.isoformat(), b.isoformat()),
+                )
+                self._db.executemany(
+                    "INSERT INTO rows VALUES (?, ?, ?)",
+                    ((series, str(r[key])[:10], json.dumps(r)) for r in rows),
+                )
+                if a <= closed:
+                    held = merge_intervals(self._held(series) + [(a, min(b, closed))])
+                    self._db.execute("DELETE FROM held WHERE series = ?", (series,))
+                    self._db.executemany(
+                        "INSERT INTO held VALUES (?, ?, ?)",
+                        ((series, x.isoformat(), y.isoformat()) for x, y in held),
+                    )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    # ------------------------------------------------------------------ #
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM rows")
+            self._db.execute("DELETE FROM held")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Consultas servidas completas (hits), parciales, sin datos locales (misses) y sin
+        caché porque sus filas no traen la columna de fecha (bypassed).
+        """
+        with self._lock:
+            (n_series,) = self._db.execute("SELECT COUNT(DISTINCT series) FROM held").fetchone()
+            return {
+                "hits": self.hits,
+                "partial": self.partial,
+                "misses": self.misses,
+                "gap_requests": self.gap_requests,
+                "bypassed": self.bypassed,
+                "series": n_series,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -3,27 +3,82 @@
 # Purpose: funciones para conectarse e interactuar con la API de Polydata Exógenos
 #          (PDExAPI) de manera sencilla y eficiente.
 # Author:  Fernando Figueroa  |  Equipo Polydata
-# Created: 2025‑07‑06  |  Last Updated: 2026‑02‑16  |  Version: 1.1-debugging
+# Created: 2025‑07‑06  |  Last Updated: 2026‑10‑17  |  Version: 1.1-debugging
 # ======================================================================================
 """Resumen
 -----------
 Funciones y clases auxiliares para:
 • Inicialización de la clase core PDEXClient
 • funciones completas de la API
+• transporte HTTP con pool de conexiones keep-alive (ver PDExAPI_Transport)
+• arranque ligero: numpy/pandas/requests se importan al usarse y el login ocurre en
+  la primera petición salvo `eager_auth=True` (ver PDExAPI_Lazy)
+• reintentos con backoff y circuit breaker en los GET (ver PDExAPI_Retry)
+• limitador de tasa y concurrencia adaptativa AIMD opcionales (ver PDExAPI_Limits)
+• métricas por endpoint: latencia por fase, bytes, filas y hooks (ver PDExAPI_Metrics)
+• compresión negociada (zstd/br/gzip) y formato Arrow/MessagePack opcional con
+  respaldo a JSON (ver PDExAPI_Wire)
+• token compartido entre hilos/procesos con renovación single-flight (ver PDExAPI_Auth)
+• consultas en lote concurrentes (ver PDExAPI_Batch)
+• planificador que une series Copernicus angostas en pocas llamadas amplias
+  (ver PDExAPI_Planner)
+• agregación local diaria → mensual y ciudad → estado/nacional ponderada por población
+  (ver PDExAPI_Aggregate)
+• caché persistente opcional de respuestas (con revalidación ETag/Last-Modified) e
+  incremental por rangos, y memo en memoria de endpoints de referencia (ver PDExAPI_Cache)
+• construcción columnar de DataFrames tipados y esquemas de dtypes por endpoint
+  (ver PDExAPI_Frames)
+• modo streaming (`stream=True`) para rangos históricos enormes
+• paginación transparente (offset/limit o cursor) con páginas en paralelo
+  (ver PDExAPI_Pages)
+• espejo local en Parquet particionado (ver PDExAPI_Mirror)
+• covarianzas en lote apiladas en un ndarray con caché .npy (ver PDExAPI_Covariance)
 -----------
 """
 # --------------------------------------------------------------------------------------
 # Librerias
 # --------------------------------------------------------------------------------------
+from __future__ import annotations
+
 import os
 import sys
 import time
-import requests
-import numpy as np
-import pandas as pd
+import threading
 
+from contextlib import nullcontext
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Literal, overload
+from typing import Any, Callable, Dict, Iterator, List, Optional, Literal, Tuple, overload
+
+from .PDExAPI_Aggregate import aggregate
+from .PDExAPI_Auth import FileTokenStore, TokenManager
+from .PDExAPI_Batch import BatchResult, SingleFlight, date_windows, request_key, run_batch
+from .PDExAPI_Cache import MemoCache, RangeCache, ResponseCache, _MISSING
+from .PDExAPI_Covariance import CovarianceStack, CovarianceStore, decode_matrix
+from .PDExAPI_Frames import (
+    DTYPE_PROFILES,
+    DtypeProfile,
+    apply_schema,
+    frame_from_json,
+    frame_from_records,
+    iter_batches,
+    iter_json_array,
+)
+from .PDExAPI_Lazy import lazy_import
+from .PDExAPI_Limits import RateController, is_congestion
+from .PDExAPI_Metrics import Metrics
+from .PDExAPI_Mirror import ParquetMirror
+from .PDExAPI_Pages import PAGED_PATHS, iter_pages, join_pages, page_params
+from .PDExAPI_Planner import CostModel, QueryPlan, plan_series, split_frames
+from .PDExAPI_Retry import CircuitBreaker, RetryPolicy, RetryRunner
+from .PDExAPI_Wire import JSON_TYPE, WireFormat, accept, decode, decode_frame, sniff
+
+# numpy/pandas solo con as_frame/as_array; requests (vía el transporte) en la primera
+# petición: `import pdexapi` y crear el cliente no cargan ninguno de los tres
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+requests = lazy_import("requests")
+_transport_module = lazy_import(f"{__package__}.PDExAPI_Transport")
 
 
 class PDEXClient:
@@ -40,8 +95,36 @@ class PDEXClient:
     ...     fecha_inicio="2025-08-01", fecha_fin="2025-12-01",
     ...     as_frame=True
     ... )
+
+    El cliente mantiene un pool de conexiones keep-alive; ciérralo con
+    `cli.close()` o úsalo como context manager:
+
+    >>> with PDEXClient("http://localhost:8000", "demo", "tu_password") as cli:
+    ...     cli.dias_festivos()
     """
 
+    # Métodos públicos que corresponden a un endpoint GET de la API
+    _ENDPOINTS = frozenset({
+        "list_tables",
+        "inflacion",
+        "inflacion_prediccion",
+        "fc_clima_mes",
+        "fc_clima_diario",
+        "clima_historico",
+        "clima_historico_nacional",
+        "clima_historico_estado_mes",
+        "fc_clima_mes_estado",
+        "cov_matrix",
+        "copernicus_hourly_grib",
+        "copernicus_historical",
+        "copernicus_historical_latam",
+        "copernicus_forecast",
+        "copernicus_forecast_latam",
+        "poblacion",
+        "turismo",
+        "dias_festivos",
+    })
+
     # ------------------------------------------------------------------ #
     def __init__(
         self,
@@ -50,44 +133,797 @@ class PDEXClient:
         password: str,
         *,
         timeout: int | float = 10,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        cache: ResponseCache | str | Path | None = None,
+        range_cache: RangeCache | str | Path | None = None,
+        columnar: bool = False,
+        dtype_profile: DtypeProfile | None = None,
+        retry: RetryPolicy | bool = True,
+        breaker: CircuitBreaker | bool = True,
+        token_store: FileTokenStore | str | Path | None = None,
+        token_ttl: float = 60 * 60,
+        background_refresh: bool = False,
+        memo: MemoCache | Dict[str, float | None] | bool = False,
+        coalesce: bool = True,
+        limiter: RateController | bool = False,
+        metrics: Metrics | bool = True,
+        compression: bool = True,
+        wire_format: WireFormat = "json",
+        eager_auth: bool = False,
+        page_size: int | None = None,
+        page_workers: int = 4,
     ):
         self.base_url = base_url.rstrip("/")
         self.username = username
         self.password = password
         self.timeout = timeout
-
-        self._token: str | None = None
-        self._exp_ts: float | None = None  # timestamp UNIX (segundos)
-
-        # Autentica inmediatamente
-        self._login()
+        # Si True, as_frame decodifica el JSON directo a columnas tipadas
+        # (fecha → datetime64, geografía/variable → category)
+        self.columnar = columnar
+        # Esquema de dtypes por endpoint para as_frame: "exact" (float64) o
+        # "compact" (float32 en valores climáticos); None conserva pd.DataFrame plano
+        if dtype_profile is not None and dtype_profile not in DTYPE_PROFILES:
+            raise ValueError(f"dtype_profile debe ser uno de {DTYPE_PROFILES}")
+        self.dtype_profile = dtype_profile
+
+        # Latencias por fase, bytes y filas por endpoint (`cli.metrics.add_hook` para exportar)
+        self.metrics: Metrics | None = Metrics() if metrics is True else (metrics or None)
+
+        # Pool keep-alive compartido por _login y _get, creado en la primera petición;
+        # `compression` negocia zstd/br/gzip y `wire_format` pide Arrow/MessagePack
+        # (JSON si el servidor no los ofrece)
+        self._transport_options = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "compression": compression,
+        }
+        self._transport_obj: _transport_module.PDEXTransport | None = None
+        self._transport_lock = threading.Lock()
+        self._closed = False
+        self._accept = accept(wire_format)
+
+        # Paginación de respuestas enormes (None = una sola respuesta, como siempre):
+        # páginas de `page_size` filas, hasta `page_workers` en vuelo a la vez
+        if page_size is not None and page_size < 1:
+            raise ValueError("page_size debe ser >= 1")
+        if page_workers < 1:
+            raise ValueError("page_workers debe ser >= 1")
+        self.page_size = page_size
+        self.page_workers = page_workers
+        self._unpaged: set = set()  # rutas cuyo servidor rechaza limit/offset
+
+        # Reintentos con backoff y circuit breaker para los GET (True = valores por defecto)
+        self._retry = RetryRunner(
+            RetryPolicy() if retry is True else (retry or None),
+            CircuitBreaker() if breaker is True else (breaker or None),
+        )
+
+        # Tasa máxima y concurrencia adaptativa para todos los GET (True = AIMD por
+        # defecto); una misma instancia puede compartirse con otros clientes
+        self._limiter = RateController() if limiter is True else (limiter or None)
+
+        # Caché en disco opcional (una ruta crea una ResponseCache propia)
+        self._owns_cache = isinstance(cache, (str, Path))
+        self._cache = ResponseCache(cache) if self._owns_cache else cache
+        self._owns_range_cache = isinstance(range_cache, (str, Path))
+        self._range_cache = RangeCache(range_cache) if self._owns_range_cache else range_cache
+
+        # GETs idénticos simultáneos comparten una sola petición en vuelo
+        self._flights = SingleFlight() if coalesce else None
+
+        # Memo en memoria de endpoints de referencia (True = rutas y TTL por defecto)
+        if memo is True:
+            memo = MemoCache()
+        elif isinstance(memo, dict):
+            memo = MemoCache(ttl=memo)
+        self._memo: MemoCache | None = memo or None
+
+        # Token compartido por todos los hilos (renovación single-flight); con
+        # `token_store` también entre procesos. Fernet no trae `exp`: se asume
+        # `token_ttl` (TTL del servidor) y se renueva 5 min antes (o al 90 % de su vida si
+        # es más corta).
+        if isinstance(token_store, (str, Path)):
+            token_store = FileTokenStore(token_store)
+        self._tokens = TokenManager(
+            self._login,
+            ttl=token_ttl,
+            store=token_store,
+            store_key=f"{self.base_url}|{username}",
+            background=background_refresh,
+        )
+
+        # Login en la primera petición; `eager_auth` autentica aquí (falla pronto con
+        # credenciales inválidas)
+        if eager_auth:
+            self._tokens.token()
 
     # ------------------------------------------------------------------ #
     # Helpers privados
     # ------------------------------------------------------------------ #
-    def _login(self) -> None:
-        """Obtiene y guarda el token de acceso."""
+    @property
+    def _transport(self) -> _transport_module.PDEXTransport:
+        """Transporte HTTP; se crea (e importa requests) en la primera petición."""
+        t = self._transport_obj
+        if t is None:
+            with self._transport_lock:
+                if self._closed:
+                    raise RuntimeError("El transporte de PDEXClient ya fue cerrado.")
+                if self._transport_obj is None:
+                    self._transport_obj = _transport_module.PDEXTransport(**self._transport_options)
+                t = self._transport_obj
+        return t
+
+    def _login(self) -> Tuple[str, Optional[float]]:
+        """POST a `/token`; devuelve el token y su vida en segundos si el servidor la informa."""
         url = f"{self.base_url}/token"
         data = {"username": self.username, "password": self.password}
-        r = requests.post(url, data=data, timeout=self.timeout)
+        r = self._transport.post(url, data=data, timeout=self.timeout)
         r.raise_for_status()
         payload = r.json()
-        self._token = payload["access_token"]
-        # decode payload["access_token"]? → si fuera JWT podríamos saber exp.
-        # Como es Fernet, usamos TTL de .env (p.ej. 60 min) como aproximación.
-        self._exp_ts = time.time() + 55 * 60  # refrescaremos a los 55 min
+        return payload["access_token"], payload.get("expires_in")
 
     def _headers(self) -> Dict[str, str]:
         """Cabeceras con token; renueva si está a punto de expirar."""
-        if self._exp_ts and time.time() > self._exp_ts:
-            self._login()
-        return {"Authorization": f"Bearer {self._token}"}
+        return {"Authorization": f"Bearer {self._tokens.token()}"}
+
+    def _get(self, path: str, params: Dict[str, Any] | None = None, *, as_frame: bool = False):
+        """GET con cachés; con `as_frame` devuelve `pandas.DataFrame` en vez de JSON."""
+        if self._memo is not None and self._memo.handles(path):
+            hit = self._memo.get(path, params, as_frame)
+            if hit is not _MISSING:
+                return hit
+            value = self._load(path, params, as_frame=as_frame)
+            self._memo.put(path, params, value, as_frame)
+            return value
+        return self._load(path, params, as_frame=as_frame)
+
+    def _load(self, path: str, params: Dict[str, Any] | None = None, *, as_frame: bool = False):
+        """GET a través de la caché por rangos y la caché en disco (sin memo)."""
+        if self._range_cache is not None and self._range_cache.handles(path, params):
+            data = self._range_cache.fetch(
+                path, params, lambda p: self._decode(path, self._fetch(path, p))
+            )
+            out = self._to_frame(data, path) if as_frame else data
+        else:
+            body = self._fetch(path, params)
+            out = self._to_frame(body, path) if as_frame else self._decode(path, body)
+        self._count(path, rows=len(out) if as_frame or isinstance(out, list) else 0)
+        return out
+
+    # ---- Instrumentación ---- #
+    def _timer(self, path: str, phase: str):
+        return self.metrics.timer(path, phase) if self.metrics is not None else nullcontext()
+
+    def _count(self, path: str, **counts: int) -> None:
+        if self.metrics is not None:
+            self.metrics.count(path, **counts)
+
+    def _observe(self, path: str, r: requests.Response, *, streamed: bool) -> None:
+        """Fases de red de un intento: connect (solo si abrió conexión), server, download."""
+        if self.metrics is None:
+            return
+        phases = r.phases
+        if phases["connect"]:
+            self.metrics.observe(path, "connect", phases["connect"])
+        self.metrics.observe(path, "server", phases["server"])
+        if not streamed:
+            self.metrics.observe(path, "download", phases["download"])
+        self.metrics.count(
+            path,
+            requests=1,
+            errors=int(r.status_code >= 400),
+            nbytes=0 if streamed else len(r.content),
+            wire_bytes=0 if streamed else r.raw.tell(),
+        )
+
+    def _metered(self, path: str, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Cronometra la descarga de un cuerpo en streaming (sin contar el consumo)."""
+        spent, nbytes = 0.0, 0
+        it = iter(chunks)
+        try:
+            while True:
+                start = time.perf_counter()
+                chunk = next(it, None)
+                spent += time.perf_counter() - start
+                if chunk is None:
+                    return
+                nbytes += len(chunk)
+                yield chunk
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe(path, "download", spent)
+                self.metrics.count(path, nbytes=nbytes)
+
+    def _decode(self, path: str, body: bytes) -> Any:
+        with self._timer(path, "decode"):
+            return decode(body)  # JSON, o Arrow/MessagePack según los primeros bytes
+
+    def _send(
+        self,
+        path: str,
+        params: Dict[str, Any] | None = None,
+        *,
+        accept: str | None = None,
+        headers: Dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        GET remoto con la política de reintentos y el circuit breaker del cliente.
 
-    def _get(self, path: str, params: Dict[str, Any] | None = None):
+        Un 401 (token revocado o vencido antes de lo previsto) provoca un relogin
+        single-flight y una sola repetición de la petición.
+        """
         url = f"{self.base_url}{path}"
-        r = requests.get(url, params=params, headers=self._headers(), timeout=self.timeout)
+        used: Dict[str, str] = {}
+
+        def get() -> requests.Response:
+            used["token"] = token = self._tokens.token()
+            try:
+                r = self._transport.get(
+                    url,
+                    params=params,
+                    headers={
+                        "Authorization": f"Bearer {token}",
+                        "Accept": accept or self._accept,
+                        **(headers or {}),
+                    },
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except requests.RequestException:
+                self._count(path, requests=1, errors=1)
+                raise
+            self._observe(path, r, streamed=kwargs.get("stream", False))
+            return r
+
+        def send() -> requests.Response:
+            if self._limiter is None:
+                return get()
+            # cada intento ocupa un lugar; el backoff entre intentos no
+            with self._limiter.slot() as out:
+                r = get()
+                out.ok = not is_congestion(r.status_code)
+                return r
+
+        r = self._retry.call(send)
+        if r.status_code == 401:
+            r.close()
+            self._tokens.invalidate(used["token"])
+            r = self._retry.call(send)
+        return r
+
+    def _fetch(self, path: str, params: Dict[str, Any] | None = None) -> bytes:
+        """
+        Cuerpo crudo del GET remoto (pasando por la caché de respuestas si está activa).
+
+        Llamadas concurrentes con la misma ruta y parámetros comparten una sola
+        petición; cada llamador decodifica su propia copia del cuerpo.
+        """
+        if self._cache is not None:
+            body = self._cache.get(path, params)
+            if body is not None:
+                return body
+        if self._flights is None:
+            return self._fetch_remote(path, params)
+        key = (path, request_key(params or {}))
+        return self._flights.do(key, lambda: self._fetch_remote(path, params))
+
+    def _fetch_remote(self, path: str, params: Dict[str, Any] | None = None) -> bytes:
+        pages = self._open_pages(path, params) if self._paged(path) else None
+        if pages is not None:
+            body = join_pages(list(pages))
+            if self._cache is not None:
+                self._cache.put(path, params, body)  # sin validadores: son de una sola página
+            return body
+
+        # GET condicional si la caché tiene una copia vencida con ETag/Last-Modified
+        conditional = self._cache.conditional(path, params) if self._cache is not None else {}
+        r = self._send(path, params, headers=conditional)
+        if r.status_code == 304 and conditional:
+            r.close()
+            body = self._cache.refresh(path, params)
+            if body is not None:
+                return body
+            r = self._send(path, params)  # la entrada se desalojó entre tanto
+        self._raise_for_status(r, path)
+        if self._paged(path):  # rechazó limit/offset pero acepta la consulta sin paginar
+            self._unpaged.add(path)
+        if self._cache is not None:
+            self._cache.put(
+                path,
+                params,
+                r.content,
+                etag=r.headers.get("ETag"),
+                last_modified=r.headers.get("Last-Modified"),
+            )
+        return r.content
+
+    @staticmethod
+    def _raise_for_status(r: requests.Response, path: str) -> None:
+        """
+        `raise_for_status` que además rechaza un 304 que no revalida una copia en caché
+        (GET sin validadores): no trae cuerpo y se guardaría como respuesta vacía.
+        """
+        if r.status_code == 304:
+            r.close()
+            raise requests.HTTPError(
+                f"304 Not Modified sin GET condicional en {path}", response=r
+            )
         r.raise_for_status()
-        return r.json()
+
+    # ---- Paginación ---- #
+    def _paged(self, path: str) -> bool:
+        return self.page_size is not None and path in PAGED_PATHS and path not in self._unpaged
+
+    def _fetch_page(self, path: str, params: Dict[str, Any]) -> Tuple[bytes, Any]:
+        r = self._send(path, params)
+        self._raise_for_status(r, path)
+        return r.content, r.headers
+
+    def _open_pages(self, path: str, params: Dict[str, Any] | None) -> Iterator[bytes] | None:
+        """
+        Pide la primera página (`limit`/`offset=0`) y devuelve el iterador ordenado de
+        cuerpos (ver PDExAPI_Pages); sin cabeceras de paginación, una primera página de
+        exactamente `page_size` filas se sigue por offset hasta una página corta. None
+        si rechaza los parámetros de página (400/422): el llamador repite la consulta
+        sin paginar.
+        """
+        first = self._send(path, page_params(params, self.page_size, offset=0))
+        if first.status_code in (400, 422):
+            first.close()
+            return None
+        first.raise_for_status()
+        return iter_pages(
+            first.content,
+            first.headers,
+            params,
+            self.page_size,
+            lambda p: self._fetch_page(path, p),
+            max_in_flight=self.page_workers,
+        )
+
+    def _to_frame(self, data: bytes | List[Dict[str, Any]], path: str = "") -> pd.DataFrame:
+        """
+        DataFrame a partir del cuerpo crudo o de una lista de registros.
+
+        El esquema de dtypes del endpoint se aplica solo con `dtype_profile`, sea cual
+        sea el formato que eligió el servidor.
+        """
+        binary = isinstance(data, bytes) and sniff(data) != "json"
+        if isinstance(data, bytes) and not binary and not self.columnar:
+            data = self._decode(path, data)
+        with self._timer(path, "frame"):
+            if binary:
+                df = decode_frame(data)  # formatos binarios: columnas ya tipadas
+            elif not self.columnar and self.dtype_profile is None:
+                return pd.DataFrame(data)
+            elif isinstance(data, bytes):
+                df = frame_from_json(data)  # modo columnar: parseo + construcción
+            else:
+                df = frame_from_records(data)
+            if self.dtype_profile is None:
+                return df
+            return apply_schema(df, path, self.dtype_profile)
+
+    def _stream(
+        self,
+        path: str,
+        params: Dict[str, Any] | None = None,
+        *,
+        as_frame: bool = False,
+        chunk_rows: int = 50_000,
+    ) -> Iterator[Any]:
+        """
+        GET en streaming: itera registros (o DataFrames de `chunk_rows` filas con
+        `as_frame`) conforme llegan, sin cargar la respuesta completa en memoria.
+
+        La petición se envía al llamar (los errores HTTP se levantan de inmediato);
+        no pasa por las cachés. Con `page_size` se itera página por página mientras
+        las siguientes se descargan en paralelo.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows debe ser >= 1")
+        pages = self._open_pages(path, params) if self._paged(path) else None
+        if pages is not None:
+            records = chain.from_iterable(self._decode(path, body) for body in pages)
+            return self._rows(path, records, as_frame=as_frame, chunk_rows=chunk_rows,
+                              close=pages.close)
+
+        r = self._send(path, params, stream=True, accept=JSON_TYPE)  # parser incremental JSON
+        try:
+            r.raise_for_status()
+        except requests.HTTPError:
+            r.close()
+            raise
+
+        def close() -> None:
+            r.close()
+            self._count(path, wire_bytes=r.raw.tell())
+
+        records = iter_json_array(self._metered(path, r.iter_content(chunk_size=1 << 16)))
+        return self._rows(path, records, as_frame=as_frame, chunk_rows=chunk_rows, close=close)
+
+    def _rows(
+        self,
+        path: str,
+        records: Iterator[Any],
+        *,
+        as_frame: bool,
+        chunk_rows: int,
+        close: Callable[[], None],
+    ) -> Iterator[Any]:
+        """Registros (o DataFrames de `chunk_rows` filas) de un GET en streaming."""
+        n = 0
+        try:
+            if not as_frame:
+                for n, rec in enumerate(records, 1):
+                    yield rec
+                return
+            for batch in iter_batches(records, chunk_rows):
+                n += len(batch)
+                yield self._to_frame(batch, path)
+        finally:
+            close()
+            self._count(path, rows=n)
+
+    def _get_windowed(
+        self,
+        path: str,
+        params: Dict[str, Any],
+        *,
+        chunk_days: int,
+        max_workers: int = 4,
+        retries: int = 2,
+    ) -> List[Dict[str, Any]]:
+        """
+        Consulta `path` partiendo `fecha_inicio`–`fecha_fin` en ventanas de `chunk_days`.
+
+        Las ventanas se piden en paralelo (a lo más `max_workers`), las fallidas se
+        reintentan de forma individual hasta `retries` veces y el resultado se
+        reensambla en orden cronológico. Las ventanas de `date_windows` no se
+        traslapan (y `chunk_days` no se permite en frecuencia mensual), así que basta
+        concatenarlas: filas idénticas legítimas se conservan.
+        """
+        windows = [
+            {**params, "fecha_inicio": ini, "fecha_fin": fin}
+            for ini, fin in date_windows(params["fecha_inicio"], params["fecha_fin"], chunk_days)
+        ]
+
+        def fetch(**p):
+            return self._get(path, params=p)
+
+        res = run_batch(fetch, windows, max_in_flight=max_workers)
+        for _ in range(retries):
+            if res.ok:
+                break
+            retry = run_batch(fetch, [res.params[k] for k in res.errors], max_in_flight=max_workers)
+            res.results.update(retry.results)
+            res.errors = retry.errors
+        if res.errors:
+            raise next(iter(res.errors.values()))
+
+        return list(chain.from_iterable(res.results[request_key(w)] for w in windows))
+
+    # ------------------------------------------------------------------ #
+    # Ciclo de vida del transporte
+    # ------------------------------------------------------------------ #
+    def transport_stats(self) -> Dict[str, int]:
+        """Peticiones enviadas, conexiones TCP abiertas y reutilizaciones del pool."""
+        if self._transport_obj is None:
+            return {"requests": 0, "connections": 0, "reused": 0}
+        return self._transport_obj.stats()
+
+    def retry_stats(self) -> Dict[str, Any]:
+        """Intentos, reintentos (HTTP/red y timeouts), segundos en backoff y estado del breaker."""
+        return self._retry.stats()
+
+    def limits_stats(self) -> Dict[str, Any]:
+        """Límite de concurrencia actual/pico, reducciones y espera por tasa (vacío si no hay)."""
+        return self._limiter.stats() if self._limiter is not None else {}
+
+    def coalesce_stats(self) -> Dict[str, int]:
+        """Peticiones reales y llamadas que compartieron una petición idéntica en vuelo."""
+        return self._flights.stats() if self._flights is not None else {}
+
+    def memo_stats(self) -> Dict[str, Any]:
+        """Hits, misses y desalojos del memo en memoria (vacío si no está activo)."""
+        return self._memo.stats() if self._memo is not None else {}
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """
+        Hits, revalidaciones (y cuántas respondieron 304), misses, entradas y bytes de la
+        caché en disco (vacío si no hay caché).
+        """
+        return self._cache.stats() if self._cache is not None else {}
+
+    def range_cache_stats(self) -> Dict[str, Any]:
+        """Consultas servidas completas, parciales o sin datos de la caché por rangos."""
+        return self._range_cache.stats() if self._range_cache is not None else {}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Resumen de instrumentación del cliente.
+
+        `endpoints` trae, por ruta, peticiones, errores, bytes, filas y la latencia por
+        fase (connect/server/download/decode/frame: conteo, media, p50/p90/p99, máximo
+        y total en segundos); el resto reúne los contadores de cada componente.
+        """
+        return {
+            "endpoints": self.metrics.stats() if self.metrics is not None else {},
+            "transport": self.transport_stats(),
+            "retry": self.retry_stats(),
+            "limits": self.limits_stats(),
+            "coalesce": self.coalesce_stats(),
+            "memo": self.memo_stats(),
+            "cache": self.cache_stats(),
+            "range_cache": self.range_cache_stats(),
+        }
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Descarta las respuestas guardadas de `endpoint` (nombre del método, ej.
+        "cov_matrix") en el memo y en la caché en disco; sin argumento, de todos.
+        """
+        if endpoint is not None and endpoint not in self._ENDPOINTS:
+            raise ValueError(f"Endpoint desconocido: {endpoint!r}")
+        path = None
+        if endpoint is not None:
+            path = "/tables" if endpoint == "list_tables" else f"/{endpoint}"
+        if self._memo is not None:
+            self._memo.invalidate(path)
+        if self._cache is not None:
+            self._cache.invalidate(path) if path else self._cache.clear()
+
+    def clear_cache(self) -> None:
+        """Vacía todas las cachés locales del cliente (memo, respuestas y rangos)."""
+        self.invalidate()
+        if self._range_cache is not None:
+            self._range_cache.clear()
+
+    def close(self) -> None:
+        """Cierra las conexiones del pool; el cliente no puede usarse después."""
+        self._tokens.close()
+        with self._transport_lock:
+            self._closed = True
+            if self._transport_obj is not None:
+                self._transport_obj.close()
+        if self._owns_cache:
+            self._cache.close()
+        if self._owns_range_cache:
+            self._range_cache.close()
+
+    def __enter__(self) -> "PDEXClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ------------------------------------------------------------------ #
+    # Consultas en lote
+    # ------------------------------------------------------------------ #
+    def fetch_many(
+        self,
+        endpoint: str,
+        params_list: List[Dict[str, Any]],
+        *,
+        max_in_flight: int = 8,
+    ) -> BatchResult:
+        """
+        Ejecuta el mismo endpoint para muchas combinaciones de parámetros en paralelo.
+
+        Parámetros
+        ----------
+        endpoint : str
+            Nombre del método público (ej. "fc_clima_mes", "clima_historico").
+        params_list : list[dict]
+            Argumentos de cada llamada (sin `as_frame`).
+        max_in_flight : int
+            Peticiones simultáneas; conviene que no exceda `pool_maxsize`.
+
+        Returns
+        -------
+        BatchResult
+            `results`/`errors` por petición y `.frame()` con todo concatenado.
+
+        Ejemplo
+        -------
+        >>> res = cli.fetch_many("fc_clima_mes", [
+        ...     {"estado": "Jalisco", "ciudad": "Zapopan", "variable": "maxtemp_c",
+        ...      "fecha_inicio": "2025-08-01", "fecha_fin": "2025-12-01"},
+        ...     ...
+        ... ], max_in_flight=16)
+        >>> df = res.frame()
+        """
+        if endpoint not in self._ENDPOINTS:
+            raise ValueError(f"Endpoint desconocido: {endpoint!r}")
+        return run_batch(getattr(self, endpoint), params_list, max_in_flight=max_in_flight)
+
+    def plan_series(
+        self,
+        endpoint: str,
+        series: List[Dict[str, Any]],
+        *,
+        cost_model: CostModel | None = None,
+        **common: Any,
+    ) -> QueryPlan:
+        """
+        Plan de llamadas para `fetch_series` (sin enviar nada); útil para revisar
+        cuántas llamadas se harán y su costo estimado contra una por serie.
+        """
+        return plan_series(endpoint, series, common, cost_model)
+
+    def fetch_series(
+        self,
+        endpoint: str,
+        series: List[Dict[str, Any]],
+        *,
+        cost_model: CostModel | None = None,
+        max_in_flight: int = 8,
+        **common: Any,
+    ) -> List[pd.DataFrame]:
+        """
+        Muchas series Copernicus (geografía × variable) con el menor número de llamadas.
+
+        El planificador (ver PDExAPI_Planner) decide con `cost_model` si cada grupo se
+        pide serie por serie, por estado o en una sola llamada nacional con todas las
+        variables; las llamadas resultantes se envían en paralelo y sus respuestas se
+        separan localmente en un DataFrame por serie.
+
+        Parámetros
+        ----------
+        endpoint : str
+            "copernicus_historical", "copernicus_forecast" o sus versiones `_latam`.
+        series : list[dict]
+            Por serie, su geografía (`estado`/`ciudad` o `departamento`/`municipio`
+            según `nivel`) y una `variable`; puede sobreescribir cualquier argumento
+            de `common`.
+        cost_model : CostModel, opcional
+            Costo por llamada y por fila, y ciudades por estado.
+        max_in_flight : int
+            Llamadas simultáneas.
+        **common
+            Argumentos compartidos del endpoint (sin `as_frame`).
+
+        Returns
+        -------
+        list[pandas.DataFrame]
+            Un DataFrame por serie, en el orden de `series`.
+
+        Ejemplo
+        -------
+        >>> series = [{"estado": e, "ciudad": c, "variable": v}
+        ...           for e, c in ciudades for v in ("maxtemp_c", "totalprecip_mm")]
+        >>> dfs = cli.fetch_series("copernicus_historical", series, nivel="ciudad",
+        ...                        freq="D", fecha_inicio="2025-01-01",
+        ...                        fecha_fin="2025-06-30")
+        """
+        plan = plan_series(endpoint, series, common, cost_model)
+        fetch = getattr(self, endpoint)
+        res = run_batch(
+            lambda **p: fetch(**p, as_frame=True), plan.calls, max_in_flight=max_in_flight
+        )
+        if res.errors:
+            raise next(iter(res.errors.values()))
+        return split_frames(plan, [res.get(call) for call in plan.calls])
+
+    def aggregate(
+        self,
+        df: pd.DataFrame,
+        *,
+        freq: Literal["D", "M"] = "D",
+        nivel: str = "ciudad",
+        weights: pd.DataFrame | Literal["poblacion"] | None = "poblacion",
+        rules: Dict[str, str] | None = None,
+        fecha_proceso: str | None = None,
+        max_in_flight: int = 8,
+    ) -> pd.DataFrame:
+        """
+        Agrega localmente un DataFrame diario por ciudad (p.ej. de `clima_historico` o
+        `copernicus_historical(freq="D", nivel="ciudad")`) a mensual y/o a nivel
+        estado/nacional, con las definiciones de los endpoints agregados (ver
+        PDExAPI_Aggregate).
+
+        Parámetros
+        ----------
+        freq : "D" | "M"
+            "M" agrega por mes con la regla de cada variable (suma de precipitación,
+            máximo/mínimo de temperaturas extremas, promedio del resto).
+        nivel : str
+            "ciudad", "estado" o "nacional".
+        weights : "poblacion" | DataFrame | None
+            "poblacion" consulta `poblacion()` de cada ciudad de `df` (con memo);
+            un DataFrame con geografía y `poblacion` se usa tal cual; None = promedio
+            simple.
+        rules : dict, opcional
+            Reglas por variable que sobreescriben `PDExAPI_Aggregate.RULES`.
+        fecha_proceso : str, opcional
+            Fecha de la población con `weights="poblacion"`.
+
+        Ejemplo
+        -------
+        >>> diario = cli.clima_historico(estado="Jalisco", ciudad="Zapopan", ...,
+        ...                              as_frame=True)
+        >>> mensual_estado = cli.aggregate(diario, freq="M", nivel="estado")
+        """
+        if isinstance(weights, str):
+            if weights != "poblacion":
+                raise ValueError("weights debe ser 'poblacion', un DataFrame o None")
+            weights = None if nivel == "ciudad" or nivel == "municipio" else self._population(
+                df, fecha_proceso=fecha_proceso, max_in_flight=max_in_flight
+            )
+        return aggregate(df, freq=freq, nivel=nivel, weights=weights, rules=rules)
+
+    def _population(
+        self, df: pd.DataFrame, *, fecha_proceso: str | None, max_in_flight: int
+    ) -> pd.DataFrame:
+        """Población de cada estado/ciudad distinto de `df` (una consulta por geografía)."""
+        if "estado" not in df.columns:
+            raise ValueError(
+                "weights='poblacion' requiere geografía estado/ciudad; pase los pesos como DataFrame"
+            )
+        geo = [c for c in ("estado", "ciudad") if c in df.columns]
+        extra = {"fecha_proceso": fecha_proceso} if fecha_proceso else {}
+        params = [
+            {**dict(zip(geo, map(str, key))), **extra}
+            for key in df[geo].drop_duplicates().itertuples(index=False, name=None)
+        ]
+        res = self.fetch_many("poblacion", params, max_in_flight=max_in_flight)
+        if res.errors:
+            raise next(iter(res.errors.values()))
+        return res.frame()
+
+    def mirror(
+        self,
+        endpoint: str,
+        target: ParquetMirror | str | Path,
+        **params: Any,
+    ) -> Dict[str, int]:
+        """
+        Copia una consulta con `fecha_inicio`/`fecha_fin` a un espejo Parquet local.
+
+        Solo se piden los intervalos que el espejo aún no tiene para esa serie y se
+        anexan como archivos nuevos; los días todavía abiertos no se escriben.
+        Léase después con `ParquetMirror(target).read(endpoint, ...)`.
+
+        Parámetros
+        ----------
+        endpoint : str
+            Nombre del método público (ej. "copernicus_historical", "turismo").
+        target : ParquetMirror | ruta
+            Espejo (o su carpeta raíz).
+        **params
+            Argumentos del método, incluidos `fecha_inicio` y `fecha_fin`.
+
+        Returns
+        -------
+        dict
+            `requests` (intervalos pedidos) y `rows` (filas anexadas).
+
+        Ejemplo
+        -------
+        >>> cli.mirror("copernicus_historical", "~/pdex_mirror", nivel="estado", freq="D",
+        ...            variable=["maxtemp_c", "tp"], fecha_inicio="2015-01-01",
+        ...            fecha_fin="2025-06-30", estado=None, ciudad=None, chunk_days=90)
+        """
+        if endpoint not in self._ENDPOINTS:
+            raise ValueError(f"Endpoint desconocido: {endpoint!r}")
+        if "fecha_inicio" not in params or "fecha_fin" not in params:
+            raise ValueError("mirror requiere fecha_inicio y fecha_fin")
+        owns = isinstance(target, (str, Path))
+        store = ParquetMirror(target) if owns else target
+        method = getattr(self, endpoint)
+        rows = 0
+        try:
+            gaps = store.plan(endpoint, params)
+            for a, b in gaps:
+                window = {**params, "fecha_inicio": a.isoformat(), "fecha_fin": b.isoformat()}
+                data = method(**{**window, "as_frame": False})
+                rows += store.write(endpoint, params, frame_from_records(data), a, b)
+        finally:
+            if owns:
+                store.close()
+        return {"requests": len(gaps), "rows": rows}
 
     # ------------------------------------------------------------------ #
     # Endpoints públicos
@@ -111,8 +947,7 @@ class PDEXClient:
         }
         if fecha_proceso:
             params["fecha_proceso"] = fecha_proceso
-        data = self._get("/inflacion", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/inflacion", params=params, as_frame=as_frame)
     
 
     def inflacion_prediccion(
@@ -129,8 +964,7 @@ class PDEXClient:
         }
         if fecha_proceso:
             params["fecha_proceso"] = fecha_proceso
-        data = self._get("/inflacion_prediccion", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/inflacion_prediccion", params=params, as_frame=as_frame)
 
 
     def fc_clima_mes(
@@ -150,8 +984,7 @@ class PDEXClient:
             "fecha_inicio": fecha_inicio,
             "fecha_fin": fecha_fin,
         }
-        data = self._get("/fc_clima_mes", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/fc_clima_mes", params=params, as_frame=as_frame)
     
 
     def fc_clima_diario(
@@ -171,8 +1004,7 @@ class PDEXClient:
             "fecha_inicio": fecha_inicio,
             "fecha_fin": fecha_fin,
         }
-        data = self._get("/fc_clima_diario", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/fc_clima_diario", params=params, as_frame=as_frame)
 
 
     def clima_historico(
@@ -185,6 +1017,8 @@ class PDEXClient:
         variable: str | None = None,   # ← opcional
         mes: bool = False, 
         as_frame: bool = False,
+        stream: bool = False,
+        chunk_rows: int = 50_000,
     ):
         """
         Devuelve clima diario histórico entre dos fechas.
@@ -198,6 +1032,9 @@ class PDEXClient:
         fecha_inicio, fecha_fin : 'YYYY-MM-DD'
         variable : str | None
             Ej. 'maxtemp_c', 'totalprecip_mm', etc.
+        stream : bool, opcional
+            Si True, devuelve un iterador de registros (o de DataFrames de
+            `chunk_rows` filas con `as_frame`) en lugar de la respuesta completa.
         """
         params = {
             "estado": estado,
@@ -209,8 +1046,9 @@ class PDEXClient:
         if variable:
             params["variable"] = variable
 
-        data = self._get("/clima_historico", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        if stream:
+            return self._stream("/clima_historico", params, as_frame=as_frame, chunk_rows=chunk_rows)
+        return self._get("/clima_historico", params=params, as_frame=as_frame)
 
 
     def clima_historico_nacional(
@@ -221,6 +1059,8 @@ class PDEXClient:
         variable: str | None = None,   # ← opcional
         mes: bool = False,
         as_frame: bool = False,
+        stream: bool = False,
+        chunk_rows: int = 50_000,
     ):
         """
         Clima histórico de TODO el país entre `fecha_inicio` y `fecha_fin`
@@ -231,6 +1071,9 @@ class PDEXClient:
         fecha_inicio, fecha_fin : 'YYYY-MM-DD'
         as_frame : bool, opcional
             Si True, devuelve `pandas.DataFrame`; si False, lista de dicts.
+        stream : bool, opcional
+            Si True, devuelve un iterador de registros (o de DataFrames de
+            `chunk_rows` filas con `as_frame`) en lugar de la respuesta completa.
         """
         params = {
             "fecha_inicio": fecha_inicio,
@@ -240,8 +1083,11 @@ class PDEXClient:
         if variable:
             params["variable"] = variable
 
-        data = self._get("/clima_historico_nacional", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        if stream:
+            return self._stream(
+                "/clima_historico_nacional", params, as_frame=as_frame, chunk_rows=chunk_rows
+            )
+        return self._get("/clima_historico_nacional", params=params, as_frame=as_frame)
 
 
     def clima_historico_estado_mes(
@@ -260,8 +1106,7 @@ class PDEXClient:
         }
         if variable:
             params["variable"] = variable
-        data = self._get("/clima_historico_estado_mes", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/clima_historico_estado_mes", params=params, as_frame=as_frame)
     
 
     def fc_clima_mes_estado(
@@ -296,8 +1141,7 @@ class PDEXClient:
             "fecha_fin": fecha_fin,
         }
 
-        data = self._get("/fc_clima_mes_estado", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/fc_clima_mes_estado", params=params, as_frame=as_frame)
 
     def cov_matrix(
         self,
@@ -352,6 +1196,82 @@ class PDEXClient:
         return data
 
 
+    def cov_matrices(
+        self,
+        *,
+        fecha_modelo: str | List[str],
+        forecast_horizon: int,
+        variable: str | List[str],
+        estado: str | None | List[str | None] = None,
+        max_in_flight: int = 8,
+        store: CovarianceStore | str | Path | None = None,
+    ) -> CovarianceStack:
+        """
+        Matrices de covarianza para todas las combinaciones de `fecha_modelo`,
+        `variable` y `estado`, apiladas en un solo arreglo.
+
+        Cada respuesta se decodifica directo a su rebanada de un buffer float64
+        preasignado de forma (n_series, h, h); las peticiones van en paralelo
+        (a lo más `max_in_flight`).
+
+        Parámetros
+        ----------
+        fecha_modelo, variable, estado : str | list
+            Valores o listas de valores; `None` en `estado` es "Nacional".
+        store : CovarianceStore | ruta, opcional
+            Caché `.npy` (memory-map) en disco; las llaves ya guardadas no se piden.
+
+        Returns
+        -------
+        CovarianceStack
+            `.array` (n_series, h, h) y `.index` (fecha_modelo, variable, estado).
+
+        Ejemplo
+        -------
+        >>> S = cli.cov_matrices(fecha_modelo=["2025-05-01", "2025-06-01"],
+        ...                      forecast_horizon=12, variable="avgtemp_c",
+        ...                      estado=["Jalisco", "Nuevo León"], store="~/.cache/pdex_cov")
+        >>> S.array.shape
+        (4, 12, 12)
+        >>> S.get("2025-06-01", "avgtemp_c", "Jalisco")
+        """
+        def as_list(v) -> List[Any]:
+            return list(v) if isinstance(v, (list, tuple)) else [v]
+
+        keys = list(dict.fromkeys(
+            (f, v, e)
+            for f in as_list(fecha_modelo)
+            for v in as_list(variable)
+            for e in as_list(estado)
+        ))
+        if isinstance(store, (str, Path)):
+            store = CovarianceStore(store)
+
+        h = forecast_horizon
+        out = np.empty((len(keys), h, h), dtype=np.float64)
+
+        def params_of(key) -> Dict[str, Any]:
+            f, v, e = key
+            p: Dict[str, Any] = {"fecha_modelo": f, "forecast_horizon": h, "variable": v}
+            if e:
+                p["estado"] = e
+            return p
+
+        def fill(i: int) -> None:
+            params = params_of(keys[i])
+            saved = store.load(params) if store is not None else None
+            if saved is not None and saved.shape == (h, h):
+                out[i] = saved
+                return
+            decode_matrix(self._fetch("/cov_matrix", params), out[i])
+            if store is not None:
+                store.save(params, out[i])
+
+        res = run_batch(fill, [{"i": i} for i in range(len(keys))], max_in_flight=max_in_flight)
+        if res.errors:
+            raise next(iter(res.errors.values()))
+        return CovarianceStack(out, keys)
+
     # ------------------------------------------------------------------ #
     # Copernicus GRIB Hourly
     # ------------------------------------------------------------------ #
@@ -363,7 +1283,11 @@ class PDEXClient:
         variable,
         estado: str | None = None,
         ciudad: str | None = None,
+        chunk_days: int | None = None,
+        max_workers: int = 4,
         as_frame: bool = False,
+        stream: bool = False,
+        chunk_rows: int = 50_000,
     ):
         """
         Consulta GRIB horario directamente desde archivos ERA5.
@@ -373,6 +1297,13 @@ class PDEXClient:
         fecha_inicio, fecha_fin : str (YYYY-MM-DD)
         variable : str | list[str]
         estado, ciudad : opcionales
+        chunk_days : int, opcional
+            Si se indica, el rango se consulta en ventanas de N días (1 = día por día)
+            en paralelo con `max_workers` hilos y se reensambla en orden; evita el
+            timeout del servidor en rangos amplios.
+        stream : bool, opcional
+            Si True, devuelve un iterador de registros (o de DataFrames de
+            `chunk_rows` filas con `as_frame`) en lugar de la respuesta completa.
         """
         params: Dict[str, Any] = {
             "fecha_inicio": fecha_inicio,
@@ -384,8 +1315,16 @@ class PDEXClient:
         if ciudad:
             params["ciudad"] = ciudad
 
-        data = self._get("/copernicus_hourly_grib", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        if stream:
+            if chunk_days:
+                raise ValueError("stream y chunk_days son excluyentes")
+            return self._stream("/copernicus_hourly_grib", params, as_frame=as_frame, chunk_rows=chunk_rows)
+        if chunk_days:
+            data = self._get_windowed(
+                "/copernicus_hourly_grib", params, chunk_days=chunk_days, max_workers=max_workers
+            )
+            return self._to_frame(data, "/copernicus_hourly_grib") if as_frame else data
+        return self._get("/copernicus_hourly_grib", params=params, as_frame=as_frame)
 
 
     # ------------------------------------------------------------------ #
@@ -401,11 +1340,21 @@ class PDEXClient:
         fecha_fin: str,
         estado: str | None = None,
         ciudad: str | None = None,
+        chunk_days: int | None = None,
+        max_workers: int = 4,
         as_frame: bool = False,
+        stream: bool = False,
+        chunk_rows: int = 50_000,
     ):
         """
-        Consulta Copernicus histórico nivel ciudad/estado en frecuencia D/M.
+        Consulta Copernicus histórico nivel ciudad/estado en frecuencia H/D/M.
+
+        • `chunk_days` parte el rango en ventanas paralelas (ver
+          `copernicus_hourly_grib`); solo aplica a freq "H" y "D".
+        • `stream=True` itera los registros conforme llegan (ver `clima_historico`).
         """
+        if chunk_days and freq == "M":
+            raise ValueError("chunk_days no aplica a freq='M' (partiría agregados mensuales)")
 
         params: Dict[str, Any] = {
             "nivel": nivel,
@@ -419,8 +1368,16 @@ class PDEXClient:
         if ciudad:
             params["ciudad"] = ciudad
 
-        data = self._get("/copernicus_historical", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        if stream:
+            if chunk_days:
+                raise ValueError("stream y chunk_days son excluyentes")
+            return self._stream("/copernicus_historical", params, as_frame=as_frame, chunk_rows=chunk_rows)
+        if chunk_days:
+            data = self._get_windowed(
+                "/copernicus_historical", params, chunk_days=chunk_days, max_workers=max_workers
+            )
+            return self._to_frame(data, "/copernicus_historical") if as_frame else data
+        return self._get("/copernicus_historical", params=params, as_frame=as_frame)
     
     # ------------------------------------------------------------------ #
 
@@ -436,9 +1393,13 @@ class PDEXClient:
         departamento: str | None = None,
         municipio: str | None = None,
         as_frame: bool = False,
+        stream: bool = False,
+        chunk_rows: int = 50_000,
     ):
         """
         Consulta Copernicus histórico nivel ciudad/estado en frecuencia D/M.
+
+        • `stream=True` itera los registros conforme llegan (ver `clima_historico`).
         """
 
         params: Dict[str, Any] = {
@@ -454,8 +1415,11 @@ class PDEXClient:
         if municipio:
             params["municipio"] = municipio
 
-        data = self._get("/copernicus_historical_latam", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        if stream:
+            return self._stream(
+                "/copernicus_historical_latam", params, as_frame=as_frame, chunk_rows=chunk_rows
+            )
+        return self._get("/copernicus_historical_latam", params=params, as_frame=as_frame)
 
 
     # ------------------------------------------------------------------ #
@@ -499,8 +1463,7 @@ class PDEXClient:
         if ciudad:
             params["ciudad"] = ciudad
 
-        data = self._get("/copernicus_forecast", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/copernicus_forecast", params=params, as_frame=as_frame)
     
 
     def copernicus_forecast_latam(
@@ -543,8 +1506,7 @@ class PDEXClient:
         if municipio:
             params["municipio"] = municipio
 
-        data = self._get("/copernicus_forecast_latam", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/copernicus_forecast_latam", params=params, as_frame=as_frame)
     
 
     def poblacion(
@@ -567,8 +1529,7 @@ class PDEXClient:
         if fecha_proceso:
             params["fecha_proceso"] = fecha_proceso
 
-        data = self._get("/poblacion", params=params)
-        return pd.DataFrame(data) if as_frame else data 
+        return self._get("/poblacion", params=params, as_frame=as_frame)
     
 
     def turismo(
@@ -597,8 +1558,7 @@ class PDEXClient:
             "fecha_fin": fecha_fin,
         }
 
-        data = self._get("/turismo", params=params)
-        return pd.DataFrame(data) if as_frame else data
+        return self._get("/turismo", params=params, as_frame=as_frame)
     
 
     def dias_festivos(
@@ -615,5 +1575,4 @@ class PDEXClient:
         """
         params = {}
 
-        data = self._get("/dias_festivos", params=params)
-        return pd.DataFrame(data) if as_frame else data
\ No newline at end of file
+        return self._get("/dias_festivos", params=params, as_frame=as_frame)
\ No newline at end of file
@@ -0,0 +1,142 @@
+# ======================================================================================
+# Script:  PDExAPI_Covariance.py
+# Purpose: recuperación en lote de matrices de covarianza SARIMA apiladas en un ndarray
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `decode_matrix`: decodifica el cuerpo JSON `[[...], ...]` de `/cov_matrix` directo a un
+  buffer float64 preasignado (sin listas anidadas intermedias).
+• `CovarianceStack`: arreglo (n_series, h, h) + índice de llaves (fecha_modelo, variable,
+  estado) con acceso por llave.
+• `CovarianceStore`: caché en disco de matrices como archivos `.npy` que se leen con
+  memory-map, reutilizable entre corridas y procesos.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import os
+import threading
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .PDExAPI_Cache import cache_key
+from .PDExAPI_Lazy import lazy_import
+from .PDExAPI_Wire import decode
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+KEY_NAMES = ("fecha_modelo", "variable", "estado")
+
+CovKey = Tuple[str, str, Optional[str]]
+
+
+def decode_matrix(body: bytes, out: np.ndarray) -> np.ndarray:
+    """
+    Llena `out` (h × h, float64) con la matriz JSON de `body` y lo devuelve.
+
+    El texto se lee de una sola pasada en C; si trae `null`/`NaN`, no tiene la forma
+    esperada o no es JSON (Arrow/MessagePack), se usa `PDExAPI_Wire.decode` como respaldo.
+    """
+    h = out.shape[0]
+    text = body.translate(None, b"[] \n\r\t")
+    if text and not text.translate(None, b"0123456789.eE+-,") and body.count(b"[") == h + 1:
+        values = np.fromstring(text.decode(), dtype=np.float64, sep=",")
+        if values.size == h * h:
+            out.reshape(-1)[:] = values
+            return out
+    data = np.asarray(decode(body), dtype=np.float64)  # JSON con null/NaN o MessagePack
+    if data.shape != (h, h):
+        raise ValueError(f"Matriz de forma {data.shape}, se esperaba {(h, h)}")
+    out[...] = data
+    return out
+
+
+class CovarianceStack:
+    """
+    Matrices de covarianza apiladas.
+
+    Atributos
+    ---------
+    array : np.ndarray
+        Arreglo float64 de forma (n_series, h, h).
+    index : pd.MultiIndex
+        Llave (fecha_modelo, variable, estado) de cada posición del primer eje.
+    """
+
+    def __init__(self, array: np.ndarray, keys: List[CovKey]):
+        self.array = array
+        self.index = pd.MultiIndex.from_tuples(keys, names=list(KEY_NAMES))
+        self._pos = {k: i for i, k in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self.array)
+
+    def __repr__(self) -> str:
+        n, h, _ = self.array.shape
+        return f"CovarianceStack(n_series={n}, h={h})"
+
+    @property
+    def keys(self) -> List[CovKey]:
+        return list(self.index)
+
+    def get(self, fecha_modelo: str, variable: str, estado: str | None = None) -> np.ndarray:
+        """Matriz h × h de una llave (vista sobre `array`, sin copia)."""
+        return self.array[self._pos[(fecha_modelo, variable, estado)]]
+
+
+class CovarianceStore:
+    """
+    Caché en disco de matrices de covarianza (un `.npy` por llave).
+
+    Parámetros
+    ----------
+    directory : str | Path
+        Carpeta de los archivos; puede compartirse entre corridas y procesos.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"CovarianceStore({str(self.directory)!r})"
+
+    def _file(self, params: Dict[str, Any]) -> Path:
+        return self.directory / f"{cache_key('/cov_matrix', params)}.npy"
+
+    def load(self, params: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Matriz guardada como memmap de solo lectura, o None."""
+        try:
+            arr = np.load(self._file(params), mmap_mode="r")
+        except (ValueError, OSError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return arr
+
+    def save(self, params: Dict[str, Any], matrix: np.ndarray) -> None:
+        """Guarda la matriz con escritura atómica."""
+        path = self._file(params)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npy")
+        np.save(tmp, np.ascontiguousarray(matrix, dtype=np.float64))
+        os.replace(tmp, path)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "files": sum(1 for _ in self.directory.glob("*.npy")),
+        }
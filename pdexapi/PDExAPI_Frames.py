@@ -0,0 +1,359 @@
+# ======================================================================================
+# Script:  PDExAPI_Frames.py
+# Purpose: construcción columnar de DataFrames a partir de respuestas JSON de PDExAPI
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+Las respuestas tabulares de la API son arreglos JSON de registros planos con las mismas
+llaves. `frame_from_json` las lee directamente a columnas sin crear la lista intermedia
+de dicts, con geografía y variable como `category` y fechas como `datetime64`:
+
+1. Sin escapes (`\\`) en el cuerpo: se reescribe como CSV (`":` → `",`, `},{` → salto de
+   línea) y se lee con el parser C de pandas. Los nombres de llave quedan como columnas
+   intercaladas que se verifican y descartan, así que un orden de llaves distinto entre
+   registros se detecta.
+2. Con escapes: cada columna se extrae con una pasada de regex en C y se convierte con
+   `astype`/factorización (solo se decodifican los valores únicos).
+3. Si el cuerpo no cumple la forma esperada (objetos anidados, llaves faltantes, etc.) se
+   usa el camino tradicional `pd.DataFrame(json.loads(body))` con la misma tipificación.
+
+`apply_schema` aplica el esquema de dtypes del endpoint según el perfil: "exact" conserva
+float64 y "compact" baja a float32 los valores climáticos.
+
+`iter_json_array` decodifica un arreglo JSON de forma incremental a partir de bloques de
+bytes, para procesar respuestas enormes con memoria acotada.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import re
+
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Literal
+
+from .PDExAPI_Lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+# Columnas de texto con pocos valores distintos → dtype category
+CATEGORY_COLUMNS = frozenset({
+    "estado",
+    "ciudad",
+    "pais",
+    "departamento",
+    "municipio",
+    "variable",
+    "nivel",
+})
+
+# Endpoints cuyos valores numéricos son variables climáticas (float32 en perfil compacto)
+CLIMATE_PATHS = frozenset({
+    "/clima_historico",
+    "/clima_historico_nacional",
+    "/clima_historico_estado_mes",
+    "/fc_clima_mes",
+    "/fc_clima_mes_estado",
+    "/fc_clima_diario",
+    "/copernicus_historical",
+    "/copernicus_historical_latam",
+    "/copernicus_hourly_grib",
+    "/copernicus_forecast",
+    "/copernicus_forecast_latam",
+})
+
+# Columnas numéricas que nunca se compactan (coordenadas, conteos, pesos)
+EXACT_COLUMNS = frozenset({"lat", "lon", "latitud", "longitud", "poblacion", "peso", "anio", "mes"})
+
+# Esquemas explícitos por endpoint; las columnas no listadas siguen las reglas por nombre
+SCHEMAS: Dict[str, Dict[str, str]] = {
+    "/inflacion": {"fecha": "date"},
+    "/inflacion_prediccion": {"fecha": "date"},
+    "/dias_festivos": {"fecha": "date"},
+    "/poblacion": {"estado": "category", "ciudad": "category", "poblacion": "int64"},
+    "/turismo": {"fecha": "date", "estado": "category"},
+}
+
+DTYPE_PROFILES = ("exact", "compact")
+DtypeProfile = Literal["exact", "compact"]
+
+# Valor JSON escalar: string (con escapes) o literal (número, true, false, null)
+_VALUE = rb'("[^"\\]*(?:\\.[^"\\]*)*"|[^,}\]\s]+)'
+_FLOAT_CHARS = re.compile(rb"[.eEnNI]")  # '.', exponente, null/NaN/Infinity
+
+
+def is_date_column(name: str) -> bool:
+    return name == "fecha" or name.startswith("fecha_")
+
+
+class _NotColumnar(ValueError):
+    """El cuerpo no es un arreglo de registros planos homogéneos."""
+
+
+def _first_record(body: bytes) -> Dict[str, Any]:
+    start = body.find(b"{")
+    end = body.find(b"}", start)
+    if start < 0 or end < 0 or body[:start].strip() != b"[":
+        raise _NotColumnar
+    rec = json.loads(body[start:end + 1])
+    if any(isinstance(v, (dict, list)) for v in rec.values()):
+        raise _NotColumnar
+    return rec
+
+
+def _text_column(name: str, tokens: List[bytes]):
+    codes, uniq = pd.factorize(np.array(tokens, dtype=object))
+    values = [json.loads(u) for u in uniq]
+    if is_date_column(name):
+        try:
+            return pd.to_datetime(pd.Index(values, dtype=object), format="ISO8601")[codes]
+        except (ValueError, TypeError):
+            pass
+    if name in CATEGORY_COLUMNS and None not in values:
+        return pd.Categorical.from_codes(codes, values)
+    return np.array(values, dtype=object)[codes]
+
+
+def _literal_column(tokens: List[bytes]) -> np.ndarray:
+    arr = np.array(tokens)
+    uniq = np.unique(arr).tolist()
+    if set(uniq) <= {b"true", b"false"}:
+        return arr == b"true"
+    if not any(_FLOAT_CHARS.search(t) for t in uniq):
+        return arr.astype(np.int64)
+    arr[arr == b"null"] = b"nan"
+    return arr.astype(np.float64)
+
+
+def _columns_via_csv(body: bytes, first: Dict[str, Any], n_rows: int) -> pd.DataFrame:
+    """Camino 1: reescritura a CSV y parser C de pandas (requiere cuerpo sin escapes)."""
+    text = body.strip()
+    if not (text.startswith(b"[{") and text.endswith(b"}]")) or text.count(b"},{") != n_rows - 1:
+        raise _NotColumnar
+    csv = text[2:-2].replace(b'":', b'",').replace(b"},{", b"\n")
+    keys = list(first)
+    text_cols = {2 * i + 1 for i, k in enumerate(keys) if isinstance(first[k], str)}
+    dtype = {2 * i: "category" for i in range(len(keys))}  # nombres de llave
+    dtype.update({
+        2 * i + 1: "category"
+        for i, k in enumerate(keys)
+        if 2 * i + 1 in text_cols and (k in CATEGORY_COLUMNS or is_date_column(k))
+    })
+    raw = pd.read_csv(
+        io.BytesIO(csv),
+        header=None,
+        names=list(range(2 * len(keys))),
+        dtype=dtype,
+        quotechar='"',
+        skipinitialspace=True,
+        na_values=["null"],
+        keep_default_na=False,
+        true_values=["true"],
+        false_values=["false"],
+        float_precision="round_trip",
+        engine="c",
+    )
+    del csv
+    if len(raw) != n_rows:
+        raise _NotColumnar
+    columns: Dict[str, Any] = {}
+    for i, name in enumerate(keys):
+        if list(raw[2 * i].cat.categories) != [name]:
+            raise _NotColumnar  # orden de llaves distinto entre registros
+        col = raw[2 * i + 1]
+        is_text = 2 * i + 1 in text_cols
+        if is_text == pd.api.types.is_numeric_dtype(col):
+            raise _NotColumnar  # tipos mezclados: que decida el camino genérico
+        if is_text and is_date_column(name):
+            try:
+                # se parsean solo las categorías; con la caché de pandas, to_datetime
+                # sobre la columna completa devuelve otra categoría en tablas grandes
+                dates = pd.to_datetime(col.cat.categories, format="ISO8601")
+                col = col.cat.rename_categories(dates).astype(dates.dtype)
+            except (ValueError, TypeError):
+                col = col.astype(str)
+        columns[name] = col
+    return pd.DataFrame(columns, copy=False)
+
+
+def _columns_via_regex(body: bytes, first: Dict[str, Any], n_rows: int) -> pd.DataFrame:
+    """Camino 2: una pasada de regex por columna (soporta escapes JSON)."""
+    columns: Dict[str, Any] = {}
+    for name in first:
+        pat = re.compile(rb'"' + re.escape(name.encode()) + rb'"\s*:\s*' + _VALUE)
+        tokens = pat.findall(body)
+        if len(tokens) != n_rows:
+            raise _NotColumnar
+        if any(t[:1] == b'"' for t in tokens):
+            columns[name] = _text_column(name, tokens)
+        else:
+            columns[name] = _literal_column(tokens)
+        del tokens
+    return pd.DataFrame(columns, copy=False)
+
+
+def frame_from_json(body: bytes) -> pd.DataFrame:
+    """
+    DataFrame tipado a partir del cuerpo JSON de una respuesta tabular.
+
+    Parámetros
+    ----------
+    body : bytes
+        Cuerpo crudo (arreglo JSON de registros planos).
+    """
+    try:
+        first = _first_record(body)
+        n_rows = body.count(b"{")
+        if body.count(b'":') != n_rows * len(first):
+            raise _NotColumnar  # registros con llaves distintas a las del primero
+        if b"\\" not in body:
+            try:
+                return _columns_via_csv(body, first, n_rows)
+            except (_NotColumnar, ValueError):
+                pass
+        return _columns_via_regex(body, first, n_rows)
+    except (_NotColumnar, ValueError):
+        data = json.loads(body)
+        return frame_from_records(data) if isinstance(data, list) else pd.DataFrame(data)
+
+
+def frame_from_records(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Camino tradicional (lista de dicts) con la misma tipificación que `frame_from_json`."""
+    df = pd.DataFrame(rows)
+    for name in df.columns:
+        col = df[name]
+        if is_date_column(name) and not pd.api.types.is_datetime64_any_dtype(col):
+            try:
+                df[name] = pd.to_datetime(col, format="ISO8601")
+            except (ValueError, TypeError):
+                pass
+        elif name in CATEGORY_COLUMNS and not col.isna().any():
+            df[name] = col.astype("category")
+    return df
+
+
+def schema_for(path: str, df: pd.DataFrame, profile: DtypeProfile = "exact") -> Dict[str, str]:
+    """
+    Dtype destino por columna de `df` para el endpoint `path`.
+
+    Tipos: "date" (datetime64), "category", o un dtype numérico de numpy.
+    """
+    if profile not in DTYPE_PROFILES:
+        raise ValueError(f"dtype_profile debe ser uno de {DTYPE_PROFILES}, no {profile!r}")
+    explicit = SCHEMAS.get(path, {})
+    out: Dict[str, str] = {}
+    for name in df.columns:
+        if name in explicit:
+            out[name] = explicit[name]
+        elif is_date_column(name):
+            out[name] = "date"
+        elif name in CATEGORY_COLUMNS:
+            out[name] = "category"
+        elif (
+            profile == "compact"
+            and path in CLIMATE_PATHS
+            and name not in EXACT_COLUMNS
+            and pd.api.types.is_float_dtype(df[name])
+        ):
+            out[name] = "float32"
+    return out
+
+
+def apply_schema(df: pd.DataFrame, path: str, profile: DtypeProfile = "exact") -> pd.DataFrame:
+    """
+    Convierte en sitio las columnas de `df` al esquema del endpoint.
+
+    Las conversiones que no aplican (fechas no parseables, enteros con nulos,
+    categorías con nulos) dejan la columna como está.
+    """
+    for name, kind in schema_for(path, df, profile).items():
+        col = df[name]
+        try:
+            if kind == "date":
+                if not pd.api.types.is_datetime64_any_dtype(col):
+                    df[name] = pd.to_datetime(col, format="ISO8601")
+            elif kind == "category":
+                if not isinstance(col.dtype, pd.CategoricalDtype) and not col.isna().any():
+                    df[name] = col.astype("category")
+            elif col.dtype != kind:
+                df[name] = col.astype(kind)
+        except (ValueError, TypeError):
+            pass
+    return df
+
+
+# --------------------------------------------------------------------------------------
+# Lectura incremental
+# --------------------------------------------------------------------------------------
+_WS = re.compile(r"\s*")
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Produce uno a uno los elementos de un arreglo JSON recibido en bloques de bytes.
+
+    Solo mantiene en memoria el bloque actual y el elemento en decodificación.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    source = iter(chunks)
+    buf, pos, eof = "", 0, False
+    state = "start"  # start → '[' ; first → valor o ']' ; value → valor ; sep → ',' o ']'
+
+    def refill() -> None:
+        nonlocal buf, pos, eof
+        chunk = next(source, None)
+        eof = chunk is None
+        buf = buf[pos:] + utf8.decode(chunk or b"", final=eof)
+        pos = 0
+
+    while True:
+        pos = _WS.match(buf, pos).end()
+        if pos >= len(buf):
+            if eof:
+                raise ValueError("Respuesta JSON incompleta")
+            refill()
+            continue
+        ch = buf[pos]
+        if state == "start":
+            if ch != "[":
+                raise ValueError("Se esperaba un arreglo JSON")
+            pos += 1
+            state = "first"
+        elif ch == "]" and state in ("first", "sep"):
+            return
+        elif ch == "," and state == "sep":
+            pos += 1
+            state = "value"
+        elif state in ("first", "value"):
+            try:
+                obj, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                refill()
+                continue
+            if not eof and (end == len(buf) or buf[end] not in ",] \t\r\n"):
+                refill()  # un número al final del bloque podría estar cortado
+                continue
+            pos = end
+            state = "sep"
+            yield obj
+        else:
+            raise ValueError(f"JSON inesperado en la posición {pos}: {ch!r}")
+
+
+def iter_batches(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Agrupa un iterable en listas de a lo más `size` elementos."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
@@ -0,0 +1,66 @@
+# ======================================================================================
+# Script:  PDExAPI_Lazy.py
+# Purpose: importación diferida de dependencias pesadas (numpy, pandas, requests, pyarrow)
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `lazy_import("pandas")` devuelve un módulo sustituto que importa el real en el primer
+  acceso a un atributo (`pd.DataFrame`); hasta entonces `import pdexapi` no paga su
+  tiempo de carga. Tras el primer acceso copia el espacio de nombres del módulo real,
+  así que los accesos siguientes cuestan lo mismo que con un import normal.
+• `optional=True` reproduce el patrón `try: import x except ImportError: x = None`
+  sin importar: devuelve None si el paquete no está instalado.
+• `is_loaded(pd)` indica si el módulo ya se importó (p.ej. para `isinstance` sin
+  forzar la carga: un objeto no puede ser un DataFrame si pandas nunca se importó).
+• Los módulos que lo usan declaran `from __future__ import annotations` para que las
+  anotaciones `-> pd.DataFrame` no disparen la importación.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+import importlib
+import importlib.util
+import sys
+import types
+
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """Sustituto de un módulo que lo importa en el primer acceso a un atributo."""
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)  # accesos siguientes sin indirección
+        return getattr(module, attr)
+
+    def __dir__(self):
+        return dir(importlib.import_module(self.__name__))
+
+    def __repr__(self) -> str:
+        state = "cargado" if is_loaded(self) else "diferido"
+        return f"<módulo {self.__name__!r} ({state})>"
+
+
+def lazy_import(name: str, *, optional: bool = False) -> LazyModule | None:
+    """
+    Módulo `name` importado en el primer uso.
+
+    Con `optional=True` devuelve None si el paquete raíz no está instalado (se consulta
+    el buscador de módulos, sin ejecutar el paquete).
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if optional and importlib.util.find_spec(name.partition(".")[0]) is None:
+        return None
+    return LazyModule(name)
+
+
+def is_loaded(module: types.ModuleType | str) -> bool:
+    """True si el módulo (o su nombre) ya se importó en este proceso."""
+    name = module if isinstance(module, str) else module.__name__
+    return name in sys.modules
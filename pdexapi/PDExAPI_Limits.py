@@ -0,0 +1,279 @@
+# ======================================================================================
+# Script:  PDExAPI_Limits.py
+# Purpose: limitador de tasa y control adaptativo de concurrencia para peticiones a PDExAPI
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `TokenBucket`: a lo más `rate` peticiones por segundo con ráfagas de hasta `burst`.
+• `AdaptiveLimit`: límite de peticiones simultáneas tipo AIMD. Cada respuesta rápida y
+  exitosa suma `1/limit` (≈ +1 por ronda); un error (429, 5xx, timeout) o una latencia
+  muy por encima de la habitual lo multiplica por `backoff` (una vez por
+  ventana). Así el límite se asienta cerca de la capacidad real del servidor.
+• `RateController`: combina ambos; una misma instancia se comparte entre hilos
+  (`slot`) y corrutinas (`aslot`), p.ej. entre `PDEXClient`, `fetch_many` y
+  `AsyncPDEXClient`.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+import threading
+import time
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from .PDExAPI_Lazy import lazy_import
+
+asyncio = lazy_import("asyncio")  # solo lo usan los métodos async
+
+
+# --------------------------------------------------------------------------------------
+# Token bucket
+# --------------------------------------------------------------------------------------
+class TokenBucket:
+    """
+    Limitador de tasa por token bucket, seguro entre hilos.
+
+    Parámetros
+    ----------
+    rate : float
+        Tokens (peticiones) repuestos por segundo.
+    burst : float, opcional
+        Capacidad del bucket; por defecto `rate` (un segundo de ráfaga).
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate debe ser > 0")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited = 0.0
+
+    def reserve(self) -> float:
+        """Toma un token (puede quedar a deber) y devuelve cuántos segundos esperar."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.waited += wait
+            return wait
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+
+# --------------------------------------------------------------------------------------
+# Concurrencia adaptativa (AIMD)
+# --------------------------------------------------------------------------------------
+class AdaptiveLimit:
+    """
+    Límite de concurrencia AIMD guiado por latencia y errores.
+
+    Parámetros
+    ----------
+    initial, min_limit, max_limit : float
+        Límite inicial y rango permitido.
+    backoff : float
+        Factor multiplicativo ante congestión (0.5 = reducir a la mitad).
+    tolerance : float
+        Una respuesta más lenta que `tolerance` × latencia base (promedio móvil lento)
+        cuenta como congestión.
+    smoothing : float
+        Peso de cada muestra en el promedio móvil de la latencia base.
+    target_latency : float, opcional
+        Latencia máxima aceptable en segundos (además de la regla relativa).
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float = 4,
+        min_limit: float = 1,
+        max_limit: float = 64,
+        backoff: float = 0.5,
+        tolerance: float = 3.0,
+        smoothing: float = 0.05,
+        target_latency: float | None = None,
+    ):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Se requiere 1 <= min_limit <= initial <= max_limit")
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.target_latency = target_latency
+        self._cond = threading.Condition()
+        self.inflight = 0
+        self._baseline: float | None = None
+        self._last_drop = 0.0
+        self.decreases = 0
+        self.peak = self.limit
+
+    def try_acquire(self) -> bool:
+        with self._cond:
+            if self.inflight < int(self.limit):
+                self.inflight += 1
+                return True
+            return False
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.inflight >= int(self.limit):
+                self._cond.wait()
+            self.inflight += 1
+
+    def release(self, latency: float, ok: bool) -> None:
+        """Libera el lugar y ajusta el límite con el resultado de la petición."""
+        with self._cond:
+            self.inflight -= 1
+            if ok:
+                # línea base: promedio lento (EWMA) de la latencia de respuestas exitosas
+                base = self._baseline
+                self._baseline = (
+                    latency if base is None else base + self.smoothing * (latency - base)
+                )
+            congested = not ok or latency > self.tolerance * self._baseline or (
+                self.target_latency is not None and latency > self.target_latency
+            )
+            now = time.monotonic()
+            if congested:
+                # una sola reducción por ventana (≈ una latencia) aunque fallen varias
+                if now - self._last_drop > (self._baseline or 0.0):
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_drop = now
+                    self.decreases += 1
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+                self.peak = max(self.peak, self.limit)
+            self._cond.notify_all()
+
+
+# --------------------------------------------------------------------------------------
+# Controlador combinado
+# --------------------------------------------------------------------------------------
+class _Outcome:
+    """Resultado de una petición dentro de un `slot` (congestión = not ok)."""
+
+    __slots__ = ("ok",)
+
+    def __init__(self):
+        self.ok = True
+
+
+def is_congestion(status: int) -> bool:
+    """Códigos HTTP que indican sobrecarga del servidor."""
+    return status == 429 or status >= 500
+
+
+class RateController:
+    """
+    Limitador de tasa + concurrencia adaptativa compartible.
+
+    Parámetros
+    ----------
+    rate : float, opcional
+        Peticiones por segundo (None = sin tope de tasa).
+    burst : float, opcional
+        Ráfaga máxima del token bucket.
+    adaptive : bool | AdaptiveLimit
+        True crea un `AdaptiveLimit` por defecto; False lo desactiva.
+
+    Ejemplo
+    -------
+    >>> ctl = RateController(rate=50)
+    >>> cli = PDEXClient(url, user, pwd, limiter=ctl)
+    >>> acli = AsyncPDEXClient(url, user, pwd, limiter=ctl)   # mismo presupuesto
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        adaptive: AdaptiveLimit | bool = True,
+    ):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        if adaptive is True:
+            adaptive = AdaptiveLimit()
+        self.adaptive: Optional[AdaptiveLimit] = adaptive or None
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def _record(self, ok: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.errors += not ok
+
+    @contextmanager
+    def slot(self) -> Iterator["_Outcome"]:
+        """Espera tasa y lugar de concurrencia; marque `out.ok = False` si hubo congestión."""
+        if self.bucket is not None:
+            self.bucket.acquire()
+        if self.adaptive is not None:
+            self.adaptive.acquire()
+        out = _Outcome()
+        start = time.monotonic()
+        try:
+            yield out
+        except BaseException:
+            out.ok = False
+            raise
+        finally:
+            if self.adaptive is not None:
+                self.adaptive.release(time.monotonic() - start, out.ok)
+            self._record(out.ok)
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator["_Outcome"]:
+        """Versión para corrutinas de `slot` (no bloquea el event loop)."""
+        if self.bucket is not None:
+            await self.bucket.acquire_async()
+        if self.adaptive is not None:
+            delay = 0.001
+            while not self.adaptive.try_acquire():
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        out = _Outcome()
+        start = time.monotonic()
+        try:
+            yield out
+        except BaseException:
+            out.ok = False
+            raise
+        finally:
+            if self.adaptive is not None:
+                self.adaptive.release(time.monotonic() - start, out.ok)
+            self._record(out.ok)
+
+    def stats(self) -> Dict[str, Any]:
+        """Límite actual/pico, peticiones en vuelo, reducciones y espera por tasa."""
+        with self._lock:
+            out: Dict[str, Any] = {"requests": self.requests, "errors": self.errors}
+        if self.adaptive is not None:
+            out.update(
+                limit=round(self.adaptive.limit, 2),
+                peak_limit=round(self.adaptive.peak, 2),
+                inflight=self.adaptive.inflight,
+                decreases=self.adaptive.decreases,
+            )
+        if self.bucket is not None:
+            out.update(rate=self.bucket.rate, rate_wait_seconds=round(self.bucket.waited, 3))
+        return out
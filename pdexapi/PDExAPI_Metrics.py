@@ -0,0 +1,239 @@
+# ======================================================================================
+# Script:  PDExAPI_Metrics.py
+# Purpose: instrumentación por endpoint de PDEXClient (latencias por fase, bytes y filas)
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `LatencyHistogram`: histograma de cubetas logarítmicas fijas (≈ ±19 % de resolución
+  entre 0.1 ms y 100 s) con conteo, suma, mínimo, máximo y cuantiles aproximados.
+• `Metrics`: registro por endpoint de peticiones, errores, bytes (descomprimidos y en la
+  red), filas e histogramas por fase de cada consulta:
+    - connect  : apertura de la conexión TCP/TLS (0 si se reutilizó del pool)
+    - server   : envío de la petición hasta recibir las cabeceras (procesamiento
+                 del servidor + red)
+    - download : lectura del cuerpo
+    - decode   : cuerpo → valores Python (JSON, Arrow o MessagePack)
+    - frame    : construcción del DataFrame (incluye el parseo en modo columnar)
+• Hooks `fn(endpoint, metric, value)` reciben cada observación, p.ej. para exportar a
+  Prometheus u OpenTelemetry.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List
+
+from .PDExAPI_Lazy import lazy_import
+
+pd = lazy_import("pandas")
+
+PHASES = ("connect", "server", "download", "decode", "frame")
+
+# Observación: (endpoint, métrica, valor);
+# métrica ∈ PHASES ∪ {"bytes", "wire_bytes", "rows", "error"}
+Hook = Callable[[str, str, float], None]
+
+# Límites superiores de las cubetas: 0.1 ms · 2^(i/2), hasta ~105 s
+_BOUNDS = [1e-4 * 2 ** (i / 2) for i in range(41)]
+
+
+# --------------------------------------------------------------------------------------
+# Histograma
+# --------------------------------------------------------------------------------------
+class LatencyHistogram:
+    """Histograma de latencias (segundos) con cubetas logarítmicas fijas."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(_BOUNDS) + 1)  # última cubeta: desborde
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Cuantil aproximado (interpolación geométrica dentro de la cubeta)."""
+        if not self.count:
+            return math.nan
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lo = _BOUNDS[i - 1] if i else self.min
+                hi = _BOUNDS[i] if i < len(_BOUNDS) else self.max
+                lo, hi = max(lo, self.min), min(hi, self.max)
+                if lo <= 0 or hi <= lo:
+                    return hi
+                return lo * (hi / lo) ** ((rank - seen) / n)
+            seen += n
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "total": self.total,
+        }
+
+
+class _Endpoint:
+    __slots__ = ("requests", "errors", "bytes", "wire_bytes", "rows", "phases")
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.wire_bytes = 0
+        self.rows = 0
+        self.phases = {p: LatencyHistogram() for p in PHASES}
+
+
+# --------------------------------------------------------------------------------------
+# Registro
+# --------------------------------------------------------------------------------------
+class Metrics:
+    """
+    Métricas por endpoint de un cliente (seguro entre hilos).
+
+    Parámetros
+    ----------
+    hooks : lista de callables, opcional
+        Reciben `(endpoint, métrica, valor)` por cada observación.
+
+    Ejemplo
+    -------
+    >>> from prometheus_client import Histogram
+    >>> h = Histogram("pdexapi_seconds", "Latencia PDExAPI", ["endpoint", "phase"])
+    >>> cli.metrics.add_hook(
+    ...     lambda ep, m, v: m in PHASES and h.labels(ep, m).observe(v))
+    """
+
+    def __init__(self, hooks: List[Hook] | None = None):
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _Endpoint] = {}
+        self._hooks: List[Hook] = list(hooks or [])
+        self.hook_errors = 0
+
+    def add_hook(self, fn: Hook) -> None:
+        self._hooks.append(fn)
+
+    def remove_hook(self, fn: Hook) -> None:
+        self._hooks.remove(fn)
+
+    # ------------------------------------------------------------------ #
+    def _endpoint(self, endpoint: str) -> _Endpoint:
+        ep = self._endpoints.get(endpoint)
+        if ep is None:
+            ep = self._endpoints.setdefault(endpoint, _Endpoint())
+        return ep
+
+    def _emit(self, endpoint: str, metric: str, value: float) -> None:
+        for fn in self._hooks:
+            try:
+                fn(endpoint, metric, value)
+            except Exception:  # un exportador roto no debe tumbar la consulta
+                with self._lock:
+                    self.hook_errors += 1
+
+    def observe(self, endpoint: str, phase: str, seconds: float) -> None:
+        """Registra la duración de una fase (ver `PHASES`)."""
+        with self._lock:
+            self._endpoint(endpoint).phases[phase].observe(seconds)
+        self._emit(endpoint, phase, seconds)
+
+    def count(
+        self,
+        endpoint: str,
+        *,
+        requests: int = 0,
+        errors: int = 0,
+        nbytes: int = 0,
+        wire_bytes: int = 0,
+        rows: int = 0,
+    ) -> None:
+        """Suma peticiones, errores, bytes de respuesta (descomprimidos y transferidos)
+        y filas entregadas."""
+        with self._lock:
+            ep = self._endpoint(endpoint)
+            ep.requests += requests
+            ep.errors += errors
+            ep.bytes += nbytes
+            ep.wire_bytes += wire_bytes
+            ep.rows += rows
+        if errors:
+            self._emit(endpoint, "error", errors)
+        if nbytes:
+            self._emit(endpoint, "bytes", nbytes)
+        if wire_bytes:
+            self._emit(endpoint, "wire_bytes", wire_bytes)
+        if rows:
+            self._emit(endpoint, "rows", rows)
+
+    @contextmanager
+    def timer(self, endpoint: str, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(endpoint, phase, time.perf_counter() - start)
+
+    # ------------------------------------------------------------------ #
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Resumen por endpoint: contadores y, por fase con observaciones, conteo, media,
+        p50/p90/p99, máximo y total en segundos.
+        """
+        with self._lock:
+            out: Dict[str, Dict[str, Any]] = {}
+            for name, ep in sorted(self._endpoints.items()):
+                row: Dict[str, Any] = {
+                    "requests": ep.requests,
+                    "errors": ep.errors,
+                    "bytes": ep.bytes,
+                    "wire_bytes": ep.wire_bytes,
+                    "rows": ep.rows,
+                }
+                for phase, hist in ep.phases.items():
+                    if hist.count:
+                        row[phase] = hist.summary()
+                out[name] = row
+        return out
+
+    def frame(self) -> pd.DataFrame:
+        """Tabla larga endpoint × fase para ordenar y encontrar los endpoints lentos."""
+        rows = [
+            {"endpoint": name, "phase": phase, **summary}
+            for name, row in self.stats().items()
+            for phase, summary in row.items()
+            if phase in PHASES
+        ]
+        cols = ["endpoint", "phase", "count", "mean", "p50", "p90", "p99", "max", "total"]
+        return pd.DataFrame(rows, columns=cols)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,306 @@
+# ======================================================================================
+# Script:  PDExAPI_Mirror.py
+# Purpose: espejo local en Parquet (particionado) de endpoints históricos de PDExAPI
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `ParquetMirror`: dataset Parquet en disco con particiones Hive
+  `endpoint=<método>/variable=<v>/year=<aaaa>/estado=<e>/part-*.parquet`
+  (requiere `pyarrow`, instalar con `pip install pdexapi[parquet]`). La columna de
+  fecha y las particiones salen de `LAYOUTS` por endpoint (`turismo` usa
+  `fecha_periodo`, los endpoints LATAM particionan por `departamento`).
+• Un manifiesto SQLite guarda qué intervalos de fechas ya se escribieron por serie
+  (endpoint + parámetros sin fechas); `PDEXClient.mirror` solo pide y anexa los huecos,
+  y solo escribe días ya definitivos (no se duplican filas entre corridas).
+• `read` abre el dataset con memory-map y empuja los filtros a las particiones
+  (variable/estado/año) y a las estadísticas de cada row group (fechas).
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import threading
+
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .PDExAPI_Cache import (
+    ONE_DAY,
+    RangeCache,
+    _connect,
+    _month_end,
+    _month_start,
+    cache_key,
+    merge_intervals,
+    missing_intervals,
+)
+from .PDExAPI_Lazy import lazy_import
+
+pd = lazy_import("pandas")
+uuid = lazy_import("uuid")
+pa = lazy_import("pyarrow", optional=True)  # dependencia opcional
+ds = lazy_import("pyarrow.dataset", optional=True)
+pafs = lazy_import("pyarrow.fs", optional=True)
+
+
+PARTITION_COLUMNS = ("variable", "year", "estado")
+
+# Endpoint → (columna de fecha, particiones); los no listados usan DEFAULT_LAYOUT.
+# `year` se deriva de la columna de fecha.
+Layout = Tuple[str, Tuple[str, ...]]
+DEFAULT_LAYOUT: Layout = ("fecha", PARTITION_COLUMNS)
+LAYOUTS: Dict[str, Layout] = {
+    "turismo": ("fecha_periodo", ("year", "estado")),
+    "copernicus_historical_latam": ("fecha", ("variable", "year", "departamento")),
+    "copernicus_forecast_latam": ("fecha", ("variable", "year", "departamento")),
+}
+
+# Argumentos de los métodos que no cambian la serie consultada
+CALL_OPTIONS = frozenset({"chunk_days", "max_workers", "as_frame", "stream", "chunk_rows"})
+
+
+class ParquetMirror:
+    """
+    Espejo local en Parquet de respuestas tabulares de PDExAPI.
+
+    Parámetros
+    ----------
+    directory : str | Path
+        Raíz del dataset; puede compartirse entre notebooks y procesos.
+    settle_days : int
+        Días recientes (contando hoy) que aún no se escriben porque el servidor
+        puede actualizarlos.
+    layouts : dict, opcional
+        Endpoint → (columna de fecha, particiones) que se agregan a `LAYOUTS`.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        settle_days: int = 2,
+        layouts: Dict[str, Layout] | None = None,
+    ):
+        if pa is None:
+            raise ImportError("ParquetMirror requiere pyarrow: pip install 'pdexapi[parquet]'")
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.settle_days = settle_days
+        self.layouts = {**LAYOUTS, **(layouts or {})}
+        self._lock = threading.Lock()
+        self._db = _connect(self.directory / "_manifest.sqlite")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS held (
+                endpoint TEXT NOT NULL,
+                series   TEXT NOT NULL,
+                ini      TEXT NOT NULL,
+                fin      TEXT NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_held ON held(endpoint, series)")
+
+    def __repr__(self) -> str:
+        return f"ParquetMirror({str(self.directory)!r})"
+
+    def layout(self, endpoint: str) -> Layout:
+        """(columna de fecha, particiones) del endpoint."""
+        return self.layouts.get(endpoint, DEFAULT_LAYOUT)
+
+    # ------------------------------------------------------------------ #
+    # Manifiesto
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def series_key(endpoint: str, params: Dict[str, Any]) -> str:
+        return cache_key(
+            endpoint,
+            {
+                k: v
+                for k, v in params.items()
+                if k not in ("fecha_inicio", "fecha_fin") and k not in CALL_OPTIONS
+            },
+        )
+
+    def _held(self, endpoint: str, series: str) -> List[tuple]:
+        rows = self._db.execute(
+            "SELECT ini, fin FROM held WHERE endpoint = ? AND series = ?", (endpoint, series)
+        ).fetchall()
+        return [(date.fromisoformat(a), date.fromisoformat(b)) for a, b in rows]
+
+    def plan(self, endpoint: str, params: Dict[str, Any]) -> List[tuple]:
+        """
+        Sub-rangos (date, date) de la consulta que faltan en el espejo.
+
+        El rango se recorta al último día definitivo y, en endpoints mensuales,
+        se alinea a meses completos.
+        """
+        monthly = RangeCache._monthly(f"/{endpoint}", params)
+        ini = date.fromisoformat(str(params["fecha_inicio"])[:10])
+        fin = date.fromisoformat(str(params["fecha_fin"])[:10])
+        closed = date.today() - timedelta(days=self.settle_days)
+        if monthly:
+            ini, fin = _month_start(ini), _month_end(fin)
+            closed = _month_start(closed + ONE_DAY) - ONE_DAY
+        fin = min(fin, closed)
+        if fin < ini:
+            return []
+        series = self.series_key(endpoint, params)
+        with self._lock:
+            gaps = missing_intervals(ini, fin, self._held(endpoint, series))
+        if monthly:
+            gaps = merge_intervals([(_month_start(a), _month_end(b)) for a, b in gaps])
+        return gaps
+
+    # ------------------------------------------------------------------ #
+    # Escritura
+    # ------------------------------------------------------------------ #
+    def write(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        df: pd.DataFrame,
+        ini: date,
+        fin: date,
+    ) -> int:
+        """
+        Anexa las filas de la ventana [ini, fin] de una serie y la marca como guardada.
+
+        Devuelve el número de filas escritas.
+        """
+        if len(df):
+            fecha, partitions = self.layout(endpoint)
+            if fecha not in df.columns:
+                raise KeyError(f"Las filas de {endpoint!r} no traen la columna {fecha!r}")
+            df = df.copy()
+            df[fecha] = pd.to_datetime(df[fecha], format="ISO8601")
+            df["year"] = df[fecha].dt.year.astype("int32")
+            for col in partitions:
+                if col == "year":
+                    continue
+                if col not in df.columns:
+                    df[col] = None
+                df[col] = df[col].astype("string")
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            ds.write_dataset(
+                table,
+                self.directory / f"endpoint={endpoint}",
+                format="parquet",
+                partitioning=ds.partitioning(
+                    pa.schema([
+                        (c, pa.int32() if c == "year" else pa.string()) for c in partitions
+                    ]),
+                    flavor="hive",
+                ),
+                basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+            )
+
+        series = self.series_key(endpoint, params)
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                held = merge_intervals(self._held(endpoint, series) + [(ini, fin)])
+                self._db.execute(
+                    "DELETE FROM held WHERE endpoint = ? AND series = ?", (endpoint, series)
+                )
+                self._db.executemany(
+                    "INSERT INTO held VALUES (?, ?, ?, ?)",
+                    ((endpoint, series, a.isoformat(), b.isoformat()) for a, b in held),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(df)
+
+    # ------------------------------------------------------------------ #
+    # Lectura
+    # ------------------------------------------------------------------ #
+    def dataset(self, endpoint: str) -> "ds.Dataset":
+        """Dataset de Arrow del endpoint (memory-map, particiones Hive)."""
+        path = self.directory / f"endpoint={endpoint}"
+        if not path.exists():
+            raise KeyError(f"El espejo no tiene datos de {endpoint!r}")
+        return ds.dataset(
+            str(path),
+            format="parquet",
+            partitioning=ds.HivePartitioning.discover(infer_dictionary=True),
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+        )
+
+    def read(
+        self,
+        endpoint: str,
+        *,
+        fecha_inicio: str | None = None,
+        fecha_fin: str | None = None,
+        columns: Optional[Sequence[str]] = None,
+        **filters: Any,
+    ) -> pd.DataFrame:
+        """
+        Lee del espejo aplicando los filtros antes de cargar datos.
+
+        Parámetros
+        ----------
+        fecha_inicio, fecha_fin : 'YYYY-MM-DD', opcionales
+            Rango inclusivo sobre la columna de fecha del endpoint; poda particiones
+            por año y row groups por fecha.
+        columns : lista, opcional
+            Columnas a leer (lectura columnar: las demás no se tocan).
+        **filters
+            Igualdad (`estado="Jalisco"`) o pertenencia (`variable=["tp", "maxtemp_c"]`)
+            sobre cualquier columna.
+
+        Ejemplo
+        -------
+        >>> m = ParquetMirror("~/pdex_mirror")
+        >>> m.read("copernicus_historical", variable="maxtemp_c", estado=["Jalisco", "Puebla"],
+        ...        fecha_inicio="2020-01-01", fecha_fin="2024-12-31")
+        """
+        fecha = self.layout(endpoint)[0]
+        expr = None
+
+        def add(e):
+            nonlocal expr
+            expr = e if expr is None else expr & e
+
+        for name, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                add(ds.field(name).isin(list(value)))
+            else:
+                add(ds.field(name) == value)
+        if fecha_inicio:
+            ini = pd.Timestamp(fecha_inicio)
+            add(ds.field("year") >= ini.year)
+            add(ds.field(fecha) >= pa.scalar(ini.to_pydatetime(), pa.timestamp("ns")))
+        if fecha_fin:
+            fin = pd.Timestamp(fecha_fin) + pd.Timedelta(days=1)
+            add(ds.field("year") <= (fin - pd.Timedelta(days=1)).year)
+            add(ds.field(fecha) < pa.scalar(fin.to_pydatetime(), pa.timestamp("ns")))
+
+        data = self.dataset(endpoint)
+        if columns is None:
+            columns = [n for n in data.schema.names if n != "year"]
+        cols = list(columns)
+        df = data.to_table(columns=cols, filter=expr).to_pandas()
+        if fecha in df.columns:
+            df = df.sort_values(fecha, kind="stable", ignore_index=True)
+        return df
+
+    def stats(self) -> Dict[str, Any]:
+        """Series e intervalos guardados por endpoint."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT endpoint, COUNT(DISTINCT series), COUNT(*) FROM held GROUP BY endpoint"
+            ).fetchall()
+        return {e: {"series": s, "intervals": n} for e, s, n in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,224 @@
+# ======================================================================================
+# Script:  PDExAPI_Pages.py
+# Purpose: paginación transparente (offset/limit o cursor) de respuestas enormes con
+#          páginas pedidas en paralelo y reensambladas en orden
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• Con `PDEXClient(page_size=N)` las rutas de `PAGED_PATHS` se piden con `limit=N` y
+  `offset=0`. Según las cabeceras de la primera respuesta:
+    - `X-Total-Count: T` (offset/limit): las páginas restantes se conocen de antemano
+      y se piden en paralelo, a lo más `max_in_flight` a la vez;
+    - `X-Next-Cursor: c` (cursor): cada página da el cursor de la siguiente, así que se
+      piden en secuencia, con la siguiente en vuelo mientras se procesa la actual;
+    - ninguna: si la primera página trae menos (o más) de `limit` filas, el servidor no
+      pagina y es la respuesta completa; si trae exactamente `limit`, se sigue por
+      offset (con hasta `max_in_flight` páginas en vuelo) hasta recibir una página
+      corta, salvo que la segunda página sea idéntica a la primera (el servidor ignora
+      `offset` y la primera ya era la respuesta completa). A lo más `MAX_BLIND_PAGES`.
+• Las filas de una página se cuentan sin decodificarla (cabecera MessagePack, metadatos
+  Arrow o un barrido con expresiones regulares del JSON).
+• `iter_pages` entrega los cuerpos en orden conforme llegan (modo streaming);
+  `join_pages` los une en un solo cuerpo equivalente a la respuesta sin paginar, que
+  pasa igual que antes por las cachés y la construcción de DataFrames.
+• Las páginas JSON se unen a nivel de bytes (sin decodificar) y las Arrow IPC con
+  `pa.concat_tables`; cualquier otro caso se decodifica y se vuelve a serializar como
+  JSON.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import itertools
+import json
+import re
+
+from collections import deque
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Tuple
+
+from .PDExAPI_Lazy import lazy_import
+from .PDExAPI_Wire import _arrow_table, decode, sniff
+
+cf = lazy_import("concurrent.futures")
+pa = lazy_import("pyarrow", optional=True)  # dependencia opcional
+
+
+# Endpoints cuyas respuestas pueden ser arbitrariamente grandes
+PAGED_PATHS = frozenset({
+    "/clima_historico",
+    "/clima_historico_nacional",
+    "/copernicus_historical",
+    "/copernicus_historical_latam",
+    "/copernicus_forecast",
+    "/copernicus_forecast_latam",
+    "/copernicus_hourly_grib",
+})
+
+TOTAL_HEADER = "X-Total-Count"
+CURSOR_HEADER = "X-Next-Cursor"
+
+# Tope de páginas cuando el servidor no informa total ni cursor
+MAX_BLIND_PAGES = 10_000
+
+_JSON_STRING = re.compile(rb'"(?:[^"\\]|\\.)*"')
+_JSON_LEAF = re.compile(rb"[\[{][^\[\]{}]*[\]}]")  # objeto/arreglo sin anidados
+
+# fetch(params) → (cuerpo, cabeceras) de una página
+PageFetch = Callable[[Dict[str, Any]], Tuple[bytes, Mapping[str, str]]]
+
+
+# --------------------------------------------------------------------------------------
+# Recorrido
+# --------------------------------------------------------------------------------------
+def page_params(params: Dict[str, Any] | None, page_size: int, **where: Any) -> Dict[str, Any]:
+    """Parámetros de una página: los de la consulta + `limit` y `offset` o `cursor`."""
+    return {**(params or {}), "limit": page_size, **where}
+
+
+def _row_count(body: bytes) -> int | None:
+    """
+    Filas de una página sin construir objetos de Python; None si no es un arreglo de
+    registros (p.ej. el sobre columnar) o si es Arrow y no hay pyarrow.
+    """
+    kind = sniff(body)
+    if kind == "arrow":
+        return _arrow_table(body).num_rows if pa is not None else None  # sin copia
+    if kind == "msgpack":  # fixarray / array16 / array32
+        head = body[0]
+        if 0x90 <= head <= 0x9F:
+            return head & 0x0F
+        if head in (0xDC, 0xDD):
+            return int.from_bytes(body[1:3 if head == 0xDC else 5], "big")
+        return None
+    inner = body.strip()
+    if not (inner.startswith(b"[") and inner.endswith(b"]")):
+        return None
+    # Se vacían los textos y se colapsan los anidados hasta dejar solo los elementos
+    # del arreglo exterior separados por comas
+    inner = _JSON_STRING.sub(b'""', inner[1:-1])
+    while True:
+        flat = _JSON_LEAF.sub(b"0", inner)
+        if flat == inner:
+            break
+        inner = flat
+    return inner.count(b",") + 1 if inner.strip() else 0
+
+
+def iter_pages(
+    first: bytes,
+    headers: Mapping[str, str],
+    params: Dict[str, Any] | None,
+    page_size: int,
+    fetch: PageFetch,
+    *,
+    max_in_flight: int = 4,
+) -> Iterator[bytes]:
+    """
+    Cuerpos de todas las páginas en orden, empezando por `first`.
+
+    Con offset/limit (con o sin `X-Total-Count`) mantiene hasta `max_in_flight` páginas
+    en vuelo por delante de la que se entrega; con cursor, una. Si el consumidor se
+    detiene, las páginas que aún no empiezan se cancelan.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight debe ser >= 1")
+    total = headers.get(TOTAL_HEADER)
+    cursor = headers.get(CURSOR_HEADER)
+    blind = total is None and not cursor
+    if blind and _row_count(first) != page_size:
+        yield first  # no pagina, o todo cupo en la primera página
+        return
+
+    pending: deque = deque()
+    workers = 1 if cursor and total is None else max_in_flight
+    with cf.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdex-page") as pool:
+        try:
+            if blind:
+                # Sin total: se piden offsets por adelantado y se corta en la primera
+                # página corta (las que ya estaban en vuelo detrás de ella se descartan)
+                offsets = itertools.count(page_size, page_size)
+                for off in itertools.islice(offsets, max_in_flight):
+                    pending.append(pool.submit(fetch, page_params(params, page_size, offset=off)))
+                body, _ = pending.popleft().result()
+                yield first
+                if body == first:  # ignora offset: la primera ya era la respuesta completa
+                    return
+                pages = 2
+                while _row_count(body) == page_size:
+                    if pages >= MAX_BLIND_PAGES:
+                        raise RuntimeError(
+                            f"Más de {MAX_BLIND_PAGES} páginas sin X-Total-Count ni "
+                            "X-Next-Cursor; el servidor parece ignorar offset"
+                        )
+                    pending.append(
+                        pool.submit(fetch, page_params(params, page_size, offset=next(offsets)))
+                    )
+                    yield body
+                    body, _ = pending.popleft().result()
+                    pages += 1
+                yield body
+                return
+
+            if total is not None:
+                offsets = iter(range(page_size, int(total), page_size))
+                for off in offsets:
+                    pending.append(pool.submit(fetch, page_params(params, page_size, offset=off)))
+                    if len(pending) >= max_in_flight:
+                        break
+                yield first
+                while pending:
+                    body, _ = pending.popleft().result()
+                    off = next(offsets, None)
+                    if off is not None:
+                        pending.append(pool.submit(fetch, page_params(params, page_size, offset=off)))
+                    yield body
+                return
+
+            pending.append(pool.submit(fetch, page_params(params, page_size, cursor=cursor)))
+            yield first
+            while pending:
+                body, headers = pending.popleft().result()
+                cursor = headers.get(CURSOR_HEADER)
+                if cursor:
+                    pending.append(pool.submit(fetch, page_params(params, page_size, cursor=cursor)))
+                yield body
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
+# --------------------------------------------------------------------------------------
+# Reensamblado
+# --------------------------------------------------------------------------------------
+def _json_items(body: bytes) -> bytes:
+    """Contenido de un arreglo JSON sin los corchetes (b"" si está vacío)."""
+    inner = body.strip()
+    if not (inner.startswith(b"[") and inner.endswith(b"]")):
+        raise ValueError("La página JSON no es un arreglo")
+    return inner[1:-1].strip()
+
+
+def join_pages(bodies: List[bytes]) -> bytes:
+    """Un solo cuerpo con las filas de todas las páginas, en el formato de las páginas."""
+    if len(bodies) == 1:
+        return bodies[0]
+    kinds = {sniff(b) for b in bodies}
+    if kinds == {"json"}:
+        items = [i for i in map(_json_items, bodies) if i]
+        return b"[" + b",".join(items) + b"]"
+    if kinds == {"arrow"} and pa is not None:
+        tables = [_arrow_table(b) for b in bodies]
+        # cada página trae sus propios diccionarios de texto: se unifican para el stream
+        table = pa.concat_tables(tables, promote_options="default").unify_dictionaries()
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    rows: List[Any] = []
+    for body in bodies:
+        rows.extend(decode(body))
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode()
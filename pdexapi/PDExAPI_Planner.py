@@ -0,0 +1,323 @@
+# ======================================================================================
+# Script:  PDExAPI_Planner.py
+# Purpose: planificador de consultas Copernicus: une muchas series angostas (una ciudad,
+#          una variable) en pocas llamadas amplias y las vuelve a separar localmente
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• Una serie es una geografía + una variable + el resto de parámetros del endpoint
+  (ventana, `nivel`, `freq`, `fh`, ...). Las series con los mismos parámetros fijos
+  forman un grupo que puede resolverse con menos llamadas porque los endpoints
+  Copernicus aceptan `variable` como lista y, con la geografía en None, devuelven todos
+  los estados/ciudades (o departamentos/municipios).
+• `CostModel`: costo estimado de una llamada = `overhead` (ida y vuelta + consulta) +
+  `row_cost` × filas devueltas. Las filas se estiman con el número de periodos de la
+  ventana y cuántas geografías devuelve cada forma de llamada.
+• `plan_series`: por grupo elige la opción más barata entre
+    - una llamada por geografía (con sus variables juntas; no trae filas de más),
+    - a nivel ciudad, una llamada por estado (`ciudad=None`) donde convenga,
+    - una sola llamada nacional (`estado=None, ciudad=None`) con todas las variables.
+  El costo minimizado es trabajo total (servidor + red + decodificación), no el tiempo
+  de pared con llamadas en paralelo.
+• `split_frames`: separa los DataFrames de las llamadas unidas en uno por serie con un
+  `groupby` + un solo reordenamiento y cortes contiguos, sin recorrer filas en Python.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .PDExAPI_Batch import request_key
+from .PDExAPI_Lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+
+# Endpoints planificables → (nivel superior, nivel inferior) de su geografía
+GEO_LEVELS: Dict[str, Tuple[str, str]] = {
+    "copernicus_historical": ("estado", "ciudad"),
+    "copernicus_forecast": ("estado", "ciudad"),
+    "copernicus_historical_latam": ("departamento", "municipio"),
+    "copernicus_forecast_latam": ("departamento", "municipio"),
+}
+
+
+# --------------------------------------------------------------------------------------
+# Modelo de costo
+# --------------------------------------------------------------------------------------
+class CostModel:
+    """
+    Costo estimado (segundos de trabajo) de una llamada según las filas que devuelve.
+
+    Parámetros
+    ----------
+    overhead : float
+        Costo fijo por llamada: ida y vuelta, autenticación del GET y consulta SQL.
+    row_cost : float
+        Costo por fila devuelta: lectura en el servidor, transferencia y decodificación.
+    regions : int
+        Geografías de nivel superior que trae una llamada amplia (México: 32 estados
+        + Nacional).
+    subregions : int
+        Ciudades (o municipios) por estado cuando `catalog` no lo especifica.
+    catalog : dict, opcional
+        Ciudades por estado: conteo o lista de nombres, p.ej. `{"Jalisco": 12}`.
+    """
+
+    def __init__(
+        self,
+        *,
+        overhead: float = 0.3,
+        row_cost: float = 5e-6,
+        regions: int = 33,
+        subregions: int = 10,
+        catalog: Dict[str, int | Sequence[str]] | None = None,
+    ):
+        if overhead < 0 or row_cost < 0:
+            raise ValueError("overhead y row_cost deben ser >= 0")
+        self.overhead = overhead
+        self.row_cost = row_cost
+        self.regions = regions
+        self.subregions = subregions
+        self.catalog = {
+            k: v if isinstance(v, int) else len(v) for k, v in (catalog or {}).items()
+        }
+
+    def call(self, rows: float) -> float:
+        """Costo de una llamada que devuelve `rows` filas."""
+        return self.overhead + self.row_cost * rows
+
+    def children(self, region: str | None) -> int:
+        """Ciudades que devuelve una llamada con `region` (None = todas)."""
+        if region is None:
+            if self.catalog:
+                return sum(self.catalog.values())
+            return self.regions * self.subregions
+        return self.catalog.get(region, self.subregions)
+
+
+def periods(params: Dict[str, Any]) -> int:
+    """Periodos por geografía y variable que devuelve una llamada (estimado)."""
+    if "fh" in params:
+        return max(int(params["fh"]), 1)
+    ini = date.fromisoformat(str(params["fecha_inicio"])[:10])
+    fin = date.fromisoformat(str(params["fecha_fin"])[:10])
+    freq = params.get("freq", "D")
+    if freq == "M":
+        return max((fin.year - ini.year) * 12 + fin.month - ini.month + 1, 1)
+    days = max((fin - ini).days + 1, 1)
+    return days * 24 if freq == "H" else days
+
+
+# --------------------------------------------------------------------------------------
+# Plan
+# --------------------------------------------------------------------------------------
+class QueryPlan:
+    """
+    Llamadas elegidas para un conjunto de series.
+
+    Atributos
+    ---------
+    endpoint : str
+        Método del cliente (ej. "copernicus_historical").
+    series : list[dict]
+        Parámetros completos de cada serie pedida (en el orden original).
+    calls : list[dict]
+        Parámetros de cada llamada a enviar.
+    members : list[list[int]]
+        Índices de `series` que resuelve cada llamada.
+    cost, naive_cost : float
+        Costo estimado del plan y de una llamada por serie.
+    """
+
+    def __init__(self, endpoint: str, series: List[Dict[str, Any]]):
+        self.endpoint = endpoint
+        self.series = series
+        self.calls: List[Dict[str, Any]] = []
+        self.members: List[List[int]] = []
+        self.cost = 0.0
+        self.naive_cost = 0.0
+
+    def __len__(self) -> int:
+        return len(self.calls)
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryPlan({self.endpoint}: {len(self.calls)} llamadas para "
+            f"{len(self.series)} series, costo≈{self.cost:.2f}s vs {self.naive_cost:.2f}s)"
+        )
+
+    def _add(self, params: Dict[str, Any], variables: List[str], members: List[int],
+             cost: float) -> None:
+        params = dict(params)
+        params["variable"] = variables[0] if len(variables) == 1 else variables
+        self.calls.append(params)
+        self.members.append(members)
+        self.cost += cost
+
+
+def _union(values: Sequence[str]) -> List[str]:
+    return list(dict.fromkeys(values))  # sin duplicados, en orden de aparición
+
+
+def plan_series(
+    endpoint: str,
+    series: Sequence[Dict[str, Any]],
+    common: Dict[str, Any] | None = None,
+    model: CostModel | None = None,
+) -> QueryPlan:
+    """
+    Agrupa las series y elige, por grupo, la forma de llamada más barata.
+
+    Parámetros
+    ----------
+    endpoint : str
+        Uno de `GEO_LEVELS`.
+    series : list[dict]
+        Una variable (`str`) y la geografía de su `nivel` por serie; cualquier otro
+        argumento del endpoint sobreescribe a `common`.
+    common : dict, opcional
+        Argumentos compartidos (ej. `nivel`, `freq`, `fecha_inicio`, `fecha_fin`).
+    model : CostModel, opcional
+    """
+    if endpoint not in GEO_LEVELS:
+        raise ValueError(f"{endpoint!r} no es planificable; use uno de {list(GEO_LEVELS)}")
+    upper, lower = GEO_LEVELS[endpoint]
+    model = model or CostModel()
+    full = [{**(common or {}), **s} for s in series]
+
+    groups: Dict[tuple, List[int]] = {}
+    for i, p in enumerate(full):
+        nivel = p.get("nivel")
+        if nivel not in (upper, lower):
+            raise ValueError(f"nivel debe ser {upper!r} o {lower!r} (serie {i})")
+        if not isinstance(p.get("variable"), str):
+            raise ValueError(f"Cada serie lleva una sola variable (serie {i})")
+        if not p.get(upper) or (nivel == lower) != bool(p.get(lower)):
+            raise ValueError(
+                f"La serie {i} debe indicar {upper!r}"
+                + (f" y {lower!r}" if nivel == lower else f" y no {lower!r}")
+            )
+        fixed = {k: v for k, v in p.items() if k not in (upper, lower, "variable")}
+        groups.setdefault(request_key(fixed), []).append(i)
+
+    plan = QueryPlan(endpoint, full)
+    for members in groups.values():
+        _plan_group(plan, members, upper, lower, model)
+    plan.naive_cost = sum(model.call(periods(p)) for p in full)
+    return plan
+
+
+def _plan_group(plan: QueryPlan, members: List[int], upper: str, lower: str,
+                model: CostModel) -> None:
+    full = plan.series
+    fixed = {k: v for k, v in full[members[0]].items() if k not in (upper, lower, "variable")}
+    n = periods(fixed)
+    by_level = lower if fixed["nivel"] == lower else upper
+
+    # una llamada por geografía, con todas sus variables
+    per_geo: Dict[tuple, List[int]] = {}
+    for i in members:
+        per_geo.setdefault((full[i][upper], full[i].get(lower)), []).append(i)
+
+    def nvars(idx: List[int]) -> int:
+        return len(_union([full[i]["variable"] for i in idx]))
+
+    def geo_cost(idx: List[int]) -> float:
+        return model.call(n * nvars(idx))
+
+    # opción por región: estado completo (solo a nivel ciudad) o sus ciudades una a una
+    options: List[Tuple[str | None, List[int], float]] = []  # (región o None=geo, idx, costo)
+    total = 0.0
+    if by_level == lower:
+        per_region: Dict[str, List[tuple]] = {}
+        for geo in per_geo:
+            per_region.setdefault(geo[0], []).append(geo)
+        for region, geos in per_region.items():
+            idx = [i for g in geos for i in per_geo[g]]
+            narrow = sum(geo_cost(per_geo[g]) for g in geos)
+            wide = model.call(n * model.children(region) * nvars(idx))
+            if wide < narrow:
+                options.append((region, idx, wide))
+                total += wide
+            else:
+                options.extend((None, per_geo[g], geo_cost(per_geo[g])) for g in geos)
+                total += narrow
+        units = model.children(None)
+    else:
+        options = [(None, idx, geo_cost(idx)) for idx in per_geo.values()]
+        total = sum(c for _, _, c in options)
+        units = model.regions
+
+    national = model.call(n * units * nvars(members))
+    if national < total:
+        plan._add(fixed, _union([full[i]["variable"] for i in members]), list(members), national)
+        return
+    for region, idx, cost in options:
+        params = dict(fixed)
+        if region is not None:
+            params[upper] = region
+        else:
+            params[upper] = full[idx[0]][upper]
+            if by_level == lower:
+                params[lower] = full[idx[0]][lower]
+        plan._add(params, _union([full[i]["variable"] for i in idx]), idx, cost)
+
+
+# --------------------------------------------------------------------------------------
+# Separación de resultados
+# --------------------------------------------------------------------------------------
+def _group_slices(df: pd.DataFrame, keys: List[str]) -> Tuple[pd.DataFrame, Dict[tuple, slice]]:
+    """
+    `df` reordenado por grupo (orden estable) y el rango de filas de cada llave.
+
+    Un solo `take` y cortes contiguos: más barato que un `take` por serie.
+    """
+    grouped = df.groupby(keys, observed=True, sort=False)
+    codes = grouped.ngroup().to_numpy()
+    order = np.argsort(codes, kind="stable")
+    ordered = df.take(order)
+    bounds = np.searchsorted(codes[order], np.arange(grouped.ngroups + 1))
+    bounds = bounds[: np.searchsorted(bounds, len(df)) + 1]  # sin grupos de llaves nulas
+    firsts = ordered.iloc[bounds[:-1]][keys].itertuples(index=False, name=None)
+    return ordered, {
+        key: slice(lo, hi) for key, lo, hi in zip(firsts, bounds[:-1], bounds[1:])
+    }
+
+
+def split_frames(plan: QueryPlan, frames: Sequence[pd.DataFrame]) -> List[pd.DataFrame]:
+    """
+    Un DataFrame por serie (en el orden de `plan.series`) a partir de las respuestas
+    de `plan.calls`.
+
+    Las filas se agrupan de forma vectorizada (`groupby` + un reordenamiento) por las
+    columnas de geografía no fijadas por la llamada y `variable` (formato largo); si la
+    respuesta trae las variables como columnas (formato ancho), cada serie conserva
+    solo la suya.
+    """
+    upper, lower = GEO_LEVELS[plan.endpoint]
+    out: List[pd.DataFrame | None] = [None] * len(plan.series)
+    for call, df, members in zip(plan.calls, frames, plan.members):
+        variables = call["variable"] if isinstance(call["variable"], list) else [call["variable"]]
+        long = "variable" in df.columns
+        keys = [k for k in (upper, lower) if k not in call and k in df.columns]
+        if long and len(variables) > 1:
+            keys.append("variable")
+        ordered, slices = _group_slices(df, keys) if keys else (df, None)
+        for i in members:
+            s = plan.series[i]
+            part = df
+            if slices is not None:
+                key = tuple(s["variable"] if k == "variable" else s[k] for k in keys)
+                part = ordered.iloc[slices.get(key, slice(0, 0))]
+            if not long and len(variables) > 1:
+                part = part[[c for c in df.columns if c not in variables or c == s["variable"]]]
+            out[i] = part.reset_index(drop=True)
+    return out
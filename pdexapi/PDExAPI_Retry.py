@@ -0,0 +1,292 @@
+# ======================================================================================
+# Script:  PDExAPI_Retry.py
+# Purpose: política de reintentos con backoff y circuit breaker para los GET de PDEXClient
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `RetryPolicy`: cuántas veces y cuánto esperar antes de repetir un GET idempotente.
+  Backoff exponencial con jitter completo; respeta `Retry-After` en 429/503 y lleva
+  un presupuesto aparte para timeouts.
+• `CircuitBreaker`: tras `failure_threshold` fallas consecutivas abre el circuito y
+  las llamadas fallan al instante con `CircuitOpenError` (subclase de la
+  `ConnectionError` estándar) durante `reset_timeout` segundos; después deja pasar una
+  sola petición de prueba (half-open).
+• `RetryRunner`: ejecuta una petición bajo ambos y acumula contadores.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from .PDExAPI_Lazy import lazy_import
+
+requests = lazy_import("requests")
+email_utils = lazy_import("email.utils")
+
+
+class CircuitOpenError(ConnectionError):
+    """El circuito está abierto: la API se considera caída y no se envía la petición."""
+
+
+# --------------------------------------------------------------------------------------
+# Política de reintentos
+# --------------------------------------------------------------------------------------
+class RetryPolicy:
+    """
+    Parámetros de reintento para GETs idempotentes.
+
+    Parámetros
+    ----------
+    retries : int
+        Reintentos máximos por errores HTTP reintentables y errores de conexión.
+    timeout_retries : int
+        Reintentos máximos por timeouts (connect/read), contados por separado.
+    backoff : float
+        Espera base en segundos; el intento n espera U(0, backoff·2ⁿ) (jitter completo).
+    max_backoff : float
+        Tope de la espera calculada.
+    max_retry_after : float
+        Tope de la espera pedida por el servidor vía `Retry-After`.
+    statuses : set[int]
+        Códigos HTTP que se reintentan.
+    """
+
+    def __init__(
+        self,
+        *,
+        retries: int = 3,
+        timeout_retries: int = 2,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        max_retry_after: float = 120.0,
+        statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504}),
+    ):
+        if retries < 0 or timeout_retries < 0:
+            raise ValueError("retries y timeout_retries deben ser >= 0")
+        self.retries = retries
+        self.timeout_retries = timeout_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.statuses = frozenset(statuses)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(retries={self.retries}, timeout_retries={self.timeout_retries}, "
+            f"backoff={self.backoff})"
+        )
+
+    def delay(self, attempt: int, response: requests.Response | None = None) -> float:
+        """Segundos a esperar antes del reintento número `attempt` (desde 0)."""
+        if response is not None and response.status_code in (429, 503):
+            after = retry_after(response)
+            if after is not None:
+                return min(after, self.max_retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+def retry_after(response: requests.Response) -> Optional[float]:
+    """Segundos indicados por la cabecera `Retry-After` (entero o fecha HTTP)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(email_utils.parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+# --------------------------------------------------------------------------------------
+# Circuit breaker
+# --------------------------------------------------------------------------------------
+class CircuitBreaker:
+    """
+    Circuit breaker de tres estados (closed → open → half-open), seguro entre hilos.
+
+    Una instancia puede compartirse entre varios clientes que apuntan a la misma API.
+    """
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold debe ser >= 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Levanta `CircuitOpenError` si el circuito no admite la petición."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return
+            if state == "half-open" and not self._probing:
+                self._probing = True  # una sola petición de prueba
+                return
+            self.rejected += 1
+        raise CircuitOpenError("Circuito abierto: PDExAPI no responde, se omite la petición")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """La petición de prueba terminó sin veredicto (error local): otra puede probar."""
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._opened_at is None and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self.trips += 1
+            self._probing = False
+
+
+# --------------------------------------------------------------------------------------
+# Ejecución
+# --------------------------------------------------------------------------------------
+class RetryRunner:
+    """
+    Envía una petición con reintentos y circuit breaker y acumula contadores.
+
+    Parámetros
+    ----------
+    policy : RetryPolicy | None
+        None desactiva los reintentos.
+    breaker : CircuitBreaker | None
+        None desactiva el circuit breaker.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.policy = policy
+        self.breaker = breaker
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._counts = {
+            "attempts": 0,
+            "retries": 0,
+            "timeout_retries": 0,
+            "retry_after_waits": 0,
+            "gave_up": 0,
+            "backoff_seconds": 0.0,
+        }
+
+    def _count(self, key: str, value: float = 1) -> None:
+        with self._lock:
+            self._counts[key] += value
+
+    def call(self, send: Callable[[], requests.Response]) -> requests.Response:
+        """
+        Ejecuta `send()` hasta obtener una respuesta no reintentable.
+
+        Devuelve la última respuesta (aunque sea de error, para que el llamador haga
+        `raise_for_status`) o vuelve a levantar el último error de red.
+        """
+        policy = self.policy
+        errors = timeouts = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.before_call()
+            self._count("attempts")
+            response = None
+            try:
+                response = send()
+            except requests.Timeout:
+                self._failure()
+                if policy is None or timeouts >= policy.timeout_retries:
+                    self._count("gave_up")
+                    raise
+                wait = policy.delay(timeouts)
+                timeouts += 1
+                self._count("timeout_retries")
+            except requests.ConnectionError:
+                self._failure()
+                if policy is None or errors >= policy.retries:
+                    self._count("gave_up")
+                    raise
+                wait = policy.delay(errors)
+                errors += 1
+                self._count("retries")
+            except BaseException:
+                # error ajeno a la red (p.ej. en un hook): no dice nada del servidor, pero
+                # si era la prueba half-open hay que liberarla o el circuito no se cierra
+                if self.breaker is not None:
+                    self.breaker.release_probe()
+                raise
+            else:
+                status = response.status_code
+                if status < 500:
+                    if self.breaker is not None:
+                        self.breaker.record_success()  # 4xx/429: la API responde
+                    if status != 429:
+                        return response
+                else:
+                    self._failure()
+                if policy is None or status not in policy.statuses or errors >= policy.retries:
+                    if policy is not None and status in policy.statuses:
+                        self._count("gave_up")
+                    return response
+                if status in (429, 503) and retry_after(response) is not None:
+                    self._count("retry_after_waits")
+                wait = policy.delay(errors, response)
+                errors += 1
+                self._count("retries")
+                response.close()
+            self._count("backoff_seconds", wait)
+            self._sleep(wait)
+
+    def _failure(self) -> None:
+        if self.breaker is not None:
+            self.breaker.record_failure()
+
+    def stats(self) -> Dict[str, Any]:
+        """Intentos, reintentos, tiempo total en backoff y estado del circuit breaker."""
+        with self._lock:
+            out: Dict[str, Any] = dict(self._counts)
+        out["backoff_seconds"] = round(out["backoff_seconds"], 3)
+        if self.breaker is not None:
+            out["breaker_state"] = self.breaker.state
+            out["breaker_trips"] = self.breaker.trips
+            out["breaker_rejected"] = self.breaker.rejected
+        return out
@@ -0,0 +1,281 @@
+# ======================================================================================
+# Script:  PDExAPI_Scenarios.py
+# Purpose: generación vectorizada de escenarios correlacionados a partir de pronósticos
+#          puntuales y matrices de covarianza SARIMA
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+Para cada serie (estado × variable) con pronóstico puntual μ (h) y covarianza Σ (h × h),
+un escenario es μ + L·z con Σ = L·Lᵀ y z ~ N(0, I). Todas las series se muestrean a la
+vez con un solo `matmul` por lotes:
+
+• `cholesky_factors`: factores L de un arreglo (n, h, h), calculados una sola vez por
+  matriz (caché LRU por contenido). Si una matriz no es positiva definida se usa la
+  matriz PSD más cercana (eigenvalores negativos recortados a 0).
+• `ScenarioSampler`: muestrea N trayectorias por serie → arreglo (n, N, h) o tabla tidy.
+• `forecast_means`: alinea un DataFrame de `fc_clima_mes_estado` con las llaves de un
+  `CovarianceStack`.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+
+from collections import OrderedDict
+from typing import Any, List, Optional, Sequence, Tuple
+
+from .PDExAPI_Covariance import CovarianceStack
+
+
+# --------------------------------------------------------------------------------------
+# Factores de Cholesky con caché
+# --------------------------------------------------------------------------------------
+_FACTORS: OrderedDict = OrderedDict()  # digest → (L, fallback)
+_FACTORS_LOCK = threading.Lock()
+_FACTORS_MAX = 4096
+
+
+def _digest(matrix: np.ndarray) -> bytes:
+    m = np.ascontiguousarray(matrix, dtype=np.float64)
+    return hashlib.blake2b(m.tobytes() + str(m.shape).encode(), digest_size=16).digest()
+
+
+def _psd_factor(matrix: np.ndarray) -> np.ndarray:
+    """Factor de la matriz PSD más cercana (simétrica, eigenvalores negativos → 0)."""
+    sym = (matrix + matrix.T) / 2
+    w, v = np.linalg.eigh(sym)
+    return v * np.sqrt(np.clip(w, 0, None))
+
+
+def cholesky_factors(cov: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factores L (L·Lᵀ = Σ) de un arreglo de covarianzas (n, h, h).
+
+    Returns
+    -------
+    (L, fallback)
+        `L` con forma (n, h, h) y máscara booleana (n,) de las matrices que no eran
+        positivas definidas y se factorizaron por eigendescomposición.
+    """
+    cov = np.asarray(cov, dtype=np.float64)
+    if cov.ndim != 3 or cov.shape[1] != cov.shape[2]:
+        raise ValueError(f"Se esperaba un arreglo (n, h, h), no {cov.shape}")
+    n = len(cov)
+    L = np.empty_like(cov)
+    fallback = np.zeros(n, dtype=bool)
+    digests = [_digest(m) for m in cov]
+
+    missing: List[int] = []
+    with _FACTORS_LOCK:
+        for i, d in enumerate(digests):
+            hit = _FACTORS.get(d)
+            if hit is None:
+                missing.append(i)
+            else:
+                _FACTORS.move_to_end(d)
+                L[i], fallback[i] = hit
+
+    if missing:
+        sub = cov[missing]
+        try:
+            new = np.linalg.cholesky(sub)  # una sola llamada por lotes
+            bad = np.zeros(len(missing), dtype=bool)
+        except np.linalg.LinAlgError:
+            new = np.empty_like(sub)
+            bad = np.zeros(len(missing), dtype=bool)
+            for j, m in enumerate(sub):
+                try:
+                    new[j] = np.linalg.cholesky(m)
+                except np.linalg.LinAlgError:
+                    new[j] = _psd_factor(m)
+                    bad[j] = True
+        L[missing] = new
+        fallback[missing] = bad
+        with _FACTORS_LOCK:
+            for j, i in enumerate(missing):
+                _FACTORS[digests[i]] = (new[j].copy(), bool(bad[j]))
+            while len(_FACTORS) > _FACTORS_MAX:
+                _FACTORS.popitem(last=False)
+    return L, fallback
+
+
+def clear_factor_cache() -> None:
+    """Vacía la caché de factores de Cholesky."""
+    with _FACTORS_LOCK:
+        _FACTORS.clear()
+
+
+# --------------------------------------------------------------------------------------
+# Alineación de pronósticos
+# --------------------------------------------------------------------------------------
+def forecast_means(
+    df: pd.DataFrame,
+    keys: Sequence[Tuple[Any, ...]],
+    *,
+    h: int,
+    value: str = "valor",
+) -> Tuple[np.ndarray, List[Any]]:
+    """
+    Matriz (n, h) de pronósticos puntuales en el orden de `keys`.
+
+    Parámetros
+    ----------
+    df : DataFrame
+        Salida de `fc_clima_mes_estado` (columnas `fecha`, `estado`, `variable`, `value`
+        y, si se combinaron varias iteraciones, `fecha_modelo`).
+    keys : secuencia de (fecha_modelo, variable, estado)
+        Llaves de un `CovarianceStack`; `estado=None` es "Nacional".
+    h : int
+        Horizonte; se toman los primeros `h` meses de cada serie.
+
+    Returns
+    -------
+    (mean, fechas)
+        Pronósticos y las `h` fechas de la primera serie.
+
+    Si `df` no trae `fecha_modelo`, las llaves deben compartir una sola iteración; de lo
+    contrario no habría forma de saber qué pronóstico corresponde a cada una y se lanza
+    `ValueError`. También se rechazan series con meses repetidos.
+    """
+    by_model = "fecha_modelo" in df.columns
+    if not by_model and len({str(k[0])[:10] for k in keys}) > 1:
+        raise ValueError(
+            "Las llaves traen varias `fecha_modelo` pero el DataFrame no tiene esa columna"
+        )
+    if by_model:
+        df = df.assign(fecha_modelo=df["fecha_modelo"].astype(str).str[:10])
+    cols = ["fecha_modelo", "variable", "estado"] if by_model else ["variable", "estado"]
+    groups = {
+        k: g.sort_values("fecha")
+        for k, g in df.groupby(cols, observed=True, dropna=False)
+    }
+    mean = np.empty((len(keys), h), dtype=np.float64)
+    fechas: List[Any] = []
+    for i, (fecha_modelo, variable, estado) in enumerate(keys):
+        estado = "Nacional" if estado is None else estado
+        key = (str(fecha_modelo)[:10], variable, estado) if by_model else (variable, estado)
+        g = groups.get(key)
+        if g is None or len(g) < h:
+            raise KeyError(f"Sin {h} meses de pronóstico para {key!r}")
+        if g["fecha"].duplicated().any():
+            raise ValueError(f"Meses repetidos en el pronóstico de {key!r}")
+        mean[i] = g[value].to_numpy(dtype=np.float64)[:h]
+        if not fechas:
+            fechas = list(g["fecha"].iloc[:h])
+    return mean, fechas
+
+
+# --------------------------------------------------------------------------------------
+# Muestreo
+# --------------------------------------------------------------------------------------
+class ScenarioSampler:
+    """
+    Muestreador de escenarios correlacionados para muchas series a la vez.
+
+    Parámetros
+    ----------
+    cov : CovarianceStack | np.ndarray
+        Covarianzas (n, h, h) o una sola matriz (h, h).
+    keys : lista de tuplas, opcional
+        Llave por serie (se toma del `CovarianceStack` si no se indica).
+
+    Ejemplo
+    -------
+    >>> S = cli.cov_matrices(fecha_modelo="2025-06-01", forecast_horizon=12,
+    ...                      variable="avgtemp_c", estado=estados)
+    >>> fc = cli.fc_clima_mes_estado(..., as_frame=True)
+    >>> sampler = ScenarioSampler(S)
+    >>> paths = sampler.sample(forecast_means(fc, S.keys, h=12)[0], 10_000, seed=7)
+    >>> paths.shape
+    (32, 10000, 12)
+    """
+
+    def __init__(
+        self,
+        cov: CovarianceStack | np.ndarray,
+        *,
+        keys: Optional[Sequence[tuple]] = None,
+    ):
+        if isinstance(cov, CovarianceStack):
+            keys = cov.keys if keys is None else keys
+            cov = cov.array
+        cov = np.asarray(cov, dtype=np.float64)
+        if cov.ndim == 2:
+            cov = cov[None]
+        self.cov = cov
+        self.keys = list(keys) if keys is not None else list(range(len(cov)))
+        if len(self.keys) != len(cov):
+            raise ValueError("keys y cov tienen distinto número de series")
+        self.factors, self.fallback = cholesky_factors(cov)
+
+    @property
+    def n_series(self) -> int:
+        return self.cov.shape[0]
+
+    @property
+    def horizon(self) -> int:
+        return self.cov.shape[1]
+
+    def sample(
+        self,
+        mean: np.ndarray,
+        n_paths: int,
+        *,
+        seed: int | np.random.Generator | None = None,
+        tidy: bool = False,
+        fechas: Optional[Sequence[Any]] = None,
+        dtype: Any = np.float64,
+    ) -> np.ndarray | pd.DataFrame:
+        """
+        Genera `n_paths` trayectorias por serie.
+
+        Parámetros
+        ----------
+        mean : np.ndarray
+            Pronóstico puntual (n, h) (o (h,) si hay una sola serie).
+        seed : int | Generator, opcional
+            Semilla para resultados reproducibles.
+        tidy : bool
+            Si True, devuelve DataFrame largo (llaves, `escenario`, `h` o `fecha`, `valor`);
+            si False, arreglo (n, n_paths, h).
+        dtype : numpy dtype
+            float32 reduce a la mitad la memoria de resultados grandes.
+        """
+        mean = np.asarray(mean, dtype=np.float64)
+        if mean.ndim == 1:
+            mean = mean[None]
+        n, h = self.n_series, self.horizon
+        if mean.shape != (n, h):
+            raise ValueError(f"mean debe tener forma {(n, h)}, no {mean.shape}")
+        rng = np.random.default_rng(seed)
+        z = rng.standard_normal((n, n_paths, h), dtype=np.float64)
+        paths = np.matmul(z, self.factors.transpose(0, 2, 1))  # (n, N, h) por lotes
+        paths += mean[:, None, :]
+        paths = paths.astype(dtype, copy=False)
+        return self._tidy(paths, fechas) if tidy else paths
+
+    def _tidy(self, paths: np.ndarray, fechas: Optional[Sequence[Any]]) -> pd.DataFrame:
+        n, N, h = paths.shape
+        keys = self.keys
+        serie = np.repeat(np.arange(n), N * h)
+        out = {}
+        if keys and all(isinstance(k, tuple) and len(k) == 3 for k in keys):
+            for j, name in enumerate(("fecha_modelo", "variable", "estado")):
+                col = pd.Categorical([k[j] for k in keys])
+                out[name] = pd.Categorical.from_codes(col.codes[serie], col.categories)
+        else:
+            out["serie"] = np.asarray(keys, dtype=object)[serie]
+        out["escenario"] = np.tile(np.repeat(np.arange(N), h), n)
+        steps = np.tile(np.arange(h), n * N)
+        if fechas is not None:
+            out["fecha"] = pd.to_datetime(pd.Index(list(fechas)))[steps]
+        else:
+            out["h"] = steps + 1
+        out["valor"] = paths.reshape(-1)
+        return pd.DataFrame(out, copy=False)
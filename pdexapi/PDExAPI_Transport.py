@@ -0,0 +1,167 @@
+# ======================================================================================
+# Script:  PDExAPI_Transport.py
+# Purpose: capa de transporte HTTP con pool de conexiones keep-alive para PDEXClient
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `PDEXTransport`: envoltura de `requests.Session` con un `HTTPAdapter` dimensionado,
+  compartida por el login y todas las consultas GET del cliente.
+• Reporta cuántas conexiones TCP se abrieron y cuántas peticiones las reutilizaron.
+• `compression`: `Accept-Encoding` con zstd/br/gzip según los códecs instalados
+  (urllib3 descomprime de forma transparente).
+• Cada respuesta trae `phases`: segundos de conexión (TCP/TLS, 0 si se reutilizó),
+  servidor (hasta recibir cabeceras) y descarga del cuerpo.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+import threading
+import time
+import requests
+
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from .PDExAPI_Wire import accept_encoding
+
+
+# --------------------------------------------------------------------------------------
+# Conexiones cronometradas
+# --------------------------------------------------------------------------------------
+_TLS = threading.local()  # segundos de conexión acumulados por la petición del hilo
+
+
+class _TimedConnect:
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _TLS.connect = getattr(_TLS, "connect", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_TimedConnect, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnect, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPPool,
+            "https": _TimedHTTPSPool,
+        }
+
+
+class PDEXTransport:
+    """
+    Sesión HTTP con conexiones persistentes (keep-alive).
+
+    Parámetros
+    ----------
+    pool_connections : int
+        Número de hosts distintos cuyos pools se mantienen vivos.
+    pool_maxsize : int
+        Conexiones máximas conservadas por host; debe cubrir el número de hilos
+        que usan el cliente de forma concurrente.
+    pool_block : bool
+        Si True, una petición espera a que se libere una conexión en lugar de
+        abrir una extra fuera del pool.
+    compression : bool
+        Si False, pide respuestas sin comprimir (`identity`).
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        compression: bool = True,
+    ):
+        self.session = requests.Session()
+        self._adapter = _TimedAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        self.session.headers["Accept-Encoding"] = accept_encoding(compression)
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._closed = False
+
+    # ------------------------------------------------------------------ #
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Petición HTTP; la respuesta trae `phases` (connect/server/download, segundos)."""
+        if self._closed:
+            raise RuntimeError("El transporte de PDEXClient ya fue cerrado.")
+        _TLS.connect = 0.0
+        start = time.perf_counter()
+        r = self.session.request(method, url, **kwargs)
+        total = time.perf_counter() - start
+        connect = _TLS.connect
+        elapsed = r.elapsed.total_seconds()  # hasta recibir cabeceras
+        r.phases = {
+            "connect": connect,
+            "server": max(elapsed - connect, 0.0),
+            "download": max(total - elapsed, 0.0),  # ~0 con stream=True
+        }
+        with self._lock:
+            self._requests += 1
+        return r
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    # ------------------------------------------------------------------ #
+    def stats(self) -> Dict[str, int]:
+        """
+        Conteo de conexiones del pool.
+
+        Returns
+        -------
+        dict
+            `requests` (peticiones enviadas), `connections` (conexiones TCP
+            abiertas) y `reused` (peticiones servidas por una conexión existente).
+        """
+        pools = self._adapter.poolmanager.pools
+        connections = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+        with self._lock:
+            n = self._requests
+        return {
+            "requests": n,
+            "connections": connections,
+            "reused": max(n - connections, 0),
+        }
+
+    def close(self) -> None:
+        """Cierra todas las conexiones abiertas del pool."""
+        if not self._closed:
+            self._closed = True
+            self.session.close()
@@ -0,0 +1,163 @@
+# ======================================================================================
+# Script:  PDExAPI_Wire.py
+# Purpose: negociación de compresión y formato de respuesta (JSON / Arrow IPC /
+#          MessagePack) y decodificación directa a columnas tipadas
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+• `accept_encoding`: `Accept-Encoding` con los códecs que urllib3 sabe descomprimir en
+  esta instalación, en orden de preferencia zstd > br > gzip > deflate (zstd requiere
+  `backports.zstd` en Python < 3.14, br requiere `brotli`).
+• `accept`: cabecera `Accept` según `wire_format`; los formatos binarios siempre dejan
+  JSON como alternativa, así que un servidor que no los anuncia responde JSON.
+• `sniff` identifica el formato del cuerpo por sus primeros bytes (las cachés guardan
+  el cuerpo crudo sin tipo de contenido):
+    - Arrow IPC stream: marcador de continuación 0xFFFFFFFF
+    - MessagePack: arreglo/mapa (primer byte ≥ 0x80), nunca un inicio válido de JSON
+• `decode` devuelve el mismo valor que `json.loads` daría para el endpoint;
+  `decode_frame` construye el DataFrame directo desde las columnas tipadas.
+• MessagePack admite registros (igual que JSON) o el sobre columnar
+  `{"columns": {nombre: [valores], ...}}`.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+from __future__ import annotations
+
+import json
+
+from typing import Any, Dict, List, Literal
+
+from .PDExAPI_Lazy import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+pa = lazy_import("pyarrow", optional=True)  # dependencia opcional
+msgpack = lazy_import("msgpack", optional=True)  # dependencia opcional
+
+
+WireFormat = Literal["json", "auto", "arrow", "msgpack"]
+WIRE_FORMATS = ("json", "auto", "arrow", "msgpack")
+
+JSON_TYPE = "application/json"
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+MSGPACK_TYPE = "application/msgpack"
+
+_ENCODING_PREFERENCE = ("zstd", "br", "gzip", "deflate")
+_ARROW_MAGIC = b"\xff\xff\xff\xff"
+
+
+# --------------------------------------------------------------------------------------
+# Negociación
+# --------------------------------------------------------------------------------------
+def available_encodings() -> List[str]:
+    """Códecs de `Content-Encoding` que urllib3 puede descomprimir aquí."""
+    from urllib3.util.request import ACCEPT_ENCODING  # solo al crear el transporte
+
+    supported = set(ACCEPT_ENCODING.split(","))
+    return [e for e in _ENCODING_PREFERENCE if e in supported]
+
+
+def accept_encoding(enabled: bool = True) -> str:
+    """Valor de `Accept-Encoding` (q decreciente por preferencia) o `identity`."""
+    if not enabled:
+        return "identity"
+    codecs = available_encodings()
+    return ", ".join(
+        c if i == 0 else f"{c};q={1 - i / 10:.1f}" for i, c in enumerate(codecs)
+    )
+
+
+def resolve_format(wire_format: WireFormat) -> str:
+    """Formato binario efectivo ("json" si el solicitado no está instalado en modo auto)."""
+    if wire_format not in WIRE_FORMATS:
+        raise ValueError(f"wire_format debe ser uno de {WIRE_FORMATS}")
+    if wire_format == "auto":
+        return "arrow" if pa is not None else "msgpack" if msgpack is not None else "json"
+    if wire_format == "arrow" and pa is None:
+        raise ImportError("wire_format='arrow' requiere pyarrow: pip install 'pdexapi[parquet]'")
+    if wire_format == "msgpack" and msgpack is None:
+        raise ImportError("wire_format='msgpack' requiere msgpack: pip install 'pdexapi[wire]'")
+    return wire_format
+
+
+def accept(wire_format: WireFormat) -> str:
+    """Valor de `Accept`: el formato preferido y JSON como alternativa."""
+    fmt = resolve_format(wire_format)
+    if fmt == "arrow":
+        return f"{ARROW_TYPE}, {JSON_TYPE};q=0.5"
+    if fmt == "msgpack":
+        return f"{MSGPACK_TYPE}, {JSON_TYPE};q=0.5"
+    return JSON_TYPE
+
+
+# --------------------------------------------------------------------------------------
+# Decodificación
+# --------------------------------------------------------------------------------------
+def sniff(body: bytes) -> str:
+    """"arrow", "msgpack" o "json" según los primeros bytes del cuerpo."""
+    if body[:4] == _ARROW_MAGIC:
+        return "arrow"
+    if body and body[0] >= 0x80 and body[:3] != b"\xef\xbb\xbf":  # BOM UTF-8 = JSON
+        return "msgpack"
+    return "json"
+
+
+def _arrow_table(body: bytes) -> "pa.Table":
+    if pa is None:
+        raise ImportError("La respuesta viene en Arrow IPC y pyarrow no está instalado")
+    return pa.ipc.open_stream(body).read_all()
+
+
+def _msgpack(body: bytes) -> Any:
+    if msgpack is None:
+        raise ImportError("La respuesta viene en MessagePack y msgpack no está instalado")
+    return msgpack.unpackb(body, raw=False)
+
+
+def _columns(obj: Any) -> Dict[str, list] | None:
+    """Columnas del sobre `{"columns": {...}}` o None si son registros/otro valor."""
+    if isinstance(obj, dict) and len(obj) == 1 and isinstance(obj.get("columns"), dict):
+        return obj["columns"]
+    return None
+
+
+def decode(body: bytes) -> Any:
+    """Valor JSON equivalente (registros como lista de dicts, fechas como texto ISO)."""
+    fmt = sniff(body)
+    if fmt == "json":
+        return json.loads(body)
+    if fmt == "msgpack":
+        obj = _msgpack(body)
+        cols = _columns(obj)
+        if cols is None:
+            return obj
+        names = list(cols)
+        return [dict(zip(names, row)) for row in zip(*cols.values())]
+    table = _arrow_table(body)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table.to_pylist()
+
+
+def decode_frame(body: bytes) -> pd.DataFrame | None:
+    """
+    DataFrame tipado directo desde un cuerpo Arrow o MessagePack.
+
+    Devuelve None para JSON (el cliente usa su propio camino de decodificación).
+    """
+    fmt = sniff(body)
+    if fmt == "json":
+        return None
+    if fmt == "arrow":
+        # date32 → datetime64 y columnas diccionario → category, sin objetos Python
+        return _arrow_table(body).to_pandas(date_as_object=False)
+    obj = _msgpack(body)
+    cols = _columns(obj)
+    if cols is None:
+        return pd.DataFrame(obj)
+    return pd.DataFrame({k: np.asarray(v) for k, v in cols.items()}, copy=False)
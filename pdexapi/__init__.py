@@ -1,3 +1,75 @@
-from .PDExAPI_Client import PDEXClient
+import importlib
 
-__all__ = ["PDEXClient"]
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+# Exportaciones diferidas (PEP 562): `import pdexapi` no importa ningún submódulo y
+# `from pdexapi import PDEXClient` solo carga lo que el cliente necesita; numpy, pandas
+# y requests se importan hasta que se usan (ver PDExAPI_Lazy)
+_EXPORTS = {
+    "PDEXClient": "PDExAPI_Client",
+    "AsyncPDEXClient": "PDExAPI_AsyncClient",
+    "FileTokenStore": "PDExAPI_Auth",
+    "MemoCache": "PDExAPI_Cache",
+    "RangeCache": "PDExAPI_Cache",
+    "ResponseCache": "PDExAPI_Cache",
+    "CovarianceStack": "PDExAPI_Covariance",
+    "CovarianceStore": "PDExAPI_Covariance",
+    "AdaptiveLimit": "PDExAPI_Limits",
+    "RateController": "PDExAPI_Limits",
+    "TokenBucket": "PDExAPI_Limits",
+    "Metrics": "PDExAPI_Metrics",
+    "ParquetMirror": "PDExAPI_Mirror",
+    "CostModel": "PDExAPI_Planner",
+    "CircuitBreaker": "PDExAPI_Retry",
+    "CircuitOpenError": "PDExAPI_Retry",
+    "RetryPolicy": "PDExAPI_Retry",
+    "ScenarioSampler": "PDExAPI_Scenarios",
+}
+
+if TYPE_CHECKING:
+    from .PDExAPI_Client import PDEXClient
+    from .PDExAPI_AsyncClient import AsyncPDEXClient
+    from .PDExAPI_Auth import FileTokenStore
+    from .PDExAPI_Cache import MemoCache, RangeCache, ResponseCache
+    from .PDExAPI_Covariance import CovarianceStack, CovarianceStore
+    from .PDExAPI_Limits import AdaptiveLimit, RateController, TokenBucket
+    from .PDExAPI_Metrics import Metrics
+    from .PDExAPI_Mirror import ParquetMirror
+    from .PDExAPI_Planner import CostModel
+    from .PDExAPI_Retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+    from .PDExAPI_Scenarios import ScenarioSampler
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = [
+    "PDEXClient",
+    "AsyncPDEXClient",
+    "RangeCache",
+    "ResponseCache",
+    "MemoCache",
+    "CovarianceStack",
+    "CovarianceStore",
+    "ParquetMirror",
+    "CostModel",
+    "FileTokenStore",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RetryPolicy",
+    "RateController",
+    "AdaptiveLimit",
+    "TokenBucket",
+    "Metrics",
+    "ScenarioSampler",
+]
@@ -0,0 +1,504 @@
+# ======================================================================================
+# Script:  stub_server.py
+# Purpose: servidor HTTP local que imita a PDEXAPI para pruebas sin credenciales reales
+# Author:  Equipo Polydata
+# Created: 2026‑10‑17  |  Last Updated: 2026‑10‑17  |  Version: 1.0
+# ======================================================================================
+"""Resumen
+-----------
+`StubPDEXAPI` levanta un `ThreadingHTTPServer` en 127.0.0.1 (puerto libre) que
+responde `/token` y los endpoints GET usados por `PDEXClient` con datos sintéticos:
+
+>>> with StubPDEXAPI() as stub:
+...     cli = PDEXClient(stub.base_url, "demo", "demo")
+...     cli.list_tables()
+
+Negocia como un servidor real: comprime con zstd/br/gzip según `Accept-Encoding` (si
+`compress`) y, si `Accept` lo pide, responde los datos tabulares en Arrow IPC (fecha
+date32, texto como diccionario) o MessagePack columnar.
+
+Para benchmarks: `fanout` multiplica las filas (una ciudad sintética por copia cuando
+la consulta no fija `ciudad`) e `inject` agrega latencia con jitter y errores aleatorios.
+Con `catalog` (estado → ciudades) los endpoints Copernicus con `nivel` responden las
+consultas amplias (estado/ciudad en None) con cada estado o ciudad del catálogo.
+
+Con `paginate` ("offset" o "cursor") las respuestas tabulares respetan `limit` y
+`offset`/`cursor` e informan `X-Total-Count` o `X-Next-Cursor`; "silent" respeta
+`limit`/`offset` sin informar ninguna de las dos cabeceras; "reject" imita un servidor
+que no conoce la paginación y responde 422 a `limit`.
+
+Con `validators` las respuestas 200 llevan `ETag` (hash del cuerpo y de `revision`) y
+`Last-Modified`, y un GET condicional sin cambios recibe 304 sin cuerpo; incrementar
+`revision` simula datos nuevos.
+-----------
+"""
+# --------------------------------------------------------------------------------------
+# Librerias
+# --------------------------------------------------------------------------------------
+import gzip
+import hashlib
+import json
+import random
+import threading
+import time
+
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    from backports import zstd
+except ImportError:
+    try:
+        from compression import zstd  # Python >= 3.14
+    except ImportError:
+        zstd = None
+
+ARROW_TYPE = "application/vnd.apache.arrow.stream"
+MSGPACK_TYPE = "application/msgpack"
+
+
+TABLES = [
+    "inflacion",
+    "clima_historico",
+    "fc_clima_mes",
+    "fc_clima_diario",
+    "copernicus_historical",
+    "poblacion",
+    "turismo",
+    "dias_festivos",
+]
+
+GEO_KEYS = ("estado", "ciudad", "pais", "departamento", "municipio")
+
+
+def _dates(fecha_inicio: str, fecha_fin: str, freq: str) -> List[str]:
+    ini = date.fromisoformat(fecha_inicio[:10])
+    fin = date.fromisoformat(fecha_fin[:10])
+    out: List[str] = []
+    cur = ini
+    while cur <= fin:
+        out.append(cur.isoformat())
+        if freq == "M":
+            cur = (cur.replace(day=1) + timedelta(days=32)).replace(day=1)
+        else:
+            cur += timedelta(days=1)
+    return out
+
+
+def _geographies(one: Dict[str, str], catalog: Dict[str, List[str]]) -> List[Dict[str, str]]:
+    """Geografías de una consulta Copernicus con `nivel` según el catálogo de ciudades
+    (estado/ciudad en None = todos, como la API)."""
+    estados = [one["estado"]] if "estado" in one else list(catalog)
+    if one["nivel"] == "estado":
+        return [{"estado": e} for e in estados]
+    if "ciudad" in one:
+        return [{"estado": one["estado"], "ciudad": one["ciudad"]}]
+    return [{"estado": e, "ciudad": c} for e in estados for c in catalog.get(e, [])]
+
+
+def synthetic_payload(
+    path: str,
+    params: Dict[str, List[str]],
+    fanout: int = 1,
+    catalog: Dict[str, List[str]] | None = None,
+) -> Any:
+    """Genera una respuesta determinista a partir de la ruta y los parámetros."""
+    one = {k: v[-1] for k, v in params.items()}
+    if path == "/tables":
+        return list(TABLES)
+    if path == "/cov_matrix":
+        h = int(one.get("forecast_horizon", 3))
+        return [[1.0 / (1 + abs(i - j)) for j in range(h)] for i in range(h)]
+    if path == "/dias_festivos":
+        return [
+            {"fecha": "2025-01-01", "festivo": "Año Nuevo"},
+            {"fecha": "2025-09-16", "festivo": "Independencia"},
+        ]
+    if path == "/poblacion":
+        return [{"estado": one.get("estado"), "ciudad": one.get("ciudad"), "poblacion": 1000}]
+
+    freq = "M" if path.endswith("_mes") or path.endswith("_mes_estado") or one.get("freq") == "M" else "D"
+    if path in ("/copernicus_forecast", "/copernicus_forecast_latam"):
+        ini = one.get("fecha_entrenamiento", "2025-01-01")
+        fh = int(one.get("fh", 1))
+        start = date.fromisoformat(ini[:10]).replace(day=1)
+        fin = start
+        for _ in range(fh - 1):
+            fin = (fin + timedelta(days=32)).replace(day=1)
+        fechas = _dates(start.isoformat(), fin.isoformat(), "M")
+    elif "fecha_inicio" in one and "fecha_fin" in one:
+        fechas = _dates(one["fecha_inicio"], one["fecha_fin"], freq)
+    else:
+        fechas = ["2025-01-01"]
+
+    geo = {k: one[k] for k in GEO_KEYS if k in one}
+    if path == "/turismo":  # llave de fecha propia y sin columna `variable`
+        return [
+            {"fecha_periodo": f, **geo,
+             "valor": round(100.0 + date.fromisoformat(f).toordinal() % 11, 3)}
+            for f in fechas
+        ]
+
+    variables = params.get("variable") or ["valor"]
+    if catalog and path.startswith("/copernicus") and one.get("nivel") in ("estado", "ciudad"):
+        copies = _geographies(one, catalog)
+    else:
+        copies = [geo] if fanout <= 1 or "ciudad" in geo else [
+            {**geo, "ciudad": f"Ciudad {i}"} for i in range(fanout)
+        ]
+    rows = []
+    for f in fechas:
+        day = date.fromisoformat(f).toordinal()
+        for g in copies:
+            for var in variables:
+                row: Dict[str, Any] = {"fecha": f, **g, "variable": var}
+                row["valor"] = round(20.0 + (day % 7) + len(var) / 10, 3)
+                if catalog:  # distinto por geografía para verificar la separación
+                    row["valor"] += sum(map(ord, g.get("ciudad", g.get("estado", "")))) % 97
+                rows.append(row)
+    return rows
+
+
+def paginate(rows: List[Any], params: Dict[str, List[str]], mode: str) -> tuple:
+    """(filas de la página, cabeceras) según `limit` y `offset` o `cursor`."""
+    limit = int(params["limit"][-1])
+    if mode in ("offset", "silent"):
+        start = int(params.get("offset", ["0"])[-1])
+        headers = {"X-Total-Count": str(len(rows))} if mode == "offset" else {}
+        return rows[start:start + limit], headers
+    cursor = params.get("cursor", ["p0"])[-1]  # cursor opaco para el cliente
+    start = int(cursor[1:])
+    headers = {"X-Next-Cursor": f"p{start + limit}"} if start + limit < len(rows) else {}
+    return rows[start:start + limit], headers
+
+
+def _accepted(header: str | None) -> List[str]:
+    """Tokens de una cabecera Accept/Accept-Encoding sin los marcados con q=0."""
+    out = []
+    for part in (header or "").split(","):
+        token, _, q = part.strip().partition(";")
+        if token and q.replace(" ", "") != "q=0":
+            out.append(token.strip().lower())
+    return out
+
+
+def encode_payload(payload: Any, accept: str | None) -> tuple:
+    """(cuerpo, content-type) según `Accept`; solo las tablas van en formato binario."""
+    types = _accepted(accept)
+    tabular = isinstance(payload, list) and payload and isinstance(payload[0], dict)
+    if tabular and pa is not None and ARROW_TYPE in types:
+        table = pa.Table.from_pylist(payload)
+        for i, field in enumerate(table.schema):
+            if field.name == "fecha":
+                col = table.column(i).cast(pa.date32())
+            elif pa.types.is_string(field.type):
+                col = table.column(i).dictionary_encode()
+            else:
+                continue
+            table = table.set_column(i, field.name, col)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), ARROW_TYPE
+    if msgpack is not None and MSGPACK_TYPE in types:
+        if tabular:
+            payload = {"columns": {k: [row.get(k) for row in payload] for k in payload[0]}}
+        return msgpack.packb(payload), MSGPACK_TYPE
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()  # como FastAPI
+    return body, "application/json"
+
+
+def compress_body(body: bytes, accept_encoding: str | None) -> tuple:
+    """(cuerpo, content-encoding o None) con la preferencia del servidor zstd > br > gzip."""
+    codecs = _accepted(accept_encoding)
+    if len(body) < 256:
+        return body, None
+    if zstd is not None and "zstd" in codecs:
+        return zstd.compress(body), "zstd"
+    if brotli is not None and "br" in codecs:
+        return brotli.compress(body, quality=4), "br"
+    if "gzip" in codecs:
+        return gzip.compress(body, compresslevel=5), "gzip"
+    return body, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # cabeceras y cuerpo van en escrituras separadas
+
+    def log_message(self, *args):  # silencio en pruebas
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.stub._on_connection()
+
+    def _send_json(self, status: int, payload: Any, headers: Dict[str, str] | None = None) -> None:
+        stub = self.server.stub
+        if status == 200:
+            body, ctype = encode_payload(payload, self.headers.get("Accept"))
+        else:
+            body, ctype = encode_payload(payload, None)
+        if status == 200 and stub.validators:
+            etag = f'"{hashlib.sha1(body).hexdigest()[:16]}-{stub.revision}"'
+            modified = f"Mon, {stub.revision + 1:02d} Sep 2025 00:00:00 GMT"
+            headers = {**(headers or {}), "ETag": etag, "Last-Modified": modified}
+            match = self.headers.get("If-None-Match")
+            since = self.headers.get("If-Modified-Since")
+            if (match == etag) if match is not None else (since == modified):
+                stub._served("not-modified", None)
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+        encoding = None
+        if stub.compress:
+            body, encoding = compress_body(body, self.headers.get("Accept-Encoding"))
+        stub._served(ctype, encoding)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", ctype)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept, Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        stub = self.server.stub
+        stub._record("POST", self.path, {})
+        if urlsplit(self.path).path != "/token":
+            self._send_json(404, {"detail": "Not Found"})
+            return
+        payload = {"access_token": stub.token, "token_type": "bearer"}
+        if stub.expires_in is not None:
+            payload["expires_in"] = stub.expires_in
+        self._send_json(200, payload)
+
+    def do_GET(self):
+        stub = self.server.stub
+        parts = urlsplit(self.path)
+        params = parse_qs(parts.query)
+        stub._record("GET", parts.path, params)
+        if self.headers.get("Authorization") != f"Bearer {stub.token}":
+            self._send_json(401, {"detail": "Invalid token"})
+            return
+        if not stub._admit():
+            self._send_json(429, {"detail": "capacidad excedida"})
+            return
+        try:
+            self._serve(stub, parts.path, params)
+        finally:
+            stub._leave()
+
+    def _serve(self, stub: "StubPDEXAPI", path: str, params: Dict[str, List[str]]) -> None:
+        delay = stub._pop_delay(path) or stub._sample_latency()
+        if delay:
+            time.sleep(delay)
+        failure = stub._pop_failure(path) or stub._sample_error()
+        if failure is not None:
+            status, headers = failure
+            if status == 304:  # sin cuerpo, como exige HTTP
+                self.send_response(304)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                return
+            self._send_json(status, {"detail": "fallo inyectado"}, headers)
+            return
+        try:
+            payload = stub._payload(path, params)
+        except ValueError as exc:
+            self._send_json(422, {"detail": str(exc)})
+            return
+        headers: Dict[str, str] = {}
+        if stub.paginate and "limit" in params and isinstance(payload, list):
+            if stub.paginate == "reject":
+                self._send_json(422, {"detail": "parámetro desconocido: limit"})
+                return
+            payload, headers = paginate(payload, params, stub.paginate)
+        self._send_json(200, payload, headers)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):  # cliente que cortó por timeout
+        pass
+
+
+class StubPDEXAPI:
+    """Servidor local que imita PDEXAPI; usar como context manager."""
+
+    def __init__(self, *, token: str = "stub-token"):
+        self.token = token
+        self.expires_in: float | None = None  # vida del token informada en `/token`
+        self.requests: List[tuple] = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._failures: Dict[str, List[tuple]] = {}
+        self._delays: Dict[str, List[float]] = {}
+        self.capacity: int | None = None
+        self.latency = 0.0
+        self.jitter = 0.0
+        self.error_rate = 0.0
+        self.error_status = 503
+        self.fanout = 1
+        self.catalog: Dict[str, List[str]] | None = None  # estado → ciudades (Copernicus)
+        self.compress = True
+        self.paginate: str | None = None  # "offset" | "cursor" | "silent" | "reject"
+        self.validators = False  # ETag/Last-Modified y 304 condicionales
+        self.revision = 0
+        self._last_payload: tuple | None = None
+        self.served: Dict[str, int] = {}  # "content-type|content-encoding" → respuestas
+        self._rng = random.Random(0)
+        self._inflight = 0
+        self.peak_inflight = 0
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------ #
+    def _on_connection(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def _record(self, method: str, path: str, params: Dict[str, List[str]]) -> None:
+        with self._lock:
+            self.requests.append((method, path, params))
+
+    def fail_next(
+        self, path: str, times: int = 1, status: int = 502, *, retry_after: str | None = None
+    ) -> None:
+        """Las siguientes `times` peticiones a `path` responden `status` (con `Retry-After`)."""
+        headers = {"Retry-After": retry_after} if retry_after is not None else {}
+        with self._lock:
+            self._failures.setdefault(path, []).extend([(status, headers)] * times)
+
+    def delay_next(self, path: str, seconds: float, times: int = 1) -> None:
+        """Las siguientes `times` peticiones a `path` tardan `seconds` antes de responder."""
+        with self._lock:
+            self._delays.setdefault(path, []).extend([seconds] * times)
+
+    def limit_capacity(self, max_inflight: int | None, latency: float = 0.0) -> None:
+        """Simula un servidor saturable: GETs simultáneos por encima de `max_inflight`
+        reciben 429 y los admitidos tardan `latency` segundos."""
+        with self._lock:
+            self.capacity = max_inflight
+            self.latency = latency
+
+    def inject(
+        self,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+    ) -> None:
+        """Cada GET tarda `latency` + U(0, `jitter`) s y falla con `error_status` con
+        probabilidad `error_rate` (secuencia reproducible con `seed`)."""
+        with self._lock:
+            self.latency, self.jitter = latency, jitter
+            self.error_rate, self.error_status = error_rate, error_status
+            self._rng = random.Random(seed)
+
+    def _sample_latency(self) -> float:
+        with self._lock:
+            return self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _sample_error(self) -> tuple | None:
+        with self._lock:
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return self.error_status, {}
+            return None
+
+    def _admit(self) -> bool:
+        with self._lock:
+            if self.capacity is not None and self._inflight >= self.capacity:
+                return False
+            self._inflight += 1
+            self.peak_inflight = max(self.peak_inflight, self._inflight)
+            return True
+
+    def _leave(self) -> None:
+        with self._lock:
+            self._inflight -= 1
+
+    def _served(self, ctype: str, encoding: str | None) -> None:
+        with self._lock:
+            key = f"{ctype}|{encoding or 'identity'}"
+            self.served[key] = self.served.get(key, 0) + 1
+
+    def _pop_failure(self, path: str) -> tuple | None:
+        with self._lock:
+            pending = self._failures.get(path)
+            return pending.pop(0) if pending else None
+
+    def _pop_delay(self, path: str) -> float | None:
+        with self._lock:
+            pending = self._delays.get(path)
+            return pending.pop(0) if pending else None
+
+    def _payload(self, path: str, params: Dict[str, List[str]]) -> Any:
+        """Respuesta completa de la consulta; las páginas de una misma consulta la
+        reutilizan en vez de regenerarla."""
+        if not self.paginate:
+            return synthetic_payload(path, params, self.fanout, self.catalog)
+        query = {k: v for k, v in params.items() if k not in ("limit", "offset", "cursor")}
+        key = (path, json.dumps(query, sort_keys=True), self.fanout)
+        with self._lock:
+            if self._last_payload is not None and self._last_payload[0] == key:
+                return self._last_payload[1]
+        payload = synthetic_payload(path, query, self.fanout, self.catalog)
+        with self._lock:
+            self._last_payload = (key, payload)
+        return payload
+
+    def calls(self, path: str) -> int:
+        """Número de peticiones recibidas en `path`."""
+        with self._lock:
+            return sum(1 for _, p, _ in self.requests if p == path)
+
+    # ------------------------------------------------------------------ #
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubPDEXAPI":
+        self._server = _Server(("127.0.0.1", 0), _Handler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubPDEXAPI":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pdexapi import PDEXClient
+from pdexapi.PDExAPI_Aggregate import aggregate
+from stub_server import StubPDEXAPI
+
+VARS = ["maxtemp_c", "mintemp_c", "totalprecip_mm", "avgtemp_c"]
+# Diario por ciudad: (estado, ciudad, fecha, max, min, precip, avg)
+DAILY = pd.DataFrame(
+    [
+        ("Jalisco", "Guadalajara", "2025-01-30", 20, 10, 1, 15),
+        ("Jalisco", "Guadalajara", "2025-01-31", 24, 8, 3, 16),
+        ("Jalisco", "Guadalajara", "2025-02-01", 22, 12, 0, 17),
+        ("Jalisco", "Zapopan", "2025-01-30", 28, 12, 5, 20),
+        ("Jalisco", "Zapopan", "2025-01-31", 26, 14, np.nan, 18),
+        ("Jalisco", "Zapopan", "2025-02-01", 30, 10, 2, 21),
+        ("Nuevo León", "Monterrey", "2025-01-30", 30, 16, 0, 23),
+        ("Nuevo León", "Monterrey", "2025-01-31", 32, 14, 4, 22),
+        ("Nuevo León", "Monterrey", "2025-02-01", 34, 18, 8, 25),
+    ],
+    columns=["estado", "ciudad", "fecha", *VARS],
+)
+POBLACION = pd.DataFrame(
+    [("Jalisco", "Guadalajara", 3), ("Jalisco", "Zapopan", 1), ("Nuevo León", "Monterrey", 4)],
+    columns=["estado", "ciudad", "poblacion"],
+)
+
+# Agregados con las definiciones del servidor, calculados a mano sobre DAILY
+MONTHLY_CITY = [
+    ("Jalisco", "Guadalajara", "2025-01-01", 24, 8, 4, 15.5),
+    ("Jalisco", "Guadalajara", "2025-02-01", 22, 12, 0, 17),
+    ("Jalisco", "Zapopan", "2025-01-01", 28, 12, 5, 19),
+    ("Jalisco", "Zapopan", "2025-02-01", 30, 10, 2, 21),
+    ("Nuevo León", "Monterrey", "2025-01-01", 32, 14, 4, 22.5),
+    ("Nuevo León", "Monterrey", "2025-02-01", 34, 18, 8, 25),
+]
+MONTHLY_STATE = [
+    ("Jalisco", "2025-01-01", 25, 9, 4.25, 16.375),
+    ("Jalisco", "2025-02-01", 24, 11.5, 0.5, 18),
+    ("Nuevo León", "2025-01-01", 32, 14, 4, 22.5),
+    ("Nuevo León", "2025-02-01", 34, 18, 8, 25),
+]
+MONTHLY_NATIONAL = [
+    ("2025-01-01", 28.5, 11.5, 4.125, 19.4375),
+    ("2025-02-01", 29, 14.75, 4.25, 21.5),
+]
+
+
+def _sorted(df, keys):
+    return df.sort_values(keys).reset_index(drop=True)[[*keys, *VARS]]
+
+
+def test_rollups_match_server_definitions():
+    city = aggregate(DAILY, freq="M")
+    expected = pd.DataFrame(MONTHLY_CITY, columns=["estado", "ciudad", "fecha", *VARS])
+    pd.testing.assert_frame_equal(
+        _sorted(city, ["estado", "ciudad", "fecha"]), expected, check_dtype=False
+    )
+
+    state = aggregate(DAILY, freq="M", nivel="estado", weights=POBLACION)
+    expected = pd.DataFrame(MONTHLY_STATE, columns=["estado", "fecha", *VARS])
+    pd.testing.assert_frame_equal(_sorted(state, ["estado", "fecha"]), expected, check_dtype=False)
+
+    national = aggregate(DAILY, freq="M", nivel="nacional", weights=POBLACION)
+    expected = pd.DataFrame(MONTHLY_NATIONAL, columns=["fecha", *VARS])
+    pd.testing.assert_frame_equal(_sorted(national, ["fecha"]), expected, check_dtype=False)
+
+    # Nacional desde el agregado estatal (pesos de ciudades sumados por estado)
+    again = aggregate(aggregate(DAILY, freq="M", nivel="estado", weights=POBLACION),
+                      nivel="nacional", weights=POBLACION)
+    pd.testing.assert_frame_equal(_sorted(again, ["fecha"]), expected, check_dtype=False)
+
+    # Diario por estado: el faltante de Zapopan no cuenta en el denominador
+    daily = aggregate(DAILY, nivel="estado", weights=POBLACION).set_index(["estado", "fecha"])
+    assert daily.loc[("Jalisco", "2025-01-31"), "totalprecip_mm"] == 3
+    assert daily.loc[("Jalisco", "2025-01-30"), "maxtemp_c"] == 22
+
+
+def test_long_format_and_datetimes():
+    long = DAILY.assign(fecha=pd.to_datetime(DAILY["fecha"])).melt(
+        id_vars=["estado", "ciudad", "fecha"], var_name="variable", value_name="valor"
+    )
+    long["estado"] = long["estado"].astype("category")
+    out = aggregate(long, freq="M", nivel="nacional", weights=POBLACION)
+    wide = out.pivot(index="fecha", columns="variable", values="valor")[VARS]
+    np.testing.assert_allclose(wide.to_numpy(), [row[1:] for row in MONTHLY_NATIONAL])
+    assert list(wide.index) == list(pd.to_datetime(["2025-01-01", "2025-02-01"]))
+
+    with pytest.raises(ValueError):
+        aggregate(DAILY, nivel="estado", weights=POBLACION.iloc[:2])
+    with pytest.raises(ValueError):
+        aggregate(DAILY, freq="W")
+
+
+def test_client_weights_from_poblacion():
+    with StubPDEXAPI() as stub:
+        with PDEXClient(stub.base_url, "demo", "demo") as cli:
+            out = cli.aggregate(DAILY, freq="M", nivel="estado")
+            assert stub.calls("/poblacion") == 3
+    # El stub reporta la misma población para todas las ciudades: promedio simple
+    simple = aggregate(DAILY, freq="M", nivel="estado")
+    pd.testing.assert_frame_equal(out, simple)
+    assert simple.loc[0, "maxtemp_c"] == 26  # (24 + 28) / 2
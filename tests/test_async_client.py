@@ -0,0 +1,73 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from pdexapi import AsyncPDEXClient
+from stub_server import StubPDEXAPI
+
+
+@pytest.fixture
+def stub():
+    with StubPDEXAPI() as s:
+        yield s
+
+
+def test_gather_refreshes_expired_token_once(stub):
+    async def main():
+        async with AsyncPDEXClient(stub.base_url, "demo", "demo", max_concurrency=4,
+                                   eager_auth=True) as cli:
+            cli._exp_ts = 0  # fuerza expiración
+            return await asyncio.gather(*[
+                cli.fc_clima_mes(
+                    estado="Jalisco", ciudad=f"c{i}", variable="maxtemp_c",
+                    fecha_inicio="2025-08-01", fecha_fin="2025-12-01", as_frame=True,
+                )
+                for i in range(20)
+            ])
+
+    frames = asyncio.run(main())
+    assert len(frames) == 20 and all(len(df) == 5 for df in frames)
+    assert stub.calls("/token") == 2  # login inicial + una sola renovación
+    assert stub.connections <= 4
+
+
+def test_cov_matrix_as_array(stub):
+    async def main():
+        async with AsyncPDEXClient(stub.base_url, "demo", "demo") as cli:
+            return await cli.cov_matrix(
+                fecha_modelo="2025-06-01", forecast_horizon=4, variable="avgtemp_c", as_array=True
+            )
+
+    assert asyncio.run(main()).shape == (4, 4)
+
+
+def test_lazy_login_expires_in_and_401_replay(stub):
+    stub.expires_in = 7200
+
+    async def main():
+        async with AsyncPDEXClient(stub.base_url, "demo", "demo", max_concurrency=8) as cli:
+            assert stub.calls("/token") == 0
+            await cli.list_tables()
+            ttl = cli._exp_ts - time.time()
+            stub.token = "rotado"  # el servidor revoca el token vigente
+            tables = await asyncio.gather(*[cli.list_tables() for _ in range(16)])
+            return ttl, tables
+
+    ttl, tables = asyncio.run(main())
+    assert 7000 < ttl <= 7200 and all(tables)
+    assert stub.calls("/token") == 2  # login diferido + un solo relogin por el 401
+
+
+def test_short_expires_in_logs_in_once(stub):
+    stub.expires_in = 120  # menor que el margen de renovación de 5 min
+
+    async def main():
+        async with AsyncPDEXClient(stub.base_url, "demo", "demo") as cli:
+            for _ in range(5):
+                await cli.list_tables()
+
+    asyncio.run(main())
+    assert stub.calls("/token") == 1
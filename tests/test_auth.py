@@ -0,0 +1,78 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pdexapi import FileTokenStore, PDEXClient
+from pdexapi.PDExAPI_Auth import TokenManager
+from stub_server import StubPDEXAPI
+
+
+def test_expired_token_is_refreshed_once_across_threads():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", pool_maxsize=16,
+                                               eager_auth=True) as cli:
+        cli._tokens._exp_ts = 0.0  # fuerza el vencimiento
+        with ThreadPoolExecutor(16) as pool:
+            assert all(pool.map(lambda _: cli.list_tables(), range(64)))
+    assert stub.calls("/token") == 2
+
+
+def test_401_relogs_in_once_and_replays():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", pool_maxsize=8,
+                                               eager_auth=True) as cli:
+        stub.token = "rotado"  # el servidor revoca el token vigente
+        with ThreadPoolExecutor(8) as pool:
+            assert all(pool.map(lambda _: cli.list_tables(), range(32)))
+    assert stub.calls("/token") == 2
+
+
+def test_login_is_deferred_to_first_request():
+    with StubPDEXAPI() as stub:
+        with PDEXClient(stub.base_url, "demo", "demo") as cli:
+            assert stub.calls("/token") == 0 and cli.transport_stats()["requests"] == 0
+            cli.list_tables()
+            cli.list_tables()
+            assert stub.calls("/token") == 1
+        with PDEXClient(stub.base_url, "demo", "demo", eager_auth=True):
+            assert stub.calls("/token") == 2
+
+
+def test_file_store_shares_token_between_clients(tmp_path):
+    store = tmp_path / "token.json"
+    with StubPDEXAPI() as stub:
+        with PDEXClient(stub.base_url, "demo", "demo", token_store=store) as a:
+            a.list_tables()
+        with PDEXClient(stub.base_url, "demo", "demo", token_store=FileTokenStore(store)) as b:
+            b.list_tables()
+        assert stub.calls("/token") == 1
+        assert store.stat().st_mode & 0o777 == 0o600
+
+
+def test_background_refresh_renews_before_expiry():
+    tokens = iter(range(100))
+    mgr = TokenManager(lambda: (f"t{next(tokens)}", None), ttl=0.4, refresh_margin=0.1,
+                       background=True, min_interval=0.1)
+    try:
+        first = mgr.token()
+        time.sleep(0.5)
+        assert mgr.logins >= 2 and mgr._token != first
+    finally:
+        mgr.close()
+
+
+def test_short_expires_in_does_not_relogin_per_call():
+    tokens = iter(range(100))
+    mgr = TokenManager(lambda: (f"t{next(tokens)}", 120))  # vida < refresh_margin (300 s)
+    assert len({mgr.token() for _ in range(5)}) == 1 and mgr.logins == 1
+
+
+def test_background_refresh_waits_first_login_and_is_throttled():
+    tokens = iter(range(1000))
+    mgr = TokenManager(lambda: (f"t{next(tokens)}", 0.3), background=True)
+    try:
+        time.sleep(0.2)
+        assert mgr.logins == 0  # sin red antes de la primera petición
+        mgr.token()
+        time.sleep(1.2)
+        assert 2 <= mgr.logins <= 3  # a lo más una renovación por `min_interval`
+    finally:
+        mgr.close()
@@ -0,0 +1,83 @@
+import pytest
+import requests
+
+from concurrent.futures import ThreadPoolExecutor
+
+from pdexapi import PDEXClient
+from stub_server import StubPDEXAPI
+
+
+@pytest.fixture
+def cli():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as c:
+        yield c
+
+
+def test_fetch_many_collects_results_and_errors(cli):
+    base = {"variable": "maxtemp_c", "fecha_inicio": "2025-08-01", "fecha_fin": "2025-10-01"}
+    params = [
+        {"estado": "Jalisco", "ciudad": "Zapopan", **base},
+        {"estado": "Nuevo León", "ciudad": "Monterrey", **base},
+        {"estado": "Jalisco", "ciudad": "Zapopan", **base, "fecha_inicio": "no-es-fecha"},
+    ]
+    res = cli.fetch_many("fc_clima_mes", params, max_in_flight=3)
+
+    assert len(res.results) == 2 and len(res.errors) == 1
+    assert len(res.get(params[1])) == 3
+    df = res.frame()
+    assert set(df["ciudad"]) == {"Zapopan", "Monterrey"}
+    assert {"fecha_inicio", "fecha_fin"} <= set(df.columns)
+
+
+def test_fetch_many_rejects_unknown_endpoint(cli):
+    with pytest.raises(ValueError):
+        cli.fetch_many("close", [{}])
+
+
+def test_hourly_grib_chunked_matches_single_call_and_retries_windows():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        kwargs = dict(fecha_inicio="2023-01-01", fecha_fin="2023-01-10", variable=["avgtemp_c", "tp"])
+        full = cli.copernicus_hourly_grib(**kwargs)
+
+        stub.fail_next("/copernicus_hourly_grib", times=2)
+        chunked = cli.copernicus_hourly_grib(**kwargs, chunk_days=3, max_workers=2, as_frame=True)
+
+    assert chunked.to_dict("records") == full
+    assert stub.calls("/copernicus_hourly_grib") == 1 + 4 + 2
+
+
+def test_identical_concurrent_gets_share_one_request():
+    kw = dict(estado="Jalisco", ciudad="Zapopan", variable="maxtemp_c",
+              fecha_inicio="2025-08-01", fecha_fin="2025-12-01", as_frame=True)
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", pool_maxsize=8) as cli:
+        stub.delay_next("/fc_clima_mes", 0.3)
+        with ThreadPoolExecutor(8) as pool:
+            frames = list(pool.map(lambda _: cli.fc_clima_mes(**kw), range(8)))
+        stats = cli.coalesce_stats()
+        frames[0].loc[0, "valor"] = -1.0  # cada llamador tiene su propia copia
+        assert frames[1].loc[0, "valor"] != -1.0
+
+        stub.delay_next("/fc_clima_mes", 0.3)
+        stub.fail_next("/fc_clima_mes", status=404)
+        with ThreadPoolExecutor(4) as pool:
+            errors = list(pool.map(lambda _: _raises(lambda: cli.fc_clima_mes(**kw)), range(4)))
+    assert stub.calls("/fc_clima_mes") == 2
+    assert stats["leaders"] == 1 and stats["shared"] == 7
+    assert all(errors)
+
+
+def _raises(fn) -> bool:
+    try:
+        fn()
+    except requests.HTTPError:
+        return True
+    return False
+
+
+def test_windowed_keeps_identical_rows_and_unhashable_values(cli, monkeypatch):
+    row = {"fecha": "2023-01-01", "valor": 1.0, "celdas": [1, 2], "meta": {"a": 1}}
+    monkeypatch.setattr(cli, "_get", lambda path, params=None: [row, dict(row)])
+    rows = cli._get_windowed("/copernicus_hourly_grib",
+                             {"fecha_inicio": "2023-01-01", "fecha_fin": "2023-01-04"},
+                             chunk_days=2)
+    assert rows == [row] * 4
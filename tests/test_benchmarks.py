@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_bench_client_smoke():
+    out = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "bench_client.py"),
+         "--quick", "--no-record", "--error-rate", "0.05"],
+        check=True, capture_output=True, text=True, timeout=120,
+    )
+    lines = out.stdout.splitlines()
+    for name in ("serial", "concurrent", "bulk", "streaming"):
+        assert any(line.strip().startswith(f"{name}:") for line in lines)
+
+
+def test_bench_startup_smoke():
+    out = subprocess.run(
+        [sys.executable, os.path.join(ROOT, "benchmarks", "bench_startup.py"),
+         "--quick", "--no-record", "--scenarios", "import", "first_call"],
+        check=True, capture_output=True, text=True, timeout=120,
+    )
+    lines = out.stdout.splitlines()
+    assert any(line.strip().startswith("import:") and "cargados: -" in line for line in lines)
+    assert any(line.strip().startswith("first_call:") for line in lines)
+
+
+def test_recorded_results_are_valid_json():
+    for name in ("bench_client.jsonl", "bench_startup.jsonl"):
+        with open(os.path.join(ROOT, "benchmarks", "results", name)) as fh:
+            records = [json.loads(line) for line in fh]
+        assert records and all({"config", "results", "commit"} <= set(r) for r in records)
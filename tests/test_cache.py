@@ -0,0 +1,170 @@
+import sqlite3
+import time
+
+import pytest
+import requests
+
+from pdexapi import MemoCache, PDEXClient, RangeCache, ResponseCache
+from pdexapi.PDExAPI_Cache import DAY, HOUR, default_ttl
+from stub_server import StubPDEXAPI
+
+
+@pytest.fixture
+def stub():
+    with StubPDEXAPI() as s:
+        yield s
+
+
+HIST = dict(estado="Nuevo León", ciudad="Monterrey", fecha_inicio="2024-01-01", fecha_fin="2024-01-31")
+
+
+def test_historical_hits_cache_across_clients(stub, tmp_path):
+    with PDEXClient(stub.base_url, "demo", "demo", cache=tmp_path) as cli:
+        first = cli.clima_historico(**HIST)
+    with PDEXClient(stub.base_url, "demo", "demo", cache=tmp_path) as cli:
+        second = cli.clima_historico(**HIST)
+        stats = cli.cache_stats()
+
+    assert first == second
+    assert stub.calls("/clima_historico") == 1
+    assert stats["hits"] == 1 and stats["entries"] == 1
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=250)
+    for i in range(3):
+        cache.put("/tables", {"i": i}, b"x" * 100)
+    assert cache.get("/tables", {"i": 0}) is None
+    assert cache.get("/tables", {"i": 2}) is not None
+    assert cache.stats()["bytes"] <= 250
+
+
+FC = dict(estado="Jalisco", ciudad="Zapopan", variable="maxtemp_c",
+          fecha_inicio="2025-08-01", fecha_fin="2025-12-01")
+
+
+def test_expired_forecast_is_revalidated(stub, tmp_path):
+    stub.validators = True
+    cache = ResponseCache(tmp_path, ttl={"/fc_clima_mes": 0.05})
+    with PDEXClient(stub.base_url, "demo", "demo", cache=cache) as cli:
+        first = cli.fc_clima_mes(**FC)
+        assert cli.fc_clima_mes(**FC) == first  # vigente: sin petición
+        time.sleep(0.06)
+        assert cli.fc_clima_mes(**FC) == first  # 304: copia guardada
+        time.sleep(0.06)
+        stub.revision += 1
+        assert cli.fc_clima_mes(**FC) == first  # ETag distinto: 200 con cuerpo
+        stats = cli.cache_stats()
+
+    assert stub.calls("/fc_clima_mes") == 3
+    assert stub.served["not-modified|identity"] == 1
+    assert (stats["hits"], stats["revalidations"], stats["not_modified"], stats["misses"]) == (1, 2, 1, 1)
+
+
+def test_unsolicited_304_is_an_error_and_not_cached(stub, tmp_path):
+    with PDEXClient(stub.base_url, "demo", "demo", cache=tmp_path) as cli:
+        stub.fail_next("/fc_clima_mes", status=304)  # 304 sin GET condicional
+        with pytest.raises(requests.HTTPError):
+            cli.fc_clima_mes(**FC)
+        assert cli.cache_stats()["entries"] == 0
+        assert len(cli.fc_clima_mes(**FC)) == 5
+
+
+def test_validators_survive_old_cache_schema(stub, tmp_path):
+    db = sqlite3.connect(tmp_path / "responses.sqlite")
+    db.execute("CREATE TABLE entries (key TEXT PRIMARY KEY, path TEXT NOT NULL, body BLOB NOT NULL, "
+               "size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)")
+    db.close()
+    cache = ResponseCache(tmp_path, ttl={"/dias_festivos": 0.05})
+    cache.put("/dias_festivos", None, b"[]", last_modified="Mon, 01 Sep 2025 00:00:00 GMT")
+    time.sleep(0.06)
+    assert cache.get("/dias_festivos", None) is None
+    assert cache.conditional("/dias_festivos", None) == {
+        "If-Modified-Since": "Mon, 01 Sep 2025 00:00:00 GMT"
+    }
+    assert cache.refresh("/dias_festivos", None) == b"[]"
+    assert cache.get("/dias_festivos", None) == b"[]"
+
+
+def test_default_ttl_policy():
+    assert default_ttl("/clima_historico", {"fecha_fin": "2020-01-31"}) == 30 * DAY
+    assert default_ttl("/clima_historico", {"fecha_fin": "2999-01-01"}) == HOUR
+    assert default_ttl("/inflacion", {}) == HOUR
+    assert default_ttl("/fc_clima_mes", {}) == HOUR
+    assert default_ttl("/dias_festivos", {}) < DAY
+
+
+def test_range_cache_requests_only_missing_dates(stub, tmp_path):
+    with PDEXClient(stub.base_url, "demo", "demo", range_cache=tmp_path) as cli:
+        jan = cli.clima_historico(**HIST)
+        wider = cli.clima_historico(**{**HIST, "fecha_fin": "2024-02-10"})
+        inner = cli.clima_historico(**{**HIST, "fecha_inicio": "2024-01-15", "fecha_fin": "2024-02-05"})
+        stats = cli.range_cache_stats()
+
+    gets = [p for m, path, p in stub.requests if path == "/clima_historico"]
+    assert [(g["fecha_inicio"][0], g["fecha_fin"][0]) for g in gets] == [
+        ("2024-01-01", "2024-01-31"),
+        ("2024-02-01", "2024-02-10"),
+    ]
+    assert len(jan) == 31 and len(wider) == 41 and len(inner) == 22
+    assert wider[:31] == jan
+    assert stats["misses"] == 1 and stats["partial"] == 1 and stats["hits"] == 1
+
+
+def test_range_cache_date_key_per_endpoint(tmp_path):
+    cache = RangeCache(tmp_path, paths={"/turismo", "/sin_fecha"},
+                       date_key={"/turismo": "fecha_periodo"})
+    q = {"estado": "Jalisco", "fecha_inicio": "2024-01-01", "fecha_fin": "2024-01-03"}
+
+    def turismo(p):
+        return [{"fecha_periodo": f"2024-01-0{d}", "llegadas": d} for d in range(1, 4)
+                if p["fecha_inicio"] <= f"2024-01-0{d}" <= p["fecha_fin"]]
+
+    assert len(cache.fetch("/turismo", q, turismo)) == 3
+    assert cache.fetch("/turismo", {**q, "fecha_inicio": "2024-01-02"}, turismo) == turismo(
+        {**q, "fecha_inicio": "2024-01-02"})
+    # filas sin columna de fecha: consulta normal, sin guardar ni romper la petición
+    plain = [{"estado": "Jalisco", "total": 1}]
+    assert cache.fetch("/sin_fecha", q, lambda p: plain) == plain
+    # fecha en None: tampoco se guarda (quedaría bajo el día "None" y se perdería)
+    nulls = [{"fecha_periodo": None, "llegadas": 7}, *turismo(q)]
+    assert cache.fetch("/turismo", {**q, "estado": "Puebla"}, lambda p: nulls) == nulls
+    assert cache.fetch("/turismo", {**q, "estado": "Puebla"}, lambda p: nulls) == nulls
+    stats = cache.stats()
+    assert (stats["misses"], stats["hits"], stats["bypassed"]) == (1, 1, 3)
+
+
+def test_memo_serves_copies_and_invalidates(stub):
+    cov = dict(fecha_modelo="2025-06-01", forecast_horizon=4, variable="avgtemp_c", estado="Jalisco")
+    with PDEXClient(stub.base_url, "demo", "demo", memo=True) as cli:
+        tables = cli.list_tables()
+        tables.append("corrupto")
+        assert "corrupto" not in cli.list_tables()
+
+        df = cli.cov_matrix(**cov, as_frame=True)
+        df.iloc[0, 0] = -1.0
+        assert cli.cov_matrix(**cov, as_frame=True).iloc[0, 0] == 1.0
+        assert cli.cov_matrix(**cov, as_array=True).shape == (4, 4)
+        assert stub.calls("/tables") == 1 and stub.calls("/cov_matrix") == 1
+
+        cli.invalidate("list_tables")
+        cli.list_tables()
+        cli.cov_matrix(**cov, as_frame=True)
+        assert stub.calls("/tables") == 2 and stub.calls("/cov_matrix") == 1
+        cli.clear_cache()
+        cli.cov_matrix(**cov, as_frame=True)
+        assert stub.calls("/cov_matrix") == 2
+        with pytest.raises(ValueError):
+            cli.invalidate("no_existe")
+
+
+def test_memo_lru_bound_and_per_endpoint_config(stub):
+    memo = MemoCache(max_entries=2, ttl={"/cov_matrix": None, "/turismo": 60})
+    with PDEXClient(stub.base_url, "demo", "demo", memo=memo) as cli:
+        for estado in ("A", "B", "C", "A"):
+            cli.poblacion(estado=estado)
+        cli.cov_matrix(fecha_modelo="2025-06-01", forecast_horizon=2, variable="avgtemp_c")
+        cli.cov_matrix(fecha_modelo="2025-06-01", forecast_horizon=2, variable="avgtemp_c")
+    assert stub.calls("/poblacion") == 4  # "A" fue desalojado por el límite de 2
+    assert stub.calls("/cov_matrix") == 2  # excluido por configuración
+    assert memo.stats()["evictions"] == 2
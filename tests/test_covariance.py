@@ -0,0 +1,37 @@
+import json
+
+import numpy as np
+import pytest
+
+from pdexapi import PDEXClient
+from pdexapi.PDExAPI_Covariance import decode_matrix
+from stub_server import StubPDEXAPI
+
+
+@pytest.mark.parametrize("matrix", [
+    [[1.0, 0.5], [0.5, 2.25e-3]],
+    [[1.0, None], [None, 1.0]],  # null → respaldo json
+])
+def test_decode_matrix_into_buffer(matrix):
+    out = np.empty((2, 2))
+    decode_matrix(json.dumps(matrix).encode(), out)
+    np.testing.assert_array_equal(out, np.array(matrix, dtype=float))
+    with pytest.raises(ValueError):
+        decode_matrix(json.dumps(matrix).encode(), np.empty((3, 3)))
+
+
+def test_cov_matrices_stacks_and_reuses_npy_store(tmp_path):
+    kw = dict(fecha_modelo=["2025-05-01", "2025-06-01"], forecast_horizon=6,
+              variable="avgtemp_c", estado=["Jalisco", None])
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        S = cli.cov_matrices(**kw, store=tmp_path)
+        again = cli.cov_matrices(**kw, store=tmp_path)
+        single = cli.cov_matrix(fecha_modelo="2025-06-01", forecast_horizon=6,
+                                variable="avgtemp_c", estado="Jalisco", as_array=True)
+        assert stub.calls("/cov_matrix") == 4 + 1
+
+    assert S.array.shape == (4, 6, 6) and S.array.dtype == np.float64
+    assert list(S.index.names) == ["fecha_modelo", "variable", "estado"]
+    np.testing.assert_array_equal(S.get("2025-06-01", "avgtemp_c", "Jalisco"), single)
+    np.testing.assert_array_equal(again.array, S.array)
+    assert len(list(tmp_path.glob("*.npy"))) == 4
@@ -0,0 +1,109 @@
+import json
+
+import pandas as pd
+import pytest
+
+from pdexapi import PDEXClient
+from pdexapi.PDExAPI_Frames import apply_schema, frame_from_json, frame_from_records, iter_json_array
+from stub_server import StubPDEXAPI
+
+ROWS = [
+    {"fecha": "2023-01-01 03:00:00", "estado": "Nuevo León", "ciudad": "San Pedro, G",
+     "variable": "avgtemp_c", "valor": 1.5, "n": 3, "ok": True},
+    {"fecha": "2023-01-01 04:00:00", "estado": "Jalisco", "ciudad": "Zapopan",
+     "variable": "avgtemp_c", "valor": None, "n": 4, "ok": False},
+]
+
+
+@pytest.mark.parametrize("dumps", [
+    lambda r: json.dumps(r, ensure_ascii=False, separators=(",", ":")),  # camino CSV
+    lambda r: json.dumps(r),                                             # escapes → regex
+])
+def test_columnar_matches_record_path(dumps):
+    df = frame_from_json(dumps(ROWS).encode())
+    pd.testing.assert_frame_equal(df, frame_from_records(ROWS), check_categorical=False)
+    assert isinstance(df["estado"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_datetime64_any_dtype(df["fecha"])
+
+
+def test_irregular_bodies_fall_back_to_json():
+    permuted = b'[{"a":"x","b":1},{"b":2,"a":"y"}]'
+    assert frame_from_json(permuted).to_dict("records") == [{"a": "x", "b": 1}, {"a": "y", "b": 2}]
+    assert frame_from_json(b"[]").empty
+    assert frame_from_json(b'[{"a":[1,2]}]')["a"][0] == [1, 2]
+
+
+def test_client_columnar_frames():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", columnar=True) as cli:
+        df = cli.copernicus_historical(
+            nivel="ciudad", freq="D", variable=["maxtemp_c", "tp"],
+            fecha_inicio="2025-01-01", fecha_fin="2025-01-31", estado="Jalisco", as_frame=True,
+        )
+        raw = cli.copernicus_historical(
+            nivel="ciudad", freq="D", variable=["maxtemp_c", "tp"],
+            fecha_inicio="2025-01-01", fecha_fin="2025-01-31", estado="Jalisco",
+        )
+    assert len(df) == 62 and isinstance(raw, list)
+    assert isinstance(df["variable"].dtype, pd.CategoricalDtype)
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_iter_json_array_across_chunk_boundaries(size):
+    body = json.dumps(ROWS + [1.25e-7, "ñ", [1, {"a": None}]], ensure_ascii=False).encode()
+    chunks = [body[i:i + size] for i in range(0, len(body), size)]
+    assert list(iter_json_array(chunks)) == json.loads(body)
+    assert list(iter_json_array([b" [ ] "])) == []
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a":1},']))
+
+
+def test_client_stream_matches_full_response():
+    kw = dict(estado="Jalisco", ciudad="Zapopan", fecha_inicio="2024-01-01", fecha_fin="2024-03-31")
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        full = cli.clima_historico(**kw)
+        rows = cli.clima_historico(**kw, stream=True)
+        chunks = list(cli.clima_historico(**kw, stream=True, as_frame=True, chunk_rows=40))
+        assert list(rows) == full
+        with pytest.raises(ValueError):
+            cli.copernicus_hourly_grib(
+                fecha_inicio="2024-01-01", fecha_fin="2024-01-02", variable="tp",
+                stream=True, chunk_days=1,
+            )
+    assert [len(c) for c in chunks] == [40, 40, 11]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), pd.DataFrame(full))
+
+
+def test_apply_schema_profiles():
+    rows = [{"fecha": "2024-01-01", "estado": "Jalisco", "valor": 1.5, "poblacion": 10}]
+    exact = apply_schema(pd.DataFrame(rows), "/clima_historico", "exact")
+    compact = apply_schema(pd.DataFrame(rows), "/clima_historico", "compact")
+    assert exact["valor"].dtype == "float64" and compact["valor"].dtype == "float32"
+    assert compact["poblacion"].dtype == "int64"
+    assert pd.api.types.is_datetime64_any_dtype(compact["fecha"])
+    assert apply_schema(pd.DataFrame(rows), "/inflacion", "compact")["valor"].dtype == "float64"
+    with pytest.raises(ValueError):
+        apply_schema(pd.DataFrame(rows), "/inflacion", "tiny")
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_client_dtype_profile(columnar):
+    kw = dict(fecha_inicio="2024-01-01", fecha_fin="2024-12-31", as_frame=True)
+    with StubPDEXAPI() as stub:
+        with PDEXClient(stub.base_url, "demo", "demo", columnar=columnar,
+                        dtype_profile="compact") as cli:
+            compact = cli.clima_historico_nacional(**kw)
+        with PDEXClient(stub.base_url, "demo", "demo") as cli:
+            plain = cli.clima_historico_nacional(**kw)
+    assert compact["valor"].dtype == "float32"
+    assert isinstance(compact["variable"].dtype, pd.CategoricalDtype)
+    assert plain["fecha"].dtype != compact["fecha"].dtype  # sin perfil: JSON tal cual
+    assert compact.memory_usage(deep=True).sum() < plain.memory_usage(deep=True).sum() / 2
+
+
+def test_columnar_dates_on_large_tables():
+    # con muchas filas pandas usa su caché de fechas; la columna debe seguir siendo datetime64
+    rows = [{"fecha": f"2025-01-{d % 28 + 1:02d}", "estado": "Jalisco", "valor": float(d)}
+            for d in range(5000)]
+    df = frame_from_json(json.dumps(rows, separators=(",", ":")).encode())
+    assert pd.api.types.is_datetime64_any_dtype(df["fecha"])
+    assert df["fecha"].iloc[30] == pd.Timestamp("2025-01-03")
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+from pdexapi import AdaptiveLimit, PDEXClient, RateController, RetryPolicy, TokenBucket
+from stub_server import StubPDEXAPI
+
+PATIENT = RetryPolicy(retries=50, backoff=0.005, max_backoff=0.05)
+
+
+def _params(n):
+    return [
+        {"estado": "Jalisco", "ciudad": f"c{i}", "variable": "maxtemp_c",
+         "fecha_inicio": "2025-08-01", "fecha_fin": "2025-12-01"}
+        for i in range(n)
+    ]
+
+
+def test_token_bucket_caps_rate():
+    bucket = TokenBucket(rate=100, burst=1)
+    start = time.monotonic()
+    for _ in range(21):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.19
+    assert bucket.waited >= 0.19
+
+
+def test_aimd_grows_additively_and_halves_on_congestion():
+    lim = AdaptiveLimit(initial=2, max_limit=8)
+    for _ in range(20):
+        lim.acquire()
+        lim.release(0.01, ok=True)
+    grown = lim.limit
+    assert 4 < grown <= 8
+
+    lim.acquire()
+    lim.release(0.01, ok=False)
+    assert lim.limit == pytest.approx(grown / 2)
+    lim.acquire()
+    lim.release(0.01, ok=False)  # misma ventana: no vuelve a reducir
+    assert lim.decreases == 1
+
+    time.sleep(0.06)
+    lim.acquire()
+    lim.release(0.5, ok=True)  # 50× la latencia base cuenta como congestión
+    assert lim.decreases == 2 and lim.inflight == 0
+
+
+def test_limit_settles_near_server_capacity():
+    ctl = RateController(adaptive=AdaptiveLimit(initial=1, max_limit=32))
+    with StubPDEXAPI() as stub, PDEXClient(
+        stub.base_url, "demo", "demo", retry=PATIENT, limiter=ctl
+    ) as cli:
+        stub.limit_capacity(4, latency=0.01)
+        res = cli.fetch_many("fc_clima_mes", _params(120), max_in_flight=16)
+        stats = cli.limits_stats()
+
+    assert not res.errors and len(res.results) == 120
+    assert stats["peak_limit"] > 4 and stats["decreases"] >= 1
+    assert 1 <= stats["limit"] <= 8
+    assert stats["errors"] < stats["requests"] / 3  # casi todo entra al primer intento
+
+
+def test_controller_shared_with_async_client():
+    pytest.importorskip("httpx")
+    from pdexapi import AsyncPDEXClient
+
+    ctl = RateController(rate=200)
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", limiter=ctl) as cli:
+        cli.fetch_many("fc_clima_mes", _params(5))
+
+        async def main():
+            async with AsyncPDEXClient(stub.base_url, "demo", "demo", limiter=ctl) as acli:
+                await asyncio.gather(*[acli.fc_clima_mes(**p) for p in _params(5)])
+
+        asyncio.run(main())
+    stats = ctl.stats()
+    assert stats["requests"] == 10 and stats["inflight"] == 0 and stats["rate"] == 200
@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+import requests
+
+from pdexapi import Metrics, PDEXClient
+from pdexapi.PDExAPI_Metrics import LatencyHistogram
+from stub_server import StubPDEXAPI
+
+MES = {"estado": "Jalisco", "ciudad": "Zapopan", "variable": "maxtemp_c",
+       "fecha_inicio": "2025-08-01", "fecha_fin": "2025-12-01"}
+
+
+def test_histogram_quantiles_are_close():
+    h = LatencyHistogram()
+    for ms in range(1, 1001):
+        h.observe(ms / 1000)
+    s = h.summary()
+    assert s["count"] == 1000 and s["max"] == 1.0
+    assert s["p50"] == pytest.approx(0.5, rel=0.2)
+    assert s["p99"] == pytest.approx(0.99, rel=0.2)
+
+
+def test_phases_bytes_rows_and_hooks():
+    seen = []
+    metrics = Metrics(hooks=[lambda ep, m, v: seen.append((ep, m))])
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", metrics=metrics) as cli:
+        stub.delay_next("/fc_clima_mes", 0.05)
+        df = cli.fc_clima_mes(**MES, as_frame=True)
+        cli.fc_clima_mes(**{**MES, "ciudad": "Guadalajara"})
+        with pytest.raises(requests.HTTPError):
+            cli.fc_clima_mes(**{**MES, "fecha_inicio": "no-es-fecha"})
+        stats = cli.stats()
+
+    ep = stats["endpoints"]["/fc_clima_mes"]
+    assert ep["requests"] == 3 and ep["errors"] == 1
+    assert ep["rows"] == 2 * len(df) and ep["bytes"] > 0
+    assert ep["server"]["count"] == 3 and ep["server"]["max"] >= 0.05
+    assert ep["decode"]["count"] == 2 and ep["frame"]["count"] == 1
+    assert {"server", "download", "decode", "frame", "bytes", "rows", "error"} <= {
+        m for _, m in seen
+    }
+    assert stats["transport"]["requests"] >= 4 and "retry" in stats
+    assert set(metrics.frame()["phase"]) >= {"server", "download", "decode", "frame"}
+
+
+def test_streaming_and_broken_hook_do_not_break_requests():
+    def broken(*_):
+        raise RuntimeError("exportador caído")
+
+    metrics = Metrics(hooks=[broken])
+    with StubPDEXAPI() as stub, PDEXClient(
+        stub.base_url, "demo", "demo", metrics=metrics, columnar=True
+    ) as cli:
+        frames = list(cli.clima_historico(
+            estado="Jalisco", ciudad="Zapopan", variable="maxtemp_c",
+            fecha_inicio="2024-01-01", fecha_fin="2024-03-31",
+            as_frame=True, stream=True, chunk_rows=30,
+        ))
+    ep = metrics.stats()["/clima_historico"]
+    assert ep["rows"] == sum(len(f) for f in frames) == 91
+    assert ep["download"]["count"] == 1 and ep["frame"]["count"] == len(frames)
+    assert metrics.hook_errors > 0
+
+
+def test_hook_errors_are_counted_across_threads():
+    def broken(*_):
+        raise RuntimeError("exportador caído")
+
+    metrics = Metrics(hooks=[broken])
+
+    def work():
+        for _ in range(2000):
+            metrics.observe("/tables", "server", 0.001)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert metrics.hook_errors == 8 * 2000
+
+
+def test_metrics_can_be_disabled():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", metrics=False) as cli:
+        assert cli.fc_clima_mes(**MES)
+        assert cli.stats()["endpoints"] == {}
@@ -0,0 +1,65 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+import pandas as pd
+
+from pdexapi import ParquetMirror, PDEXClient
+from stub_server import StubPDEXAPI
+
+Q = dict(nivel="estado", freq="D", variable=["maxtemp_c", "tp"], estado="Jalisco")
+
+
+def test_mirror_appends_only_missing_ranges(tmp_path):
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        first = cli.mirror("copernicus_historical", tmp_path, **Q,
+                           fecha_inicio="2023-12-01", fecha_fin="2024-01-31")
+        again = cli.mirror("copernicus_historical", tmp_path, **Q,
+                           fecha_inicio="2023-12-15", fecha_fin="2024-02-29")
+        expected = cli.copernicus_historical(**Q, fecha_inicio="2023-12-01",
+                                             fecha_fin="2024-02-29", as_frame=True)
+
+    assert first == {"requests": 1, "rows": 62 * 2}
+    assert again == {"requests": 1, "rows": 29 * 2}  # solo febrero
+    assert stub.calls("/copernicus_historical") == 3
+
+    m = ParquetMirror(tmp_path)
+    df = m.read("copernicus_historical")
+    assert len(df) == len(expected) == 91 * 2
+    assert sorted(p.name for p in (tmp_path / "endpoint=copernicus_historical").iterdir()) == [
+        "variable=maxtemp_c", "variable=tp"
+    ]
+    got = df.sort_values(["fecha", "variable"], ignore_index=True)
+    assert got["valor"].tolist() == expected.sort_values(["fecha", "variable"])["valor"].tolist()
+
+
+def test_mirror_read_pushes_filters_down(tmp_path):
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        for estado in ("Jalisco", "Puebla"):
+            cli.mirror("copernicus_historical", tmp_path, **{**Q, "estado": estado},
+                       fecha_inicio="2022-12-01", fecha_fin="2023-01-31")
+    m = ParquetMirror(tmp_path)
+    df = m.read("copernicus_historical", variable="tp", estado=["Puebla"],
+                fecha_inicio="2023-01-10", fecha_fin="2023-01-20", columns=["fecha", "valor"])
+    assert list(df.columns) == ["fecha", "valor"] and len(df) == 11
+    assert df["fecha"].min() == pd.Timestamp("2023-01-10")
+    assert m.stats()["copernicus_historical"]["series"] == 2
+    with pytest.raises(KeyError):
+        m.read("turismo")
+
+
+def test_mirror_uses_endpoint_date_column_and_partitions(tmp_path):
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        got = cli.mirror("turismo", tmp_path, estado="Jalisco",
+                         fecha_inicio="2024-01-01", fecha_fin="2024-01-31")
+        cli.mirror("copernicus_historical_latam", tmp_path, nivel="estado", freq="D",
+                   variable="tp", pais="Colombia", departamento="Antioquia",
+                   fecha_inicio="2024-01-01", fecha_fin="2024-01-10")
+    assert got == {"requests": 1, "rows": 31}
+    m = ParquetMirror(tmp_path)
+    df = m.read("turismo", estado="Jalisco", fecha_inicio="2024-01-05", fecha_fin="2024-01-09")
+    assert len(df) == 5 and df["fecha_periodo"].min() == pd.Timestamp("2024-01-05")
+    assert [p.name for p in (tmp_path / "endpoint=turismo").iterdir()] == ["year=2024"]
+    latam = tmp_path / "endpoint=copernicus_historical_latam" / "variable=tp" / "year=2024"
+    assert [p.name for p in latam.iterdir()] == ["departamento=Antioquia"]
+    assert len(m.read("copernicus_historical_latam", departamento="Antioquia")) == 10
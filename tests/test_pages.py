@@ -0,0 +1,98 @@
+import json
+
+import pandas as pd
+import pytest
+
+from pdexapi import PDEXClient
+from stub_server import StubPDEXAPI
+
+QUERY = {"fecha_inicio": "2021-01-01", "fecha_fin": "2024-12-31"}  # 1461 días × 10 ciudades
+
+
+@pytest.fixture
+def stub():
+    with StubPDEXAPI() as s:
+        s.fanout = 10
+        yield s
+
+
+def _full(stub, **kwargs):
+    paginate, stub.paginate = stub.paginate, None
+    with PDEXClient(stub.base_url, "demo", "demo", **kwargs) as cli:
+        out = cli.clima_historico_nacional(**QUERY, as_frame=True)
+    stub.paginate = paginate
+    return out
+
+
+@pytest.mark.parametrize("mode", ["offset", "cursor"])
+def test_pages_are_stitched_in_order(stub, mode):
+    expected = _full(stub)
+    stub.paginate = mode
+    stub.inject(latency=0.01)
+    with PDEXClient(stub.base_url, "demo", "demo", page_size=1000, page_workers=4) as cli:
+        before = stub.calls("/clima_historico_nacional")
+        df = cli.clima_historico_nacional(**QUERY, as_frame=True)
+        assert stub.calls("/clima_historico_nacional") - before == 15
+    pd.testing.assert_frame_equal(df, expected)
+    # offset/limit: páginas en paralelo acotadas; cursor: una en vuelo por delante
+    assert (1 < stub.peak_inflight <= 4) if mode == "offset" else stub.peak_inflight <= 2
+
+
+def test_arrow_pages_and_streaming(stub):
+    pytest.importorskip("pyarrow")
+    expected = _full(stub, wire_format="arrow")
+    stub.paginate = "offset"
+    with PDEXClient(stub.base_url, "demo", "demo", page_size=4000, wire_format="arrow") as cli:
+        df = cli.clima_historico_nacional(**QUERY, as_frame=True)
+        chunks = list(cli.clima_historico_nacional(**QUERY, as_frame=True, stream=True,
+                                                   chunk_rows=3000))
+    pd.testing.assert_frame_equal(df, expected)
+    assert [len(c) for c in chunks] == [3000] * 4 + [2610]
+    streamed = pd.concat(chunks, ignore_index=True)
+    assert streamed["valor"].tolist() == expected["valor"].tolist()
+
+
+def test_server_without_pagination_falls_back(stub):
+    expected = _full(stub)
+    stub.paginate = "reject"
+    with PDEXClient(stub.base_url, "demo", "demo", page_size=1000) as cli:
+        df = cli.clima_historico_nacional(**QUERY, as_frame=True)
+        before = stub.calls("/clima_historico_nacional")
+        cli.clima_historico_nacional(**QUERY, mes=True)
+        assert stub.calls("/clima_historico_nacional") - before == 1  # ya no pide limit
+    pd.testing.assert_frame_equal(df, expected)
+
+    stub.paginate = None  # servidor que ignora limit: la primera respuesta es la completa
+    with PDEXClient(stub.base_url, "demo", "demo", page_size=1000) as cli:
+        assert len(cli.clima_historico_nacional(**QUERY)) == len(expected)
+
+    # ignora limit y la respuesta completa mide justo `page_size`: la segunda "página"
+    # repite la primera y no se sigue paginando
+    stub.fanout = 1
+    short = {"fecha_inicio": "2024-01-01", "fecha_fin": "2024-01-10"}
+    with PDEXClient(stub.base_url, "demo", "demo", page_size=10) as cli:
+        before = stub.calls("/clima_historico_nacional")
+        assert len(cli.clima_historico_nacional(**short)) == 10
+        assert sum(1 for _ in cli.clima_historico_nacional(**short, stream=True)) == 10
+        assert stub.calls("/clima_historico_nacional") - before <= 2 * (1 + 4)
+
+
+@pytest.mark.parametrize("page_size", [1000, 4870])  # 4870 divide exacto: cierra con página vacía
+def test_pages_without_headers_continue_until_short_page(stub, page_size):
+    expected = _full(stub)
+    stub.paginate = "silent"  # respeta limit/offset pero no informa total ni cursor
+    with PDEXClient(stub.base_url, "demo", "demo", page_size=page_size) as cli:
+        df = cli.clima_historico_nacional(**QUERY, as_frame=True)
+        rows = sum(1 for _ in cli.clima_historico_nacional(**QUERY, stream=True))
+    assert len(df) == rows == 14610
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_blind_paging_is_capped(monkeypatch):
+    from pdexapi import PDExAPI_Pages as pages
+
+    monkeypatch.setattr(pages, "MAX_BLIND_PAGES", 5)
+    page = lambda p: (json.dumps([{"offset": p.get("offset", 0)}] * 2).encode(), {})
+    it = pages.iter_pages(page({})[0], {}, {}, 2, page, max_in_flight=2)
+    with pytest.raises(RuntimeError):
+        list(it)
@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from pdexapi import CostModel, PDEXClient
+from pdexapi.PDExAPI_Planner import plan_series
+from stub_server import StubPDEXAPI
+
+CATALOG = {f"Estado {e}": [f"Ciudad {e}-{c}" for c in range(10)] for e in range(30)}
+WINDOW = {"nivel": "ciudad", "freq": "D", "fecha_inicio": "2025-01-01", "fecha_fin": "2025-12-31"}
+VARS = ("maxtemp_c", "totalprecip_mm")
+
+
+def test_cost_model_picks_call_shape():
+    model = CostModel(catalog=CATALOG)
+    few = [{"estado": "Estado 0", "ciudad": "Ciudad 0-1", "variable": v} for v in VARS]
+    plan = plan_series("copernicus_historical", few, WINDOW, model)
+    assert len(plan) == 1 and plan.calls[0]["ciudad"] == "Ciudad 0-1"
+    assert plan.calls[0]["variable"] == list(VARS)
+
+    state = [{"estado": "Estado 3", "ciudad": c, "variable": "maxtemp_c"}
+             for c in CATALOG["Estado 3"][:8]]
+    plan = plan_series("copernicus_historical", state, WINDOW, model)
+    assert plan.calls == [{**WINDOW, "estado": "Estado 3", "variable": "maxtemp_c"}]
+
+    sweep = [{"estado": e, "ciudad": c, "variable": v}
+             for e, cs in CATALOG.items() for c in cs for v in VARS]
+    plan = plan_series("copernicus_historical", sweep, WINDOW, model)
+    assert len(plan) == 1 and "estado" not in plan.calls[0] and plan.cost < plan.naive_cost / 50
+
+    with pytest.raises(ValueError):
+        plan_series("copernicus_historical", [{"estado": "Estado 0", "variable": "x"}], WINDOW)
+
+
+def test_fetch_series_matches_individual_calls():
+    series = [{"estado": e, "ciudad": c, "variable": v}
+              for e in ("Estado 1", "Estado 2") for c in CATALOG[e] for v in VARS]
+    series += [{"estado": "Estado 7", "ciudad": "Ciudad 7-4", "variable": "maxtemp_c"}]
+    with StubPDEXAPI() as stub:
+        stub.catalog = CATALOG
+        with PDEXClient(stub.base_url, "demo", "demo") as cli:
+            model = CostModel(catalog=CATALOG)
+            plan = cli.plan_series("copernicus_historical", series, cost_model=model, **WINDOW)
+            dfs = cli.fetch_series("copernicus_historical", series, cost_model=model, **WINDOW)
+            merged_calls = stub.calls("/copernicus_historical")
+            for s, df in zip(series[::7], dfs[::7]):
+                want = cli.copernicus_historical(**WINDOW, **s, as_frame=True)
+                pd.testing.assert_frame_equal(df, want)
+    assert merged_calls == len(plan) == 3  # dos estados completos + una ciudad
+    assert len(dfs) == len(series) and all(len(df) == 365 for df in dfs)
@@ -0,0 +1,73 @@
+import time
+
+import pytest
+import requests
+
+from pdexapi import CircuitBreaker, CircuitOpenError, PDEXClient, RetryPolicy
+from pdexapi.PDExAPI_Retry import RetryRunner
+from stub_server import StubPDEXAPI
+
+FAST = RetryPolicy(retries=3, timeout_retries=1, backoff=0.001)
+
+
+def test_retries_http_errors_and_honors_retry_after():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", retry=FAST) as cli:
+        stub.fail_next("/tables", times=2, status=502)
+        assert cli.list_tables()
+        stub.fail_next("/tables", status=429, retry_after="0.05")
+        assert cli.list_tables()
+        stub.fail_next("/tables", times=4, status=503)
+        with pytest.raises(requests.HTTPError):
+            cli.list_tables()
+        stats = cli.retry_stats()
+    assert stats["retries"] == 2 + 1 + 3
+    assert stats["retry_after_waits"] == 1 and stats["backoff_seconds"] >= 0.05
+    assert stats["gave_up"] == 1
+
+
+def test_timeouts_use_their_own_budget():
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo", retry=FAST) as cli:
+        cli.timeout = 0.2
+        stub.delay_next("/tables", 0.5)
+        assert cli.list_tables()
+        stub.delay_next("/tables", 0.5, times=2)
+        with pytest.raises(requests.Timeout):
+            cli.list_tables()
+        assert cli.retry_stats()["timeout_retries"] == 2
+
+
+def test_breaker_fails_fast_then_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+    with StubPDEXAPI() as stub, PDEXClient(
+        stub.base_url, "demo", "demo", retry=False, breaker=breaker
+    ) as cli:
+        stub.fail_next("/tables", times=2, status=500)
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                cli.list_tables()
+        with pytest.raises(CircuitOpenError):
+            cli.list_tables()
+        assert stub.calls("/tables") == 2 and breaker.state == "open"
+
+        time.sleep(0.25)
+        assert cli.list_tables()  # petición de prueba (half-open) exitosa
+        assert breaker.state == "closed"
+        assert cli.retry_stats()["breaker_trips"] == 1
+
+
+def test_probe_raising_unexpected_error_releases_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    runner = RetryRunner(None, breaker)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    def broken():
+        raise ValueError("fallo local")
+
+    with pytest.raises(ValueError):
+        runner.call(broken)  # la prueba half-open falla sin respuesta del servidor
+    assert breaker.state == "half-open"
+    ok = requests.Response()
+    ok.status_code = 200
+    assert runner.call(lambda: ok) is ok
+    assert breaker.state == "closed"
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pdexapi import PDEXClient, ScenarioSampler
+from pdexapi.PDExAPI_Scenarios import cholesky_factors, clear_factor_cache, forecast_means
+from stub_server import StubPDEXAPI
+
+
+def test_factors_cached_and_non_pd_fallback():
+    clear_factor_cache()
+    good = np.array([[2.0, 0.5], [0.5, 1.0]])
+    bad = np.array([[1.0, 2.0], [2.0, 1.0]])  # eigenvalor negativo
+    L, fallback = cholesky_factors(np.stack([good, bad]))
+    assert fallback.tolist() == [False, True]
+    np.testing.assert_allclose(L[0] @ L[0].T, good)
+    assert np.all(np.linalg.eigvalsh(L[1] @ L[1].T) >= -1e-12)
+    L2, _ = cholesky_factors(good[None])
+    np.testing.assert_array_equal(L2[0], L[0])
+
+
+def test_sampler_moments_seed_and_tidy():
+    cov = np.array([[[1.0, 0.8], [0.8, 1.0]], [[4.0, 0.0], [0.0, 0.25]]])
+    mean = np.array([[10.0, 11.0], [0.0, -1.0]])
+    sampler = ScenarioSampler(cov, keys=["a", "b"])
+    paths = sampler.sample(mean, 20_000, seed=1)
+    assert paths.shape == (2, 20_000, 2)
+    np.testing.assert_array_equal(paths, sampler.sample(mean, 20_000, seed=1))
+    np.testing.assert_allclose(paths.mean(axis=1), mean, atol=0.05)
+    np.testing.assert_allclose(np.cov(paths[0].T), cov[0], atol=0.05)
+
+    tidy = sampler.sample(mean, 3, seed=1, tidy=True)
+    assert len(tidy) == 2 * 3 * 2 and list(tidy.columns) == ["serie", "escenario", "h", "valor"]
+    with pytest.raises(ValueError):
+        sampler.sample(mean[:1], 3)
+
+
+def test_sampler_from_client_outputs():
+    estados = ["Jalisco", "Puebla"]
+    with StubPDEXAPI() as stub, PDEXClient(stub.base_url, "demo", "demo") as cli:
+        S = cli.cov_matrices(fecha_modelo="2025-06-01", forecast_horizon=6,
+                             variable="avgtemp_c", estado=estados)
+        fc = cli.fetch_many("fc_clima_mes_estado", [
+            {"estado": e, "variable": "avgtemp_c", "fecha_inicio": "2025-07-01",
+             "fecha_fin": "2025-12-01"} for e in estados
+        ]).frame()
+    mean, fechas = forecast_means(fc, S.keys, h=6)
+    tidy = ScenarioSampler(S).sample(mean, 100, seed=0, tidy=True, fechas=fechas)
+    assert set(tidy["estado"]) == set(estados) and tidy["fecha"].nunique() == 6
+    assert len(tidy) == 2 * 100 * 6
+
+
+def test_forecast_means_keyed_by_fecha_modelo_and_nacional():
+    fechas = ["2025-07-01", "2025-08-01"]
+    fc = pd.DataFrame({
+        "fecha_modelo": ["2025-05-01"] * 2 + ["2025-06-01"] * 2 + ["2025-06-01"] * 2,
+        "fecha": fechas * 3,
+        "estado": ["Jalisco"] * 4 + ["Nacional"] * 2,
+        "variable": "avgtemp_c",
+        "valor": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+    })
+    keys = [("2025-06-01", "avgtemp_c", "Jalisco"), ("2025-05-01", "avgtemp_c", "Jalisco"),
+            ("2025-06-01", "avgtemp_c", None)]
+    mean, out = forecast_means(fc, keys, h=2)
+    assert mean.tolist() == [[3.0, 4.0], [1.0, 2.0], [5.0, 6.0]] and out == fechas
+    with pytest.raises(ValueError):
+        forecast_means(fc.drop(columns="fecha_modelo"), keys, h=2)
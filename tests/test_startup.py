@@ -0,0 +1,41 @@
+import json
+import os
+import subprocess
+import sys
+
+from stub_server import StubPDEXAPI
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Proceso nuevo: aquí pytest y el stub ya cargaron numpy/pandas/requests
+SCRIPT = """
+import json, sys
+heavy = ("numpy", "pandas", "requests")
+loaded = lambda: sorted(m for m in heavy if m in sys.modules)
+out = {}
+from pdexapi import PDEXClient
+out["import"] = loaded()
+cli = PDEXClient(sys.argv[1], "demo", "demo", memo=True)
+out["client"] = loaded()
+cli.list_tables()
+cli.dias_festivos()
+out["raw"] = loaded()
+cli.dias_festivos(as_frame=True)
+out["frame"] = loaded()
+cli.close()
+print(json.dumps(out))
+"""
+
+
+def test_heavy_dependencies_load_on_demand():
+    with StubPDEXAPI() as stub:
+        proc = subprocess.run(
+            [sys.executable, "-c", SCRIPT, stub.base_url],
+            check=True, capture_output=True, text=True, timeout=60, cwd=ROOT,
+        )
+        logins = stub.calls("/token")
+    out = json.loads(proc.stdout)
+    assert out["import"] == out["client"] == []
+    assert out["raw"] == ["requests"]
+    assert out["frame"] == ["numpy", "pandas", "requests"]
+    assert logins == 1
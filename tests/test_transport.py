@@ -0,0 +1,29 @@
+import pytest
+
+from pdexapi import PDEXClient
+from stub_server import StubPDEXAPI
+
+
+@pytest.fixture
+def stub():
+    with StubPDEXAPI() as s:
+        yield s
+
+
+def test_login_and_gets_share_one_keepalive_connection(stub):
+    with PDEXClient(stub.base_url, "demo", "demo") as cli:
+        for _ in range(5):
+            assert "inflacion" in cli.list_tables()
+        stats = cli.transport_stats()
+
+    assert stats["requests"] == 6  # /token + 5 GET
+    assert stats["connections"] == 1
+    assert stats["reused"] == 5
+    assert stub.connections == 1
+
+
+def test_closed_client_rejects_requests(stub):
+    cli = PDEXClient(stub.base_url, "demo", "demo")
+    cli.close()
+    with pytest.raises(RuntimeError):
+        cli.list_tables()
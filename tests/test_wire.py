@@ -0,0 +1,75 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pdexapi import PDEXClient
+from pdexapi.PDExAPI_Wire import accept, accept_encoding, sniff
+from stub_server import StubPDEXAPI, encode_payload
+
+DIARIO = {"estado": "Jalisco", "ciudad": "Zapopan", "variable": "maxtemp_c",
+          "fecha_inicio": "2024-01-01", "fecha_fin": "2024-12-31"}
+
+
+def test_sniff_and_headers():
+    rows = [{"fecha": "2025-01-01", "valor": 1.5}]
+    assert sniff(json.dumps(rows).encode()) == "json"
+    assert sniff(b"\xef\xbb\xbf[]") == "json"
+    assert accept("json") == "application/json"
+    assert accept_encoding(False) == "identity"
+    assert accept_encoding().startswith(("zstd", "br", "gzip"))
+
+
+def test_compression_is_negotiated_and_transparent():
+    with StubPDEXAPI() as stub:
+        with PDEXClient(stub.base_url, "demo", "demo") as cli:
+            packed = cli.fc_clima_diario(**DIARIO)
+            ep = cli.stats()["endpoints"]["/fc_clima_diario"]
+        with PDEXClient(stub.base_url, "demo", "demo", compression=False) as cli:
+            plain = cli.fc_clima_diario(**DIARIO)
+        served = dict(stub.served)
+    assert packed == plain and len(plain) == 366
+    assert ep["wire_bytes"] < ep["bytes"] / 4
+    assert any(k.endswith(("|zstd", "|br", "|gzip")) for k in served)
+    assert served.get("application/json|identity", 0) >= 1
+
+
+@pytest.mark.parametrize("fmt, module", [("arrow", "pyarrow"), ("msgpack", "msgpack")])
+def test_binary_formats_match_json(fmt, module):
+    pytest.importorskip(module)
+    binary = "application/vnd.apache.arrow.stream" if fmt == "arrow" else "application/msgpack"
+    assert sniff(encode_payload([{"fecha": "2025-01-01", "valor": 1.5}], binary)[0]) == fmt
+    with StubPDEXAPI() as stub:
+        with PDEXClient(stub.base_url, "demo", "demo") as cli:
+            want_rows = cli.fc_clima_diario(**DIARIO)
+            want_cov = cli.cov_matrix(fecha_modelo="2025-06-01", forecast_horizon=4,
+                                      variable="avgtemp_c", as_array=True)
+        with PDEXClient(stub.base_url, "demo", "demo", wire_format=fmt) as cli:
+            rows = cli.fc_clima_diario(**DIARIO)
+            cov = cli.cov_matrix(fecha_modelo="2025-06-01", forecast_horizon=4,
+                                 variable="avgtemp_c", as_array=True)
+            streamed = list(cli.clima_historico(**DIARIO, stream=True))
+        with PDEXClient(stub.base_url, "demo", "demo", wire_format=fmt,
+                        dtype_profile="exact") as cli:
+            df = cli.fc_clima_diario(**{**DIARIO, "ciudad": "Guadalajara"}, as_frame=True)
+        served = dict(stub.served)
+
+    assert rows == want_rows and len(streamed) == 366
+    np.testing.assert_allclose(cov, want_cov)
+    assert pd.api.types.is_datetime64_any_dtype(df["fecha"])
+    assert df["valor"].dtype == np.float64 and len(df) == 366
+    assert sum(n for k, n in served.items() if k.startswith(binary)) >= 2
+
+
+def test_schema_only_with_dtype_profile():
+    pytest.importorskip("msgpack")
+    with StubPDEXAPI() as stub:
+        frames = {}
+        for fmt in ("json", "msgpack"):
+            with PDEXClient(stub.base_url, "demo", "demo", wire_format=fmt) as cli:
+                frames[fmt] = cli.fc_clima_diario(**DIARIO, as_frame=True)
+    # sin perfil, el formato negociado no cambia los dtypes: la fecha queda como texto
+    assert frames["msgpack"]["fecha"].dtype == frames["json"]["fecha"].dtype
+    assert not pd.api.types.is_datetime64_any_dtype(frames["msgpack"]["fecha"])
+    assert not isinstance(frames["msgpack"]["estado"].dtype, pd.CategoricalDtype)